@@ -32,6 +32,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/arima.py'),
                                      'statsforecast.arima.AutoARIMA.summary': ( 'src/arima.html#autoarima.summary',
                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_bfgs': ('src/arima.html#_arima_bfgs', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_gradient': ('src/arima.html#_arima_gradient', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_line_search': ( 'src/arima.html#_arima_line_search',
+                                                                                 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_minimize': ('src/arima.html#_arima_minimize', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._arima_objective': ('src/arima.html#_arima_objective', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._candidates_map': ('src/arima.html#_candidates_map', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._constant_arima': ('src/arima.html#_constant_arima', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._fit_candidate': ('src/arima.html#_fit_candidate', 'statsforecast/arima.py'),
+                                     'statsforecast.arima._get_n_jobs': ('src/arima.html#_get_n_jobs', 'statsforecast/arima.py'),
                                      'statsforecast.arima._make_arima': ('src/arima.html#_make_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima': ('src/arima.html#arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.arima2': ('src/arima.html#arima2', 'statsforecast/arima.py'),
@@ -56,6 +66,7 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.forecast_arima': ('src/arima.html#forecast_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.forward_arima': ('src/arima.html#forward_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.getQ0': ('src/arima.html#getq0', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.getQ0_doubling': ('src/arima.html#getq0_doubling', 'statsforecast/arima.py'),
                                      'statsforecast.arima.inclu2': ('src/arima.html#inclu2', 'statsforecast/arima.py'),
                                      'statsforecast.arima.invpartrans': ('src/arima.html#invpartrans', 'statsforecast/arima.py'),
                                      'statsforecast.arima.is_constant': ('src/arima.html#is_constant', 'statsforecast/arima.py'),
@@ -69,9 +80,11 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.arima.predict_arima': ('src/arima.html#predict_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.print_statsforecast_ARIMA': ( 'src/arima.html#print_statsforecast_arima',
                                                                                         'statsforecast/arima.py'),
+                                     'statsforecast.arima.refit_arima': ('src/arima.html#refit_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.search_arima': ('src/arima.html#search_arima', 'statsforecast/arima.py'),
                                      'statsforecast.arima.seas_heuristic': ('src/arima.html#seas_heuristic', 'statsforecast/arima.py'),
-                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py')},
+                                     'statsforecast.arima.tsconv': ('src/arima.html#tsconv', 'statsforecast/arima.py'),
+                                     'statsforecast.arima.update_arima': ('src/arima.html#update_arima', 'statsforecast/arima.py')},
             'statsforecast.ces': { 'statsforecast.ces._simulate_pred_intervals': ( 'src/ces.html#_simulate_pred_intervals',
                                                                                    'statsforecast/ces.py'),
                                    'statsforecast.ces.auto_ces': ('src/ces.html#auto_ces', 'statsforecast/ces.py'),
@@ -90,7 +103,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                  'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsfcast_C': ('src/ces.html#pegelsfcast_c', 'statsforecast/ces.py'),
                                    'statsforecast.ces.pegelsresid_ces': ('src/ces.html#pegelsresid_ces', 'statsforecast/ces.py'),
-                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py')},
+                                   'statsforecast.ces.switch_ces': ('src/ces.html#switch_ces', 'statsforecast/ces.py'),
+                                   'statsforecast.ces.update_ces': ('src/ces.html#update_ces', 'statsforecast/ces.py')},
             'statsforecast.core': { 'statsforecast.core.DataFrameProcessing': ( 'src/core/core.html#dataframeprocessing',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing.__call__': ( 'src/core/core.html#dataframeprocessing.__call__',
@@ -99,14 +113,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing._check_datetime': ( 'src/core/core.html#dataframeprocessing._check_datetime',
                                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core.DataFrameProcessing._columns': ( 'src/core/core.html#dataframeprocessing._columns',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core.DataFrameProcessing._get_id_and_dates': ( 'src/core/core.html#dataframeprocessing._get_id_and_dates',
+                                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing._partial_val_df': ( 'src/core/core.html#dataframeprocessing._partial_val_df',
                                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core.DataFrameProcessing._sort': ( 'src/core/core.html#dataframeprocessing._sort',
+                                                                                      'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing._to_np_and_engine': ( 'src/core/core.html#dataframeprocessing._to_np_and_engine',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.DataFrameProcessing._to_value_array': ( 'src/core/core.html#dataframeprocessing._to_value_array',
+                                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing._validate_dataframe': ( 'src/core/core.html#dataframeprocessing._validate_dataframe',
                                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core.DataFrameProcessing.grouped_array': ( 'src/core/core.html#dataframeprocessing.grouped_array',
                                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core.DataFrameProcessing.index': ( 'src/core/core.html#dataframeprocessing.index',
+                                                                                      'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray': ('src/core/core.html#groupedarray', 'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.__eq__': ( 'src/core/core.html#groupedarray.__eq__',
                                                                                 'statsforecast/core.py'),
@@ -120,8 +144,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._get_cols': ( 'src/core/core.html#groupedarray._get_cols',
                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._has_exog': ( 'src/core/core.html#groupedarray._has_exog',
+                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray._output_fcst': ( 'src/core/core.html#groupedarray._output_fcst',
                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray._window': ( 'src/core/core.html#groupedarray._window',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.append': ( 'src/core/core.html#groupedarray.append',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.conformity_scores': ( 'src/core/core.html#groupedarray.conformity_scores',
+                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.cross_validation': ( 'src/core/core.html#groupedarray.cross_validation',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.fit': ('src/core/core.html#groupedarray.fit', 'statsforecast/core.py'),
@@ -135,6 +167,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.GroupedArray.split_fm': ( 'src/core/core.html#groupedarray.split_fm',
                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.take': ( 'src/core/core.html#groupedarray.take',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core.GroupedArray.update': ( 'src/core/core.html#groupedarray.update',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend': ('src/core/core.html#parallelbackend', 'statsforecast/core.py'),
                                     'statsforecast.core.ParallelBackend.cross_validation': ( 'src/core/core.html#parallelbackend.cross_validation',
                                                                                              'statsforecast/core.py'),
@@ -147,49 +183,166 @@ d = { 'settings': { 'branch': 'main',
                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core.StatsForecast.forecast': ( 'src/core/core.html#statsforecast.forecast',
                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsPickler': ('src/core/core.html#_columnspickler', 'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsPickler.__init__': ( 'src/core/core.html#_columnspickler.__init__',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsPickler.nbytes': ( 'src/core/core.html#_columnspickler.nbytes',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsPickler.persistent_id': ( 'src/core/core.html#_columnspickler.persistent_id',
+                                                                                          'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsPickler.write': ( 'src/core/core.html#_columnspickler.write',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsUnpickler': ( 'src/core/core.html#_columnsunpickler',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsUnpickler.__init__': ( 'src/core/core.html#_columnsunpickler.__init__',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsUnpickler._column': ( 'src/core/core.html#_columnsunpickler._column',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._ColumnsUnpickler.persistent_load': ( 'src/core/core.html#_columnsunpickler.persistent_load',
+                                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._DiskCache': ('src/core/core.html#_diskcache', 'statsforecast/core.py'),
+                                    'statsforecast.core._DiskCache.__init__': ( 'src/core/core.html#_diskcache.__init__',
+                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._DiskCache._file': ('src/core/core.html#_diskcache._file', 'statsforecast/core.py'),
+                                    'statsforecast.core._DiskCache.evict': ('src/core/core.html#_diskcache.evict', 'statsforecast/core.py'),
+                                    'statsforecast.core._DiskCache.get': ('src/core/core.html#_diskcache.get', 'statsforecast/core.py'),
+                                    'statsforecast.core._DiskCache.set': ('src/core/core.html#_diskcache.set', 'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk': ( 'src/core/core.html#_groupedarraychunk',
+                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.__getstate__': ( 'src/core/core.html#_groupedarraychunk.__getstate__',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.__init__': ( 'src/core/core.html#_groupedarraychunk.__init__',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk._run': ( 'src/core/core.html#_groupedarraychunk._run',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.conformity_scores': ( 'src/core/core.html#_groupedarraychunk.conformity_scores',
+                                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.cross_validation': ( 'src/core/core.html#_groupedarraychunk.cross_validation',
+                                                                                                'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.fit': ( 'src/core/core.html#_groupedarraychunk.fit',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.fit_predict': ( 'src/core/core.html#_groupedarraychunk.fit_predict',
+                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.forecast': ( 'src/core/core.html#_groupedarraychunk.forecast',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.predict': ( 'src/core/core.html#_groupedarraychunk.predict',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.split': ( 'src/core/core.html#_groupedarraychunk.split',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._GroupedArrayChunk.update': ( 'src/core/core.html#_groupedarraychunk.update',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._OutputArray': ('src/core/core.html#_outputarray', 'statsforecast/core.py'),
+                                    'statsforecast.core._OutputArray.__getstate__': ( 'src/core/core.html#_outputarray.__getstate__',
+                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._OutputArray.__init__': ( 'src/core/core.html#_outputarray.__init__',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._OutputArray.allocate': ( 'src/core/core.html#_outputarray.allocate',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._OutputArray.write': ( 'src/core/core.html#_outputarray.write',
+                                                                               'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast': ('src/core/core.html#_statsforecast', 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__enter__': ( 'src/core/core.html#_statsforecast.__enter__',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__exit__': ( 'src/core/core.html#_statsforecast.__exit__',
+                                                                                    'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__getstate__': ( 'src/core/core.html#_statsforecast.__getstate__',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__init__': ( 'src/core/core.html#_statsforecast.__init__',
                                                                                     'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.__repr__': ( 'src/core/core.html#_statsforecast.__repr__',
                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.__setstate__': ( 'src/core/core.html#_statsforecast.__setstate__',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._apply_chunks': ( 'src/core/core.html#_statsforecast._apply_chunks',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._columnar_parts': ( 'src/core/core.html#_statsforecast._columnar_parts',
+                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._conformity_scores_parallel': ( 'src/core/core.html#_statsforecast._conformity_scores_parallel',
+                                                                                                       'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._cross_validation_parallel': ( 'src/core/core.html#_statsforecast._cross_validation_parallel',
                                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._executor': ( 'src/core/core.html#_statsforecast._executor',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._fcsts_output': ( 'src/core/core.html#_statsforecast._fcsts_output',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._fit_ga': ( 'src/core/core.html#_statsforecast._fit_ga',
+                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_parallel': ( 'src/core/core.html#_statsforecast._fit_parallel',
                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._fit_predict_parallel': ( 'src/core/core.html#_statsforecast._fit_predict_parallel',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._fitted_index': ( 'src/core/core.html#_statsforecast._fitted_index',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_cached': ( 'src/core/core.html#_statsforecast._forecast_cached',
+                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_ga': ( 'src/core/core.html#_statsforecast._forecast_ga',
+                                                                                        'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._forecast_iter_parallel': ( 'src/core/core.html#_statsforecast._forecast_iter_parallel',
+                                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._forecast_parallel': ( 'src/core/core.html#_statsforecast._forecast_parallel',
                                                                                               'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_Xs': ( 'src/core/core.html#_statsforecast._get_xs',
+                                                                                   'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_cap_size': ( 'src/core/core.html#_statsforecast._get_cap_size',
                                                                                          'statsforecast/core.py'),
-                                    'statsforecast.core._StatsForecast._get_gas_Xs': ( 'src/core/core.html#_statsforecast._get_gas_xs',
-                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_cs': ( 'src/core/core.html#_statsforecast._get_cs',
+                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._get_init_fm': ( 'src/core/core.html#_statsforecast._get_init_fm',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._get_pool': ( 'src/core/core.html#_statsforecast._get_pool',
                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._load_columnar': ( 'src/core/core.html#_statsforecast._load_columnar',
+                                                                                          'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._make_future_df': ( 'src/core/core.html#_statsforecast._make_future_df',
                                                                                            'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._models_state': ( 'src/core/core.html#_statsforecast._models_state',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._parquet_batches': ( 'src/core/core.html#_statsforecast._parquet_batches',
+                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._parse_X_level': ( 'src/core/core.html#_statsforecast._parse_x_level',
                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._predict_parallel': ( 'src/core/core.html#_statsforecast._predict_parallel',
                                                                                              'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._prepare_fit': ( 'src/core/core.html#_statsforecast._prepare_fit',
                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._run_cached': ( 'src/core/core.html#_statsforecast._run_cached',
+                                                                                       'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._run_parquet': ( 'src/core/core.html#_statsforecast._run_parquet',
+                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._set_prediction_intervals': ( 'src/core/core.html#_statsforecast._set_prediction_intervals',
                                                                                                      'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._split_fm': ( 'src/core/core.html#_statsforecast._split_fm',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._split_ga': ( 'src/core/core.html#_statsforecast._split_ga',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast._update_parallel': ( 'src/core/core.html#_statsforecast._update_parallel',
+                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast._validate_model_names': ( 'src/core/core.html#_statsforecast._validate_model_names',
                                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.calibrate': ( 'src/core/core.html#_statsforecast.calibrate',
+                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.close': ( 'src/core/core.html#_statsforecast.close',
+                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation': ( 'src/core/core.html#_statsforecast.cross_validation',
                                                                                             'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.cross_validation_fitted_values': ( 'src/core/core.html#_statsforecast.cross_validation_fitted_values',
                                                                                                           'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.cross_validation_parquet': ( 'src/core/core.html#_statsforecast.cross_validation_parquet',
+                                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.fit': ( 'src/core/core.html#_statsforecast.fit',
                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.fit_predict': ( 'src/core/core.html#_statsforecast.fit_predict',
                                                                                        'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast': ( 'src/core/core.html#_statsforecast.forecast',
                                                                                     'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_arrays': ( 'src/core/core.html#_statsforecast.forecast_arrays',
+                                                                                           'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.forecast_fitted_values': ( 'src/core/core.html#_statsforecast.forecast_fitted_values',
                                                                                                   'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_iter': ( 'src/core/core.html#_statsforecast.forecast_iter',
+                                                                                         'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.forecast_parquet': ( 'src/core/core.html#_statsforecast.forecast_parquet',
+                                                                                            'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.load': ( 'src/core/core.html#_statsforecast.load',
                                                                                 'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.plot': ( 'src/core/core.html#_statsforecast.plot',
@@ -198,9 +351,33 @@ d = { 'settings': { 'branch': 'main',
                                                                                    'statsforecast/core.py'),
                                     'statsforecast.core._StatsForecast.save': ( 'src/core/core.html#_statsforecast.save',
                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.start': ( 'src/core/core.html#_statsforecast.start',
+                                                                                 'statsforecast/core.py'),
+                                    'statsforecast.core._StatsForecast.update': ( 'src/core/core.html#_statsforecast.update',
+                                                                                  'statsforecast/core.py'),
+                                    'statsforecast.core._check_refit': ('src/core/core.html#_check_refit', 'statsforecast/core.py'),
+                                    'statsforecast.core._cv_conformity_scores': ( 'src/core/core.html#_cv_conformity_scores',
+                                                                                  'statsforecast/core.py'),
                                     'statsforecast.core._cv_dates': ('src/core/core.html#_cv_dates', 'statsforecast/core.py'),
+                                    'statsforecast.core._dates_from_steps': ( 'src/core/core.html#_dates_from_steps',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._factorize_ids': ('src/core/core.html#_factorize_ids', 'statsforecast/core.py'),
+                                    'statsforecast.core._future_dates': ('src/core/core.html#_future_dates', 'statsforecast/core.py'),
+                                    'statsforecast.core._gather_outputs': ('src/core/core.html#_gather_outputs', 'statsforecast/core.py'),
+                                    'statsforecast.core._get_chunk_bounds': ( 'src/core/core.html#_get_chunk_bounds',
+                                                                              'statsforecast/core.py'),
+                                    'statsforecast.core._get_forecast_batch': ( 'src/core/core.html#_get_forecast_batch',
+                                                                                'statsforecast/core.py'),
                                     'statsforecast.core._get_n_jobs': ('src/core/core.html#_get_n_jobs', 'statsforecast/core.py'),
+                                    'statsforecast.core._load_columns': ('src/core/core.html#_load_columns', 'statsforecast/core.py'),
+                                    'statsforecast.core._mapped_file': ('src/core/core.html#_mapped_file', 'statsforecast/core.py'),
+                                    'statsforecast.core._model_cols': ('src/core/core.html#_model_cols', 'statsforecast/core.py'),
+                                    'statsforecast.core._model_state': ('src/core/core.html#_model_state', 'statsforecast/core.py'),
+                                    'statsforecast.core._output_arrays': ('src/core/core.html#_output_arrays', 'statsforecast/core.py'),
                                     'statsforecast.core._parse_ds_type': ('src/core/core.html#_parse_ds_type', 'statsforecast/core.py'),
+                                    'statsforecast.core._series_keys': ('src/core/core.html#_series_keys', 'statsforecast/core.py'),
+                                    'statsforecast.core._with_cs': ('src/core/core.html#_with_cs', 'statsforecast/core.py'),
+                                    'statsforecast.core._write_outputs': ('src/core/core.html#_write_outputs', 'statsforecast/core.py'),
                                     'statsforecast.core.make_backend': ('src/core/core.html#make_backend', 'statsforecast/core.py')},
             'statsforecast.distributed.fugue': { 'statsforecast.distributed.fugue.FugueBackend': ( 'src/core/distributed.fugue.html#fuguebackend',
                                                                                                    'statsforecast/distributed/fugue.py'),
@@ -264,7 +441,8 @@ d = { 'settings': { 'branch': 'main',
                                    'statsforecast.ets.restrict_to_bounds': ('src/ets.html#restrict_to_bounds', 'statsforecast/ets.py'),
                                    'statsforecast.ets.sinpi': ('src/ets.html#sinpi', 'statsforecast/ets.py'),
                                    'statsforecast.ets.switch': ('src/ets.html#switch', 'statsforecast/ets.py'),
-                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py')},
+                                   'statsforecast.ets.update': ('src/ets.html#update', 'statsforecast/ets.py'),
+                                   'statsforecast.ets.update_ets': ('src/ets.html#update_ets', 'statsforecast/ets.py')},
             'statsforecast.garch': { 'statsforecast.garch.garch_cons': ('src/garch.html#garch_cons', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_forecast': ('src/garch.html#garch_forecast', 'statsforecast/garch.py'),
                                      'statsforecast.garch.garch_loglik': ('src/garch.html#garch_loglik', 'statsforecast/garch.py'),
@@ -303,6 +481,7 @@ d = { 'settings': { 'branch': 'main',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ARIMA.predict_in_sample': ( 'src/core/models.html#arima.predict_in_sample',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models.ARIMA.update': ('src/core/models.html#arima.update', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA': ('src/core/models.html#autoarima', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.__init__': ( 'src/core/models.html#autoarima.__init__',
                                                                                    'statsforecast/models.py'),
@@ -318,6 +497,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoARIMA.predict_in_sample': ( 'src/core/models.html#autoarima.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoARIMA.update': ( 'src/core/models.html#autoarima.update',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES': ('src/core/models.html#autoces', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.__init__': ( 'src/core/models.html#autoces.__init__',
                                                                                  'statsforecast/models.py'),
@@ -332,6 +513,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoCES.predict_in_sample': ( 'src/core/models.html#autoces.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoCES.update': ( 'src/core/models.html#autoces.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS': ('src/core/models.html#autoets', 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.__init__': ( 'src/core/models.html#autoets.__init__',
                                                                                  'statsforecast/models.py'),
@@ -346,6 +529,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.AutoETS.predict_in_sample': ( 'src/core/models.html#autoets.predict_in_sample',
                                                                                           'statsforecast/models.py'),
+                                      'statsforecast.models.AutoETS.update': ( 'src/core/models.html#autoets.update',
+                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.AutoRegressive': ( 'src/core/models.html#autoregressive',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models.AutoRegressive.__init__': ( 'src/core/models.html#autoregressive.__init__',
@@ -367,6 +552,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.AutoTheta.predict_in_sample': ( 'src/core/models.html#autotheta.predict_in_sample',
                                                                                             'statsforecast/models.py'),
+                                      'statsforecast.models.AutoTheta.update': ( 'src/core/models.html#autotheta.update',
+                                                                                 'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel': ( 'src/core/models.html#constantmodel',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.ConstantModel.__init__': ( 'src/core/models.html#constantmodel.__init__',
@@ -457,6 +644,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.forecast': ( 'src/core/models.html#historicaverage.forecast',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models.HistoricAverage.forecast_batch': ( 'src/core/models.html#historicaverage.forecast_batch',
+                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.predict': ( 'src/core/models.html#historicaverage.predict',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.HistoricAverage.predict_in_sample': ( 'src/core/models.html#historicaverage.predict_in_sample',
@@ -506,6 +695,8 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models.Naive.fit': ('src/core/models.html#naive.fit', 'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forecast': ( 'src/core/models.html#naive.forecast',
                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.Naive.forecast_batch': ( 'src/core/models.html#naive.forecast_batch',
+                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.Naive.forward': ( 'src/core/models.html#naive.forward',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.Naive.predict': ( 'src/core/models.html#naive.predict',
@@ -526,6 +717,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.forecast': ( 'src/core/models.html#randomwalkwithdrift.forecast',
                                                                                              'statsforecast/models.py'),
+                                      'statsforecast.models.RandomWalkWithDrift.forecast_batch': ( 'src/core/models.html#randomwalkwithdrift.forecast_batch',
+                                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.predict': ( 'src/core/models.html#randomwalkwithdrift.predict',
                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.RandomWalkWithDrift.predict_in_sample': ( 'src/core/models.html#randomwalkwithdrift.predict_in_sample',
@@ -568,6 +761,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.forecast': ( 'src/core/models.html#seasonalnaive.forecast',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalNaive.forecast_batch': ( 'src/core/models.html#seasonalnaive.forecast_batch',
+                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.predict': ( 'src/core/models.html#seasonalnaive.predict',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalNaive.predict_in_sample': ( 'src/core/models.html#seasonalnaive.predict_in_sample',
@@ -582,6 +777,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.forecast': ( 'src/core/models.html#seasonalwindowaverage.forecast',
                                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models.SeasonalWindowAverage.forecast_batch': ( 'src/core/models.html#seasonalwindowaverage.forecast_batch',
+                                                                                                     'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.predict': ( 'src/core/models.html#seasonalwindowaverage.predict',
                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models.SeasonalWindowAverage.predict_in_sample': ( 'src/core/models.html#seasonalwindowaverage.predict_in_sample',
@@ -635,6 +832,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                   'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.forecast': ( 'src/core/models.html#windowaverage.forecast',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models.WindowAverage.forecast_batch': ( 'src/core/models.html#windowaverage.forecast_batch',
+                                                                                             'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.predict': ( 'src/core/models.html#windowaverage.predict',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models.WindowAverage.predict_in_sample': ( 'src/core/models.html#windowaverage.predict_in_sample',
@@ -651,6 +850,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._TS._conformity_scores': ( 'src/core/models.html#_ts._conformity_scores',
                                                                                        'statsforecast/models.py'),
+                                      'statsforecast.models._TS._count_reused_fits': ( 'src/core/models.html#_ts._count_reused_fits',
+                                                                                       'statsforecast/models.py'),
+                                      'statsforecast.models._TS._reused_structure': ( 'src/core/models.html#_ts._reused_structure',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models._TS._store_cs': ( 'src/core/models.html#_ts._store_cs',
                                                                               'statsforecast/models.py'),
                                       'statsforecast.models._TS.new': ('src/core/models.html#_ts.new', 'statsforecast/models.py'),
@@ -670,8 +873,11 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'statsforecast/models.py'),
                                       'statsforecast.models._historic_average': ( 'src/core/models.html#_historic_average',
                                                                                   'statsforecast/models.py'),
+                                      'statsforecast.models._historic_average_batch': ( 'src/core/models.html#_historic_average_batch',
+                                                                                        'statsforecast/models.py'),
                                       'statsforecast.models._imapa': ('src/core/models.html#_imapa', 'statsforecast/models.py'),
                                       'statsforecast.models._intervals': ('src/core/models.html#_intervals', 'statsforecast/models.py'),
+                                      'statsforecast.models._naive_batch': ('src/core/models.html#_naive_batch', 'statsforecast/models.py'),
                                       'statsforecast.models._optimized_ses_forecast': ( 'src/core/models.html#_optimized_ses_forecast',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._predict_mstl_seas': ( 'src/core/models.html#_predict_mstl_seas',
@@ -679,12 +885,18 @@ d = { 'settings': { 'branch': 'main',
                                       'statsforecast.models._probability': ('src/core/models.html#_probability', 'statsforecast/models.py'),
                                       'statsforecast.models._random_walk_with_drift': ( 'src/core/models.html#_random_walk_with_drift',
                                                                                         'statsforecast/models.py'),
+                                      'statsforecast.models._random_walk_with_drift_batch': ( 'src/core/models.html#_random_walk_with_drift_batch',
+                                                                                              'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_exponential_smoothing': ( 'src/core/models.html#_seasonal_exponential_smoothing',
                                                                                                 'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_naive_batch': ( 'src/core/models.html#_seasonal_naive_batch',
+                                                                                      'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_ses_optimized': ( 'src/core/models.html#_seasonal_ses_optimized',
                                                                                         'statsforecast/models.py'),
                                       'statsforecast.models._seasonal_window_average': ( 'src/core/models.html#_seasonal_window_average',
                                                                                          'statsforecast/models.py'),
+                                      'statsforecast.models._seasonal_window_average_batch': ( 'src/core/models.html#_seasonal_window_average_batch',
+                                                                                               'statsforecast/models.py'),
                                       'statsforecast.models._ses': ('src/core/models.html#_ses', 'statsforecast/models.py'),
                                       'statsforecast.models._ses_fcst_mse': ( 'src/core/models.html#_ses_fcst_mse',
                                                                               'statsforecast/models.py'),
@@ -695,7 +907,11 @@ d = { 'settings': { 'branch': 'main',
                                                                                'statsforecast/models.py'),
                                       'statsforecast.models._tsb': ('src/core/models.html#_tsb', 'statsforecast/models.py'),
                                       'statsforecast.models._window_average': ( 'src/core/models.html#_window_average',
-                                                                                'statsforecast/models.py')},
+                                                                                'statsforecast/models.py'),
+                                      'statsforecast.models._window_average_batch': ( 'src/core/models.html#_window_average_batch',
+                                                                                      'statsforecast/models.py'),
+                                      'statsforecast.models._write_batch_output': ( 'src/core/models.html#_write_batch_output',
+                                                                                    'statsforecast/models.py')},
             'statsforecast.mstl': {'statsforecast.mstl.mstl': ('src/mstl.html#mstl', 'statsforecast/mstl.py')},
             'statsforecast.theta': { 'statsforecast.theta.auto_theta': ('src/theta.html#auto_theta', 'statsforecast/theta.py'),
                                      'statsforecast.theta.compute_pi_samples': ( 'src/theta.html#compute_pi_samples',
@@ -717,7 +933,8 @@ d = { 'settings': { 'branch': 'main',
                                      'statsforecast.theta.thetafcst': ('src/theta.html#thetafcst', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetaforecast': ('src/theta.html#thetaforecast', 'statsforecast/theta.py'),
                                      'statsforecast.theta.thetamodel': ('src/theta.html#thetamodel', 'statsforecast/theta.py'),
-                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py')},
+                                     'statsforecast.theta.thetaupdate': ('src/theta.html#thetaupdate', 'statsforecast/theta.py'),
+                                     'statsforecast.theta.update_theta': ('src/theta.html#update_theta', 'statsforecast/theta.py')},
             'statsforecast.utils': { 'statsforecast.utils.ConformalIntervals': ( 'src/utils.html#conformalintervals',
                                                                                  'statsforecast/utils.py'),
                                      'statsforecast.utils.ConformalIntervals.__init__': ( 'src/utils.html#conformalintervals.__init__',
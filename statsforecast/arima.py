@@ -6,8 +6,12 @@ __all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'a
 
 # %% ../nbs/src/arima.ipynb 3
 import math
+import multiprocessing as mp
+import os
+import threading
 import warnings
 from collections import namedtuple
+from contextlib import contextmanager
 from functools import partial
 from typing import Optional, Dict, Union, Tuple
 
@@ -16,6 +20,7 @@ import pandas as pd
 import statsmodels.api as sm
 from numba import njit
 from scipy.optimize import minimize
+from scipy.special import boxcox
 from scipy.stats import norm
 
 from .mstl import mstl
@@ -289,6 +294,31 @@ def getQ0(phi, theta):
 
 # %% ../nbs/src/arima.ipynb 19
 @njit(nogil=NOGIL, cache=CACHE)
+def getQ0_doubling(phi, theta, tol=np.finfo(np.float64).eps):
+    # solves Q0 = T Q0 T' + R R' with the doubling algorithm, which works on r x r
+    # matrices instead of the system of size r(r + 1) / 2 of getQ0
+    p = len(phi)
+    q = len(theta)
+    r = max(p, q + 1)
+    R = np.zeros(r)
+    R[0] = 1.0
+    R[1 : q + 1] = theta
+    Q = np.outer(R, R)
+    A = np.zeros((r, r))
+    A[:p, 0] = phi
+    for i in range(1, r):
+        A[i - 1, i] = 1.0
+    # after k steps Q is the sum of T^i R R' (T^i)' for i < 2^k and A = T^(2^k)
+    for _ in range(64):
+        step = A @ Q @ np.ascontiguousarray(A.T)
+        Q += step
+        if np.abs(step).max() <= tol * np.abs(Q).max():
+            break
+        A = A @ A
+    return Q
+
+# %% ../nbs/src/arima.ipynb 21
+@njit(nogil=NOGIL, cache=CACHE)
 def arima_transpar(params_in, arma, trans):
     # TODO check trans=True results
     mp, mq, msp, msq, ns = arma[:5]
@@ -326,7 +356,7 @@ def arima_transpar(params_in, arma, trans):
 
     return phi, theta
 
-# %% ../nbs/src/arima.ipynb 22
+# %% ../nbs/src/arima.ipynb 24
 @njit(nogil=NOGIL, cache=CACHE)
 def arima_css(y, arma, phi, theta, ncond):
     n = len(y)
@@ -370,9 +400,11 @@ def arima_css(y, arma, phi, theta, ncond):
 
     return res, resid
 
-# %% ../nbs/src/arima.ipynb 24
+# %% ../nbs/src/arima.ipynb 26
 @njit(nogil=NOGIL, cache=CACHE)
-def _make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
+def _make_arima(
+    phi, theta, delta, kappa=1e6, doubling=False, tol=np.finfo(float).eps
+):
     # check nas phi
     # check nas theta
     p = len(phi)
@@ -407,7 +439,7 @@ def _make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
     P = np.zeros((rd, rd))
 
     if r > 1:
-        Pn[:r, :r] = getQ0(phi, theta)
+        Pn[:r, :r] = getQ0_doubling(phi, theta) if doubling else getQ0(phi, theta)
     else:
         Pn[0, 0] = 1 / (1 - phi[0] ** 2) if p > 0 else 1.0
 
@@ -418,14 +450,16 @@ def _make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
     return phi, theta, delta, Z, a, P, T, V, h, Pn
 
 
-def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(np.float64).eps):
+def make_arima(
+    phi, theta, delta, kappa=1e6, SSinit="Gardner1980", tol=np.finfo(np.float64).eps
+):
     keys = ["phi", "theta", "delta", "Z", "a", "P", "T", "V", "h", "Pn"]
-    res = _make_arima(phi, theta, delta, kappa, tol)
+    res = _make_arima(phi, theta, delta, kappa, SSinit == "doubling", tol)
     return dict(zip(keys, res))
 
-# %% ../nbs/src/arima.ipynb 26
+# %% ../nbs/src/arima.ipynb 28
 @njit(nogil=NOGIL, cache=CACHE)
-def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
+def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid, steady_tol=0.0):
     n = len(y)
     rd = len(a)
     p = len(phi)
@@ -447,6 +481,9 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
     if use_resid:
         rsResid = np.empty(n)
 
+    # once the covariance converges the gain is kept for the rest of the series
+    steady = False
+    gain = 0.0
     for l in range(n):
         for i in range(r):
             tmp = a[i + 1] if i < r - 1 else 0.0
@@ -460,7 +497,10 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
             for i in range(d):
                 tmp += delta[i] * a[r + i]
             anew[r] = tmp
-        if l > up:
+        if steady and math.isnan(y[l]):
+            # the missing values need the prediction of the covariance
+            steady = False
+        if l > up and not steady:
             if d == 0:
                 for i in range(r):
                     vi = 0.0
@@ -528,14 +568,15 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
             resid = y[l] - anew[0]
             for i in range(d):
                 resid -= delta[i] * anew[r + i]
-            for i in range(rd):
-                tmp = Pnew[i]
+            if not steady:
+                for i in range(rd):
+                    tmp = Pnew[i]
+                    for j in range(d):
+                        tmp += Pnew[i + (r + j) * rd] * delta[j]
+                    M[i] = tmp
+                gain = M[0]
                 for j in range(d):
-                    tmp += Pnew[i + (r + j) * rd] * delta[j]
-                M[i] = tmp
-            gain = M[0]
-            for j in range(d):
-                gain += delta[j] * M[r + j]
+                    gain += delta[j] * M[r + j]
             if gain < 1e4:
                 nu += 1
                 ssq += resid * resid / gain if gain != 0.0 else math.inf
@@ -544,13 +585,18 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
                 rsResid[l] = resid / math.sqrt(gain) if gain != 0.0 else math.inf
             for i in range(rd):
                 a[i] = anew[i] + M[i] * resid / gain if gain != 0.0 else math.inf
-            for i in range(rd):
-                for j in range(rd):
-                    P[i + j * rd] = (
-                        Pnew[i + j * rd] - M[i] * M[j] / gain
-                        if gain != 0.0
-                        else math.inf
-                    )
+            if not steady:
+                change = 0.0
+                for i in range(rd):
+                    for j in range(rd):
+                        tmp = (
+                            Pnew[i + j * rd] - M[i] * M[j] / gain
+                            if gain != 0.0
+                            else math.inf
+                        )
+                        change = max(change, abs(tmp - P[i + j * rd]))
+                        P[i + j * rd] = tmp
+                steady = 0.0 < gain < 1e4 and change < steady_tol
         else:
             a[:] = anew[:]
             P[:] = Pnew[:]
@@ -560,7 +606,7 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
         rsResid = None
     return ssq, sumlog, nu, rsResid
 
-# %% ../nbs/src/arima.ipynb 28
+# %% ../nbs/src/arima.ipynb 30
 @njit(nogil=NOGIL, cache=CACHE)
 def diff1d(x, lag, differences):
     y = x.copy()
@@ -592,7 +638,174 @@ def diff(x, lag, differences):
         raise ValueError(x.ndim)
     return y[~nan_mask]
 
-# %% ../nbs/src/arima.ipynb 29
+# %% ../nbs/src/arima.ipynb 31
+@njit(nogil=NOGIL, cache=CACHE)
+def _arima_objective(
+    p,
+    x,
+    coef,
+    mask,
+    arma,
+    trans,
+    xreg,
+    delta,
+    a,
+    P,
+    Pn,
+    ncond,
+    ml,
+    steady_tol,
+    doubling,
+):
+    # compiled version of the CSS and ML objectives of `arima`
+    par = coef.copy()
+    par[mask] = p
+    phi, theta = arima_transpar(par, arma, trans)
+    if xreg.shape[1] > 0:
+        x = x - xreg @ par[par.size - xreg.shape[1] :]
+    if not ml:
+        res, _ = arima_css(x, arma, phi, theta, ncond)
+        return 0.5 * np.log(res)
+    # same update of the state space model as upARIMA
+    r = max(phi.size, theta.size + 1)
+    if r > 1:
+        Pn[:r, :r] = getQ0_doubling(phi, theta) if doubling else getQ0(phi, theta)
+    else:
+        Pn[0, 0] = 1 / (1 - phi[0] ** 2) if phi.size > 0 else 1.0
+    a[:] = 0.0
+    ssq, sumlog, nu, _ = arima_like(
+        x, phi, theta, delta, a, P, Pn, 0, False, steady_tol
+    )
+    if nu == 0:
+        return math.inf
+    s2 = ssq / nu
+    if s2 <= 0:
+        return math.nan
+    return 0.5 * (math.log(s2) + sumlog / nu)
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _arima_gradient(p, f, args):
+    # forward differences with the same step as scipy's BFGS
+    eps = 1.4901161193847656e-08
+    g = np.empty(p.size)
+    for i in range(p.size):
+        p_i = p.copy()
+        p_i[i] += eps
+        g[i] = (_arima_objective(p_i, *args) - f) / (p_i[i] - p[i])
+    return g
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _arima_line_search(xk, pk, fk, gk, old_fk, args, c1=1e-4, c2=0.9, maxiter=20):
+    # step that satisfies the strong Wolfe conditions (Nocedal & Wright, algorithms
+    # 3.5 and 3.6), returns a negative step if it doesn't find one
+    derphi0 = gk @ pk
+    if derphi0 >= 0:
+        return -1.0, fk, gk
+    alpha1 = 1.0
+    if derphi0 != 0 and math.isfinite(old_fk):
+        alpha1 = min(1.0, 2.02 * (fk - old_fk) / derphi0)
+        if alpha1 <= 0:
+            alpha1 = 1.0
+    alpha0, phi_a0, derphi_a0 = 0.0, fk, derphi0
+    a_lo, phi_lo, derphi_lo = 0.0, fk, derphi0
+    a_hi, phi_hi = 0.0, fk
+    lo_hi = False
+    for i in range(maxiter):
+        phi_a1 = _arima_objective(xk + alpha1 * pk, *args)
+        if not phi_a1 <= fk + c1 * alpha1 * derphi0 or (phi_a1 >= phi_a0 and i > 0):
+            a_lo, phi_lo, derphi_lo = alpha0, phi_a0, derphi_a0
+            a_hi, phi_hi = alpha1, phi_a1
+            lo_hi = True
+            break
+        g_a1 = _arima_gradient(xk + alpha1 * pk, phi_a1, args)
+        derphi_a1 = g_a1 @ pk
+        if abs(derphi_a1) <= -c2 * derphi0:
+            return alpha1, phi_a1, g_a1
+        if derphi_a1 >= 0:
+            a_lo, phi_lo, derphi_lo = alpha1, phi_a1, derphi_a1
+            a_hi, phi_hi = alpha0, phi_a0
+            lo_hi = True
+            break
+        alpha0, phi_a0, derphi_a0 = alpha1, phi_a1, derphi_a1
+        alpha1 = 2 * alpha1
+    if not lo_hi:
+        return -1.0, fk, gk
+    for _ in range(maxiter):
+        dalpha = a_hi - a_lo
+        # minimizer of the quadratic interpolation, bisection near the ends
+        denom = 2 * (phi_hi - phi_lo - derphi_lo * dalpha)
+        alpha_j = a_lo + 0.5 * dalpha
+        if denom > 0:
+            alpha_q = a_lo - derphi_lo * dalpha * dalpha / denom
+            margin = 0.1 * abs(dalpha)
+            if min(a_lo, a_hi) + margin <= alpha_q <= max(a_lo, a_hi) - margin:
+                alpha_j = alpha_q
+        phi_j = _arima_objective(xk + alpha_j * pk, *args)
+        if not phi_j <= fk + c1 * alpha_j * derphi0 or phi_j >= phi_lo:
+            a_hi, phi_hi = alpha_j, phi_j
+        else:
+            g_j = _arima_gradient(xk + alpha_j * pk, phi_j, args)
+            derphi_j = g_j @ pk
+            if abs(derphi_j) <= -c2 * derphi0:
+                return alpha_j, phi_j, g_j
+            if derphi_j * dalpha >= 0:
+                a_hi, phi_hi = a_lo, phi_lo
+            a_lo, phi_lo, derphi_lo = alpha_j, phi_j, derphi_j
+    return -1.0, fk, gk
+
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _arima_bfgs(x0, args, gtol, maxiter):
+    # BFGS as in scipy.optimize.minimize, the status is 0 on convergence, 1 if it
+    # reached maxiter and 2 if the line search failed
+    n = x0.size
+    eye = np.eye(n)
+    Hk = eye.copy()
+    xk = x0.astype(np.float64)
+    fk = _arima_objective(xk, *args)
+    gk = _arima_gradient(xk, fk, args)
+    old_fk = fk + np.sqrt(gk @ gk) / 2
+    status = 0
+    k = 0
+    gnorm = np.max(np.abs(gk)) if n > 0 else 0.0
+    while gnorm > gtol and k < maxiter:
+        pk = -(Hk @ gk)
+        alpha, f_new, g_new = _arima_line_search(xk, pk, fk, gk, old_fk, args)
+        if alpha < 0:
+            status = 2
+            break
+        sk = alpha * pk
+        xk = xk + sk
+        yk = g_new - gk
+        gk = g_new
+        old_fk = fk
+        fk = f_new
+        k += 1
+        gnorm = np.max(np.abs(gk))
+        if gnorm <= gtol:
+            break
+        if not math.isfinite(fk):
+            status = 2
+            break
+        rhok_inv = yk @ sk
+        rhok = 1000.0 if rhok_inv == 0 else 1 / rhok_inv
+        A1 = eye - rhok * np.outer(sk, yk)
+        A2 = eye - rhok * np.outer(yk, sk)
+        Hk = A1 @ (Hk @ A2) + rhok * np.outer(sk, sk)
+    if status == 0 and k >= maxiter:
+        status = 1
+    return xk, fk, Hk, status
+
+
+def _arima_minimize(p0, args, tol, optim_control):
+    x, fun, hess_inv, status = _arima_bfgs(
+        p0, args, tol, optim_control.get("maxiter", 200 * p0.size)
+    )
+    return OptimResult(status == 0, status, x, fun, hess_inv)
+
+# %% ../nbs/src/arima.ipynb 32
 def fixed_params_from_dict(
     fixed_dict: dict, order: tuple, seasonal: dict, intercept: bool, n_ex: int
 ):
@@ -616,7 +829,7 @@ def fixed_params_from_dict(
     )  # prevent adding non-existing keys
     return list(full_dict.values())
 
-# %% ../nbs/src/arima.ipynb 31
+# %% ../nbs/src/arima.ipynb 34
 def arima(
     x: np.ndarray,
     order=(0, 0, 0),
@@ -632,6 +845,7 @@ def arima(
     kappa=1e6,
     tol=1e-8,
     optim_control={"maxiter": 100},
+    steady_tol=0.0,
 ):
     SSG = SSinit == "Gardner1980"
     x = x.copy()
@@ -647,8 +861,10 @@ def arima(
         if r > 1:
             if SSG:
                 mod["Pn"][:r, :r] = getQ0(phi, theta)
+            elif SSinit == "doubling":
+                mod["Pn"][:r, :r] = getQ0_doubling(phi, theta)
             else:
-                raise NotImplementedError('SSinit != "Gardner1980"')
+                raise NotImplementedError('SSinit not in ("Gardner1980", "doubling")')
                 # mod['Pn'][:r, :r] = getQ0bis(phi, theta, tol=0)
         else:
             mod["Pn"][0, 0] = 1 / (1 - phi**2) if p > 0 else 1
@@ -667,6 +883,7 @@ def arima(
             mod["Pn"],
             0,
             True,
+            steady_tol,
         )
 
     def armafn(p, x, trans):
@@ -689,6 +906,7 @@ def arima(
             Z["Pn"],
             0,
             False,
+            steady_tol,
         )
         if res[2] == 0.0:
             return math.inf
@@ -896,20 +1114,43 @@ def arima(
 
         return 0.5 * np.log(res)
 
+    def optim(p0, ml=False):
+        if optim_method != "BFGS-numba":
+            return minimize(
+                armafn if ml else arma_css_op,
+                p0,
+                args=(x, transform_pars) if ml else (x,),
+                method=optim_method,
+                tol=tol,
+                options=optim_control,
+            )
+        # runs the whole optimization in numba, updates the state space model in place
+        if ml:
+            state = (mod["delta"], mod["a"], mod["P"], mod["Pn"])
+        else:
+            state = (np.zeros(0), np.zeros(0), np.zeros((0, 0)), np.zeros((0, 0)))
+        args = (
+            x.astype(np.float64),
+            coef.astype(np.float64),
+            mask,
+            arma,
+            ml and transform_pars,
+            np.ascontiguousarray(xreg if ncxreg > 0 else np.zeros((n, 0)), np.float64),
+            *state,
+            ncond,
+            ml,
+            steady_tol,
+            SSinit == "doubling",
+        )
+        return _arima_minimize(p0, args, tol, optim_control)
+
     coef = np.array(fixed)
     # parscale definition, think about it, scipy doesn't use it
     if method == "CSS":
         if no_optim:
             res = OptimResult(True, 0, np.array([]), 0.0, np.array([]))
         else:
-            res = minimize(
-                arma_css_op,
-                init[mask],
-                args=(x,),
-                method=optim_method,
-                tol=tol,
-                options=optim_control,
-            )
+            res = optim(init[mask])
 
         if res.status > 0:
             warnings.warn(
@@ -918,7 +1159,7 @@ def arima(
 
         coef[mask] = res.x
         phi, theta = arima_transpar(coef, arma, False)
-        mod = make_arima(phi, theta, Delta, kappa)
+        mod = make_arima(phi, theta, Delta, kappa, SSinit)
         if ncxreg > 0:
             x -= np.dot(xreg, coef[narma + np.arange(ncxreg)])
         val = arima_css(x, arma, phi, theta, ncond)
@@ -929,14 +1170,7 @@ def arima(
             if no_optim:
                 res = OptimResult(True, 0, np.array([]), 0.0, np.array([]))
             else:
-                res = minimize(
-                    arma_css_op,
-                    init[mask],
-                    args=(x,),
-                    method=optim_method,
-                    tol=tol,
-                    options=optim_control,
-                )
+                res = optim(init[mask])
             # if not res.success:
             # warnings.warn(res.message)
             # if res.success:
@@ -967,17 +1201,7 @@ def arima(
                 np.array([]),
             )
         else:
-            res = minimize(
-                armafn,
-                init[mask],
-                args=(
-                    x,
-                    transform_pars,
-                ),
-                method=optim_method,
-                tol=tol,
-                options=optim_control,
-            )
+            res = optim(init[mask], ml=True)
         # if not res.success:
         # warnings.warn(res.message)
         coef[mask] = res.x
@@ -992,14 +1216,7 @@ def arima(
                     coef[ind] = maInvert(coef[ind])
             if any(coef[mask] != res.x):
                 oldcode = res.status
-                res = minimize(
-                    arma_css_op,
-                    coef[mask],
-                    args=(x,),
-                    method=optim_method,
-                    tol=tol,
-                    options=optim_control,
-                )
+                res = optim(coef[mask])
                 res = OptimResult(res.success, oldcode, res.x, res.fun, res.hess_inv)
                 coef[mask] = res.x
             A = arima_gradtrans(coef, arma)
@@ -1059,7 +1276,7 @@ def arima(
     }
     return ans
 
-# %% ../nbs/src/arima.ipynb 39
+# %% ../nbs/src/arima.ipynb 45
 @njit(nogil=NOGIL, cache=CACHE)
 def kalman_forecast(n, Z, a, P, T, V, h):
     p = len(a)
@@ -1101,13 +1318,13 @@ def kalman_forecast(n, Z, a, P, T, V, h):
 
     return forecasts, se
 
-# %% ../nbs/src/arima.ipynb 42
+# %% ../nbs/src/arima.ipynb 48
 def checkarima(obj):
     if obj["var_coef"] is None:
         return False
     return any(np.isnan(np.sqrt(np.diag(obj["var_coef"]))))
 
-# %% ../nbs/src/arima.ipynb 43
+# %% ../nbs/src/arima.ipynb 49
 def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
     myNCOL = lambda x: x.shape[1] if x is not None else 0
     # rsd = model['residuals']
@@ -1165,7 +1382,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     return pred
 
-# %% ../nbs/src/arima.ipynb 47
+# %% ../nbs/src/arima.ipynb 53
 def convert_coef_name(name, inverse=False):
     if not inverse:
         if "ex" in name:
@@ -1187,13 +1404,13 @@ def convert_coef_name(name, inverse=False):
         else:
             return name
 
-# %% ../nbs/src/arima.ipynb 48
+# %% ../nbs/src/arima.ipynb 54
 def change_drift_name(model_coef, inverse=False):
     return {
         convert_coef_name(name, inverse): value for name, value in model_coef.items()
     }
 
-# %% ../nbs/src/arima.ipynb 49
+# %% ../nbs/src/arima.ipynb 55
 def myarima(
     x,
     order=(0, 0, 0),
@@ -1205,6 +1422,9 @@ def myarima(
     offset=0,
     xreg=None,
     method=None,
+    optim_method="BFGS",
+    steady_tol=0.0,
+    SSinit="Gardner1980",
     **kwargs,
 ):
     missing = np.isnan(x)
@@ -1229,17 +1449,51 @@ def myarima(
             else:
                 xreg = drift
             if use_season:
-                fit = arima(x, order, seasonal, xreg, method=method)
+                fit = arima(
+                    x,
+                    order,
+                    seasonal,
+                    xreg,
+                    method=method,
+                    optim_method=optim_method,
+                    steady_tol=steady_tol,
+                    SSinit=SSinit,
+                )
             else:
-                fit = arima(x, order, xreg=xreg, method=method)
+                fit = arima(
+                    x,
+                    order,
+                    xreg=xreg,
+                    method=method,
+                    optim_method=optim_method,
+                    steady_tol=steady_tol,
+                    SSinit=SSinit,
+                )
             fit["coef"] = change_drift_name(fit["coef"])
         else:
             if use_season:
                 fit = arima(
-                    x, order, seasonal, include_mean=constant, method=method, xreg=xreg
+                    x,
+                    order,
+                    seasonal,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    optim_method=optim_method,
+                    steady_tol=steady_tol,
+                    SSinit=SSinit,
                 )
             else:
-                fit = arima(x, order, include_mean=constant, method=method, xreg=xreg)
+                fit = arima(
+                    x,
+                    order,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    optim_method=optim_method,
+                    steady_tol=steady_tol,
+                    SSinit=SSinit,
+                )
         # nxreg = 0 if xreg is None else xreg.shape[1]
         nstar = n - order[1] - seas_order[1] * m
         if diffs == 1 and constant:
@@ -1289,7 +1543,37 @@ def myarima(
         raise e
         return {"ic": math.inf}
 
-# %% ../nbs/src/arima.ipynb 52
+# %% ../nbs/src/arima.ipynb 58
+def _fit_candidate(fit_fn, kwargs):
+    return fit_fn(**kwargs)
+
+
+def _get_n_jobs(n_jobs):
+    # -1 uses all the cores
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}.")
+    return n_jobs
+
+
+@contextmanager
+def _candidates_map(n_jobs):
+    # map over the candidate models of a search, fitted concurrently if n_jobs > 1.
+    # the workers of a process or thread pool (like the ones of StatsForecast) already
+    # search their series concurrently and fit the candidates in order, another pool
+    # would only oversubscribe the cores
+    in_worker = (
+        mp.current_process().daemon
+        or threading.current_thread() is not threading.main_thread()
+    )
+    if n_jobs == 1 or in_worker:
+        yield lambda fn, args: list(map(fn, args))
+        return
+    with mp.Pool(n_jobs) as pool:
+        yield pool.map
+
+
 def search_arima(
     x,
     d=0,
@@ -1308,31 +1592,87 @@ def search_arima(
     allow_drift=True,
     allow_mean=True,
     period=1,
+    method=None,
+    n_jobs=1,
+    screen_tol=None,
+    optim_method="BFGS",
+    steady_tol=0.0,
+    SSinit="Gardner1980",
     **kwargs
 ):
     m = period
     allow_drift = allow_drift and (d + D) == 1
     allow_mean = allow_mean and (d + D) == 0
-    # max_K = allow_drift or allow_mean
-
-    best_ic = np.inf
-    for i in range(max_p + 1):
-        for j in range(max_q + 1):
-            for I in range(max_P + 1):
-                for J in range(max_Q + 1):
-                    if i + j + I + J > max_order:
-                        continue
-                    fit = myarima(
-                        x,
-                        order=(i, d, j),
-                        seasonal={"order": (I, D, J), "period": m},
-                    )
-                    if fit["ic"] < best_ic:
-                        best_ic = fit["ic"]
-                        best_fit = fit
+    if offset is None:
+        offset = 0
+    orders = [
+        ((i, d, j), {"order": (I, D, J), "period": m})
+        for i in range(max_p + 1)
+        for j in range(max_q + 1)
+        for I in range(max_P + 1)
+        for J in range(max_Q + 1)
+        if i + j + I + J <= max_order
+    ]
+    p_myarima = partial(
+        myarima,
+        x=x,
+        optim_method=optim_method,
+        steady_tol=steady_tol,
+        SSinit=SSinit,
+    )
+    if screen_tol is None:
+        candidates = [dict(order=order, seasonal=seasonal) for order, seasonal in orders]
+        with _candidates_map(n_jobs) as fit_map:
+            fits = fit_map(partial(_fit_candidate, p_myarima), candidates)
+        # the first of the best models, as when fitting them in order
+        best_fit = min(fits, key=lambda fit: fit["ic"])
+    else:
+        max_K = int(allow_drift or allow_mean)
+        candidates = [
+            dict(order=order, seasonal=seasonal, constant=bool(K))
+            for order, seasonal in orders
+            for K in range(max_K + 1)
+        ]
+        p_myarima = partial(p_myarima, ic=ic, trace=trace, xreg=xreg)
+        fit_fn = partial(_fit_candidate, partial(p_myarima, method=method))
+        # the information criteria of the CSS fits screen the candidates,
+        # which are fitted by maximum likelihood from the most promising one
+        css_fn = partial(
+            _fit_candidate,
+            partial(p_myarima, approximation=True, offset=offset, method="CSS"),
+        )
+        with _candidates_map(n_jobs) as fit_map:
+            css_ics = np.array([fit["ic"] for fit in fit_map(css_fn, candidates)])
+            screen = np.argsort(css_ics, kind="stable")
+            best_fit = None
+            best_ic = math.inf
+
+            def pruned(i):
+                # nothing is pruned before a model has been fitted
+                if math.isinf(best_ic):
+                    return False
+                return css_ics[i] - screen_tol >= best_ic
+
+            def screened_fits():
+                for start in range(0, len(screen), n_jobs):
+                    batch = screen[start : start + n_jobs]
+                    if pruned(batch[0]):
+                        return
+                    fits = fit_map(fit_fn, [candidates[i] for i in batch])
+                    yield from zip(batch, fits)
+
+            for i, fit in screened_fits():
+                # checked in order, so that the result doesn't depend on n_jobs
+                if pruned(i):
+                    break
+                if fit["ic"] < best_ic:
+                    best_fit = fit
+                    best_ic = fit["ic"]
+    if best_fit is None or math.isinf(best_fit["ic"]):
+        raise ValueError("No suitable ARIMA model found")
     return best_fit
 
-# %% ../nbs/src/arima.ipynb 54
+# %% ../nbs/src/arima.ipynb 60
 def arima2(x, model, xreg, method):
     m = model["arma"][4]  # 5
     use_drift = "drift" in model["coef"].keys()
@@ -1399,7 +1739,7 @@ def arima2(x, model, xreg, method):
         refit["coef"] = change_drift_name(refit["coef"])
     return refit
 
-# %% ../nbs/src/arima.ipynb 55
+# %% ../nbs/src/arima.ipynb 61
 def Arima(
     x,
     order=(0, 0, 0),
@@ -1493,7 +1833,7 @@ def Arima(
         tmp["sigma2"] = np.nansum(tmp["residuals"] ** 2) / (nstar - npar + 1)
     return tmp
 
-# %% ../nbs/src/arima.ipynb 63
+# %% ../nbs/src/arima.ipynb 69
 def arima_string(model, padding=False):
     order = tuple(model["arma"][i] for i in [0, 5, 1, 2, 6, 3, 4])
     m = order[6]
@@ -1523,11 +1863,11 @@ def arima_string(model, padding=False):
 
     return result
 
-# %% ../nbs/src/arima.ipynb 66
+# %% ../nbs/src/arima.ipynb 72
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/src/arima.ipynb 67
+# %% ../nbs/src/arima.ipynb 73
 def forecast_arima(
     model,
     h=None,
@@ -1622,7 +1962,7 @@ def forecast_arima(
 
     return ans
 
-# %% ../nbs/src/arima.ipynb 74
+# %% ../nbs/src/arima.ipynb 80
 def fitted_arima(model, h=1):
     """Returns h-step forecasts for the data used in fitting the model."""
     if h == 1:
@@ -1638,7 +1978,7 @@ def fitted_arima(model, h=1):
     else:
         raise NotImplementedError("h > 1")
 
-# %% ../nbs/src/arima.ipynb 79
+# %% ../nbs/src/arima.ipynb 85
 def seas_heuristic(x, period):
     # nperiods = period > 1
     season = math.nan
@@ -1650,7 +1990,7 @@ def seas_heuristic(x, period):
         season = max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
     return season
 
-# %% ../nbs/src/arima.ipynb 81
+# %% ../nbs/src/arima.ipynb 87
 def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
     D = 0
     if alpha < 0.01:
@@ -1713,7 +2053,7 @@ def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
             dodiff = False
     return D
 
-# %% ../nbs/src/arima.ipynb 83
+# %% ../nbs/src/arima.ipynb 89
 def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
     x = x[~np.isnan(x)]
     d = 0
@@ -1758,13 +2098,61 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             return d - 1
     return d
 
-# %% ../nbs/src/arima.ipynb 85
+# %% ../nbs/src/arima.ipynb 91
 def newmodel(p, d, q, P, D, Q, constant, results):
     curr = np.array([p, d, q, P, D, Q, constant])
     in_results = (curr == results[:, :7]).all(1).any()
     return not in_results
 
-# %% ../nbs/src/arima.ipynb 87
+
+# %% ../nbs/src/arima.ipynb 93
+def _constant_arima(x, dx, d, D, m, xreg, method):
+    # model of a series whose differences are constant
+    if xreg is None:
+        if D > 0 and d == 0:
+            fit = Arima(
+                x,
+                order=(0, d, 0),
+                seasonal={"order": (0, D, 0), "period": m},
+                include_constant=True,
+                fixed=np.array([np.mean(dx / m)]),
+                method=method,
+            )
+        elif D > 0 and d > 0:
+            fit = Arima(
+                x,
+                order=(0, d, 0),
+                seasonal={"order": (0, D, 0), "period": m},
+                method=method,
+            )
+        elif d == 2:
+            fit = Arima(x, order=(0, d, 0), method=method)
+        elif d < 2:
+            fit = Arima(
+                x,
+                order=(0, d, 0),
+                include_constant=True,
+                fixed=np.array([np.mean(dx)]),
+                method=method,
+            )
+        else:
+            raise ValueError(
+                "Data follow a simple polynomial and are not suitable for ARIMA modelling."
+            )
+    else:
+        if D > 0:
+            fit = Arima(
+                x,
+                order=(0, d, 0),
+                seasonal={"order": (0, D, 0), "period": m},
+                xreg=xreg,
+                method=method,
+            )
+        else:
+            fit = Arima(x, order=(0, d, 0), xreg=xreg, method=method)
+    return fit
+
+
 def auto_arima_f(
     x,
     d=None,
@@ -1799,9 +2187,15 @@ def auto_arima_f(
     blambda=None,
     biasadj=False,
     period=1,
+    n_jobs=1,
+    screen_tol=None,
+    optim_method="BFGS",
+    steady_tol=0.0,
+    SSinit="Gardner1980",
 ):
     if approximation is None:
         approximation = len(x) > 150 or period > 12
+    n_jobs = _get_n_jobs(n_jobs)
     if x.ndim > 1:
         raise ValueError("auto_arima can only handle univariate time series")
     if test_kwargs is None:
@@ -1914,48 +2308,7 @@ def auto_arima_f(
     if len(dx) == 0:
         raise ValueError("not enough data to proceed")
     elif is_constant(dx):
-        if xreg is None:
-            if D > 0 and d == 0:
-                fit = Arima(
-                    x,
-                    order=(0, d, 0),
-                    seasonal={"order": (0, D, 0), "period": m},
-                    include_constant=True,
-                    fixed=np.array([np.mean(dx / m)]),
-                    method=method,
-                )
-            elif D > 0 and d > 0:
-                fit = Arima(
-                    x,
-                    order=(0, d, 0),
-                    seasonal={"order": (0, D, 0), "period": m},
-                    method=method,
-                )
-            elif d == 2:
-                fit = Arima(x, order=(0, d, 0), method=method)
-            elif d < 2:
-                fit = Arima(
-                    x,
-                    order=(0, d, 0),
-                    include_constant=True,
-                    fixed=np.array([np.mean(dx)]),
-                    method=method,
-                )
-            else:
-                raise ValueError(
-                    "Data follow a simple polynomial and are not suitable for ARIMA modelling."
-                )
-        else:
-            if D > 0:
-                fit = Arima(
-                    x,
-                    order=(0, d, 0),
-                    seasonal={"order": (0, D, 0), "period": m},
-                    xreg=xreg,
-                    method=method,
-                )
-            else:
-                fit = Arima(x, order=(0, d, 0), xreg=xreg, method=method)
+        fit = _constant_arima(x, dx, d, D, m, xreg, method)
         fit["x"] = origx
         return fit
     if m > 1:
@@ -1963,10 +2316,11 @@ def auto_arima_f(
             max_p = min(max_p, m - 1)
         if max_q > 0:
             max_q = min(max_q, m - 1)
-    if approximation:
-        if truncate is not None:
-            if len(x) > truncate:
-                x = x[-truncate:]
+    if approximation and truncate is not None:
+        if len(x) > truncate:
+            x = x[-truncate:]
+    # offset that puts the information criteria of the CSS fits on the scale of ML
+    if approximation or (not stepwise and screen_tol is not None):
         try:
             if D == 0:
                 fit = arima(x, order=(0, d, 0), xreg=xreg)
@@ -2004,9 +2358,14 @@ def auto_arima_f(
             method=method,
             xreg=xreg,
             offset=offset,
-            allowdrift=allowdrift,
-            allowmean=allowmean,
+            allow_drift=allowdrift,
+            allow_mean=allowmean,
             period=m,
+            n_jobs=n_jobs,
+            screen_tol=screen_tol,
+            optim_method=optim_method,
+            steady_tol=steady_tol,
+            SSinit=SSinit,
         )
         bestfit["lambda"] = blambda
         bestfit["x"] = origx
@@ -2033,266 +2392,122 @@ def auto_arima_f(
         offset=offset,
         xreg=xreg,
         method=method,
+        optim_method=optim_method,
+        steady_tol=steady_tol,
+        SSinit=SSinit,
     )
-    bestfit = p_myarima(
-        order=(p, d, q),
-        seasonal={"order": (P, D, Q), "period": m},
-    )
-    results[0] = (p, d, q, P, D, Q, constant, bestfit["ic"])
-    fit = p_myarima(
-        order=(0, d, 0),
-        seasonal={"order": (0, D, 0), "period": m},
-    )
-    results[1] = (0, d, 0, 0, D, 0, constant, fit["ic"])
-    if fit["ic"] < bestfit["ic"]:
-        bestfit = fit
-        p = q = P = Q = 0
-    k = 1
-    if max_p > 0 or max_P > 0:
-        p_ = int(max_p > 0)
-        P_ = int(m > 1 and max_P > 0)
-        fit = p_myarima(
-            order=(p_, d, 0),
-            seasonal={"order": (P_, D, 0), "period": m},
+
+    def candidate(p, q, P, Q, **kwargs):
+        return dict(
+            order=(p, d, q), seasonal={"order": (P, D, Q), "period": m}, **kwargs
         )
-        results[k + 1] = (p_, d, 0, P_, D, 0, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = p_
-            P = P_
-            q = Q = 0
-        k += 1
+
+    def neighbours(p, q, P, Q, constant):
+        # models tried in each step of the search, in order
+        moves = [
+            (P > 0, (p, q, P - 1, Q, constant)),
+            (Q > 0, (p, q, P, Q - 1, constant)),
+            (P < max_P, (p, q, P + 1, Q, constant)),
+            (Q < max_Q, (p, q, P, Q + 1, constant)),
+            (Q > 0 and P > 0, (p, q, P - 1, Q - 1, constant)),
+            (Q < max_Q and P > 0, (p, q, P - 1, Q + 1, constant)),
+            (Q > 0 and P < max_P, (p, q, P + 1, Q - 1, constant)),
+            (Q < max_Q and P < max_P, (p, q, P + 1, Q + 1, constant)),
+            (p > 0, (p - 1, q, P, Q, constant)),
+            (q > 0, (p, q - 1, P, Q, constant)),
+            (p < max_p, (p + 1, q, P, Q, constant)),
+            (q < max_q, (p, q + 1, P, Q, constant)),
+            (q > 0 and p > 0, (p - 1, q - 1, P, Q, constant)),
+            (q < max_q and p > 0, (p - 1, q + 1, P, Q, constant)),
+            (q > 0 and p < max_p, (p + 1, q - 1, P, Q, constant)),
+            (q < max_q and p < max_p, (p + 1, q + 1, P, Q, constant)),
+            (allowdrift or allowmean, (p, q, P, Q, not constant)),
+        ]
+        return [
+            (p_, q_, P_, Q_, c)
+            for valid, (p_, q_, P_, Q_, c) in moves
+            if valid and newmodel(p_, d, q_, P_, D, Q_, c, results[:k])
+        ]
+
+    # the initial models don't depend on each other, so they're fitted together
+    initial = [(p, q, P, Q, constant), (0, 0, 0, 0, constant)]
+    if max_p > 0 or max_P > 0:
+        initial.append((int(max_p > 0), 0, int(m > 1 and max_P > 0), 0, constant))
     if max_q > 0 or max_Q > 0:
-        q_ = int(max_q > 0)
-        Q_ = int(m > 1 and max_Q > 0)
-        fit = p_myarima(
-            order=(0, d, q_),
-            seasonal={"order": (0, D, Q_), "period": m},
-        )
-        results[k + 1] = (0, d, q_, 0, D, Q_, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = P = 0
-            Q = Q_
-            q = q_
-        k += 1
+        initial.append((0, int(max_q > 0), 0, int(m > 1 and max_Q > 0), constant))
     if constant:
-        fit = p_myarima(
-            order=(0, d, 0),
-            seasonal={"order": (0, D, 0), "period": m},
-            constant=False,
+        initial.append((0, 0, 0, 0, False))
+    fit_fn = partial(_fit_candidate, p_myarima)
+    with _candidates_map(n_jobs) as fit_map:
+        fits = fit_map(
+            fit_fn,
+            [candidate(p_, q_, P_, Q_, constant=c) for p_, q_, P_, Q_, c in initial],
         )
-        results[k + 1] = (0, d, 0, 0, D, 0, 0, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = q = P = Q = 0
-        k += 1
-
-    def try_params(p, d, q, P, D, Q, constant, k, bestfit):
-        k += 1
-        improved = False
-        if k >= results.shape[0]:
-            return k, bestfit, improved
-        fit = p_myarima(
-            order=(p, d, q),
-            seasonal={"order": (P, D, Q), "period": m},
-        )
-        results[k] = (p, d, q, P, D, Q, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            improved = True
-        return k, bestfit, improved
-
-    startk = 0
-    while startk < k and k < nmodels:
-        startk = k
-        if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                continue
-        if Q > 0 and newmodel(p, d, q, P, D, Q - 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                Q -= 1
-                continue
-        if P < max_P and newmodel(p, d, q, P + 1, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                continue
-        if Q < max_Q and newmodel(p, d, q, P, D, Q + 1, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P > 0
-            and newmodel(p, d, q, P - 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P - 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P -= 1
-                Q += 1
-                continue
-        if (
-            Q > 0
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q - 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q - 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q -= 1
-                continue
-        if (
-            Q < max_Q
-            and P < max_P
-            and newmodel(p, d, q, P + 1, D, Q + 1, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P + 1, D, Q + 1, constant, k, bestfit
-            )
-            if improved:
-                P += 1
-                Q += 1
-                continue
-        if p > 0 and newmodel(p - 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p - 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                continue
-        if q > 0 and newmodel(p, d, q - 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q -= 1
-                continue
-        if p < max_p and newmodel(p + 1, d, q, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p + 1, d, q, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                continue
-        if q < max_q and newmodel(p, d, q + 1, P, D, Q, constant, results[:k]):
-            k, bestfit, improved = try_params(
-                p, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                q += 1
-                continue
-        if (
-            q > 0
-            and p > 0
-            and newmodel(p - 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p > 0
-            and newmodel(p - 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p - 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p -= 1
-                q += 1
-                continue
-        if (
-            q > 0
-            and p < max_p
-            and newmodel(p + 1, d, q - 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q - 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q -= 1
-                continue
-        if (
-            q < max_q
-            and p < max_p
-            and newmodel(p + 1, d, q + 1, P, D, Q, constant, results[:k])
-        ):
-            k, bestfit, improved = try_params(
-                p + 1, d, q + 1, P, D, Q, constant, k, bestfit
-            )
-            if improved:
-                p += 1
-                q += 1
-                continue
-        if (allowdrift or allowmean) and newmodel(
-            p, d, q, P, D, Q, not constant, results[:k]
-        ):
-            k, bestfit, improved = try_params(
-                p, d, q, P, D, Q, not constant, k, bestfit
+        bestfit = fits[0]
+        for k, ((p_, q_, P_, Q_, c), fit) in enumerate(zip(initial, fits)):
+            results[k] = (p_, d, q_, P_, D, Q_, c, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p, q, P, Q = p_, q_, P_, Q_
+
+        startk = 0
+        while startk < k and k < nmodels:
+            startk = k
+            candidates = neighbours(p, q, P, Q, constant)
+            # the candidates are fitted in batches of n_jobs and the first one that
+            # improves the best model is kept, which gives the same search as n_jobs=1
+            for start in range(0, len(candidates), n_jobs):
+                batch = candidates[start : start + n_jobs]
+                n_fit = max(min(len(batch), nmodels - 1 - k), 0)
+                fits = fit_map(fit_fn, [candidate(*c[:4]) for c in batch[:n_fit]])
+                improved = False
+                for (p_, q_, P_, Q_, c), fit in zip(batch, fits):
+                    k += 1
+                    results[k] = (p_, d, q_, P_, D, Q_, c, fit["ic"])
+                    if fit["ic"] < bestfit["ic"]:
+                        bestfit = fit
+                        p, q, P, Q, constant = p_, q_, P_, Q_, c
+                        improved = True
+                        break
+                if improved:
+                    break
+                if n_fit < len(batch):
+                    # the models past the limit aren't fitted
+                    k += len(batch) - n_fit
+                    break
+        if k >= nmodels:
+            warnings.warn(
+                f"Stepwise search was stopped early due to reaching the model number limit: nmodels={nmodels}"
             )
-            if improved:
-                constant = not constant
-                continue
-    if k >= nmodels:
-        warnings.warn(
-            f"Stepwise search was stopped early due to reaching the model number limit: nmodels={nmodels}"
-        )
-    if approximation or bestfit["arma"] is not None:
-        if trace:
-            print("Now re-fitting the best model(s) without approximations...\n")
-        icorder = np.argsort(results[:, 7])
-        nmodels = np.sum(~np.isnan(results[:, 7]))
-        for i in range(nmodels):
-            k = icorder[i]
-            p, q, P, Q, constant = map(int, results[k, [0, 2, 3, 5, 6]])
-            fit = myarima(
-                x,
-                (p, d, q),
-                {"order": (P, D, Q), "period": m},
-                constant=results[k, 6],
-                ic=ic,
-                trace=trace,
-                approximation=False,
-                method=method,
-                xreg=xreg,
+        if approximation or bestfit["arma"] is not None:
+            if trace:
+                print("Now re-fitting the best model(s) without approximations...\n")
+            icorder = np.argsort(results[:, 7])
+            nmodels = np.sum(~np.isnan(results[:, 7]))
+            refit_fn = partial(
+                _fit_candidate,
+                partial(
+                    myarima,
+                    x=x,
+                    ic=ic,
+                    trace=trace,
+                    approximation=False,
+                    method=method,
+                    xreg=xreg,
+                    optim_method=optim_method,
+                    steady_tol=steady_tol,
+                    SSinit=SSinit,
+                ),
             )
-            if fit["ic"] < math.inf:
-                bestfit = fit
-                break
+            for start in range(0, nmodels, n_jobs):
+                batch = []
+                for k in icorder[start : min(start + n_jobs, nmodels)]:
+                    p, q, P, Q = map(int, results[k, [0, 2, 3, 5]])
+                    batch.append(candidate(p, q, P, Q, constant=results[k, 6]))
+                fits = [fit for fit in fit_map(refit_fn, batch) if fit["ic"] < math.inf]
+                if fits:
+                    bestfit = fits[0]
+                    break
     if math.isinf(bestfit["ic"]) and method != "CSS":
         raise ValueError("No suitable ARIMA model found")
 
@@ -2302,11 +2517,104 @@ def auto_arima_f(
 
     return bestfit
 
-# %% ../nbs/src/arima.ipynb 89
+# %% ../nbs/src/arima.ipynb 95
 def forward_arima(fitted_model, y, xreg=None, method="CSS-ML"):
     return Arima(x=y, model=fitted_model, xreg=xreg, method=method)
 
-# %% ../nbs/src/arima.ipynb 98
+# %% ../nbs/src/arima.ipynb 106
+def update_arima(fitted_model, y, xreg=None):
+    """Run the Kalman filter of a fitted model over the new observations `y` keeping its coefficients."""
+    x = fitted_model["x"]
+    narma = sum(fitted_model["arma"][:4])
+    coefs = np.array(list(fitted_model["coef"].values()))
+    if "drift" in fitted_model["coef"]:
+        drift = np.arange(x.size + 1, x.size + y.size + 1, dtype=np.float64).reshape(
+            -1, 1
+        )
+        xreg = drift if xreg is None else np.concatenate([drift, xreg], axis=1)
+    if fitted_model["xreg"] is not None:
+        if xreg is None:
+            raise Exception("No regressors provided")
+        if xreg.shape[1] != fitted_model["xreg"].shape[1]:
+            raise Exception("Number of regressors does not match fitted model")
+    blambda = fitted_model["lambda"]
+    # the filter runs on the scale of the fit, as `Arima` does with the lambda of its model
+    z = y if blambda is None else boxcox(y, blambda)
+    x_reg = z.astype(np.float64)
+    if coefs.size > narma:
+        newxreg = xreg
+        if "intercept" in fitted_model["coef"]:
+            intercept = np.ones((y.size, 1), dtype=np.float64)
+            newxreg = (
+                intercept if xreg is None else np.concatenate([intercept, xreg], axis=1)
+            )
+        x_reg = x_reg - newxreg @ coefs[narma:]
+    mod = {
+        **fitted_model["model"],
+        "a": fitted_model["model"]["a"].copy(),
+        "P": fitted_model["model"]["P"].copy(),
+        "Pn": fitted_model["model"]["Pn"].copy(),
+    }
+    # up=-1 propagates the filtered covariance from the first new observation
+    _, _, _, resid = arima_like(
+        x_reg,
+        mod["phi"],
+        mod["theta"],
+        mod["delta"],
+        mod["a"],
+        mod["P"],
+        mod["Pn"],
+        -1,
+        True,
+    )
+    updated = {
+        **fitted_model,
+        "model": mod,
+        "x": np.append(x, y),
+        "residuals": np.append(fitted_model["residuals"], resid),
+    }
+    if fitted_model["xreg"] is not None:
+        updated["xreg"] = np.vstack([fitted_model["xreg"], xreg])
+    return updated
+
+
+def refit_arima(
+    fitted_model,
+    y,
+    xreg=None,
+    method=None,
+    optim_method="BFGS",
+    steady_tol=0.0,
+    SSinit="Gardner1980",
+):
+    """Estimate the coefficients of the orders and constant of a fitted model on `y` skipping their selection."""
+    p, q, P, Q, m, d, D = fitted_model["arma"]
+    constant = "intercept" in fitted_model["coef"] or "drift" in fitted_model["coef"]
+    dx = diff(y, m, D) if D > 0 else y
+    if d > 0:
+        dx = diff(dx, 1, d)
+    if is_constant(dx):
+        fit = _constant_arima(y, dx, d, D, m, xreg, method)
+        fit["x"] = y
+        fit["lambda"] = fitted_model["lambda"]
+        return fit
+    fit = myarima(
+        y,
+        order=(p, d, q),
+        seasonal={"order": (P, D, Q), "period": m},
+        constant=constant,
+        approximation=False,
+        method=method,
+        xreg=xreg,
+        optim_method=optim_method,
+        steady_tol=steady_tol,
+        SSinit=SSinit,
+    )
+    fit["x"] = y
+    fit["lambda"] = fitted_model["lambda"]
+    return fit
+
+# %% ../nbs/src/arima.ipynb 109
 def print_statsforecast_ARIMA(model, digits=3, se=True):
     print(arima_string(model, padding=False))
     if model["lambda"] is not None:
@@ -2336,7 +2644,7 @@ def print_statsforecast_ARIMA(model, digits=3, se=True):
     if not np.isnan(model["aic"]):
         print(f'AIC={round(model["aic"], 2)}')
 
-# %% ../nbs/src/arima.ipynb 100
+# %% ../nbs/src/arima.ipynb 111
 class ARIMASummary:
     """ARIMA Summary."""
 
@@ -2349,7 +2657,7 @@ class ARIMASummary:
     def summary(self):
         return print_statsforecast_ARIMA(self.model)
 
-# %% ../nbs/src/arima.ipynb 101
+# %% ../nbs/src/arima.ipynb 112
 class AutoARIMA:
     """An AutoARIMA estimator.
 
@@ -2455,6 +2763,31 @@ class AutoARIMA:
     period: int (default 1)
         Number of observations per unit of time.
         For example 24 for Hourly data.
+    n_jobs: int (default 1)
+        Number of candidate models fitted concurrently in the search,
+        -1 uses all the cores. The selected model doesn't depend on it. A pool is
+        started by each search, so it's meant for a few long series, it's ignored
+        when the search runs in the workers of a pool.
+    screen_tol: float optional (default None)
+        If not None, the search over all models first fits them by
+        conditional sums of squares and only fits by maximum likelihood
+        the ones whose approximated information criterion is less than
+        screen_tol above the best fitted one.
+    optim_method: str (default 'BFGS')
+        Method of scipy.optimize.minimize used to estimate the
+        coefficients of each model, 'BFGS-numba' runs a compiled
+        BFGS instead, so that a fit doesn't leave numba.
+    steady_tol: float (default 0.0)
+        Change of the state covariance of the Kalman filter under
+        which its gain is kept for the rest of the series, which
+        turns the likelihood into a simple recursion.
+        0 always updates the covariance.
+    SSinit: str (default 'Gardner1980')
+        Method used to compute the initial covariance of the state,
+        'doubling' solves its Lyapunov equation with the doubling
+        algorithm, which is much faster and uses much less memory
+        for long seasonal periods. It is also more accurate, so its
+        fits will not match the 'Gardner1980' ones exactly.
 
     Notes
     -----
@@ -2498,6 +2831,11 @@ class AutoARIMA:
         blambda: Optional[float] = None,
         biasadj: bool = False,
         period: int = 1,
+        n_jobs: int = 1,
+        screen_tol: Optional[float] = None,
+        optim_method: str = "BFGS",
+        steady_tol: float = 0.0,
+        SSinit: str = "Gardner1980",
     ):
         self.d = d
         self.D = D
@@ -2530,6 +2868,11 @@ class AutoARIMA:
         self.blambda = blambda
         self.biasadj = biasadj
         self.period = period
+        self.n_jobs = n_jobs
+        self.screen_tol = screen_tol
+        self.optim_method = optim_method
+        self.steady_tol = steady_tol
+        self.SSinit = SSinit
 
     def fit(self, y: np.ndarray, X: Optional[np.ndarray] = None):
         """Fit the AutoARIMA estimator
@@ -2578,6 +2921,11 @@ class AutoARIMA:
             blambda=self.blambda,
             biasadj=self.biasadj,
             period=self.period,
+            n_jobs=self.n_jobs,
+            screen_tol=self.screen_tol,
+            optim_method=self.optim_method,
+            steady_tol=self.steady_tol,
+            SSinit=self.SSinit,
         )
         self.model_ = ARIMASummary(model_)
 
@@ -5,7 +5,7 @@ __all__ = ['ces_target_fn']
 
 # %% ../nbs/src/ces.ipynb 1
 import math
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 from numba import njit
@@ -573,6 +573,7 @@ def cesmodel(
     beta_0: float,
     beta_1: float,
     nmse: int,
+    init_par: Optional[Dict] = None,
 ):
     if seasontype == "N":
         m = 1
@@ -588,6 +589,10 @@ def cesmodel(
         key.replace("optimize_", ""): val for key, val in par.items() if "optim" in key
     }
     par = {key: val for key, val in par.items() if "optim" not in key}
+    if init_par is not None:
+        # start the optimization from the parameters of a previous
+        # fit of the same model instead of the initial heuristics
+        par.update({key: init_par[key] for key, val in optimize_params.items() if val})
     # initial states
     init_state = initstate(y, m, seasontype)
     n_components = init_state.shape[1]
@@ -729,6 +734,7 @@ def auto_ces(
     opt_crit="lik",
     nmse=3,
     ic="aicc",
+    init_model=None,
 ):
     # converting params to floats
     # to improve numba compilation
@@ -763,6 +769,15 @@ def auto_ces(
         seasontype = ["N", "S", "P", "F"]
     best_ic = np.inf
     for stype in seasontype:
+        if (
+            init_model is not None
+            and init_model["seasontype"] == stype
+            and (stype == "N" or init_model["m"] == m)
+        ):
+            # warm start from the previous fit of the same model
+            init_par = init_model["par"]
+        else:
+            init_par = None
         fit = cesmodel(
             y=y,
             m=m,
@@ -772,6 +787,7 @@ def auto_ces(
             beta_0=beta_0,
             beta_1=beta_1,
             nmse=nmse,
+            init_par=init_par,
         )
         fit_ic = fit[ic]
         if not np.isnan(fit_ic):
@@ -799,3 +815,32 @@ def forward_ces(fitted_model, y):
         beta_0=beta_0,
         beta_1=beta_1,
     )
+
+# %% ../nbs/src/ces.ipynb 39
+def update_ces(fitted_model, y):
+    """Advance the states of a fitted model over the new observations `y` keeping its parameters."""
+    m = fitted_model["m"]
+    n = fitted_model["n"]
+    old_states = fitted_model["states"]
+    states = np.zeros((len(y) + 2 * m, old_states.shape[1]), dtype=np.float32)
+    states[:m] = old_states[n : n + m]
+    e = np.full_like(y, fill_value=np.nan)
+    amse = np.full(1, fill_value=np.nan)
+    cescalc(
+        y=y,
+        states=states,
+        m=m,
+        season=switch_ces(fitted_model["seasontype"]),
+        e=e,
+        amse=amse,
+        nmse=1,
+        backfit=0,
+        **fitted_model["par"]
+    )
+    return {
+        **fitted_model,
+        "residuals": np.append(fitted_model["residuals"], e),
+        "fitted": np.append(fitted_model["fitted"], y - e),
+        "states": np.vstack([old_states[: n + m], states[m:]]),
+        "n": n + len(y),
+    }
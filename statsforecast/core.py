@@ -5,22 +5,29 @@ __all__ = ['StatsForecast']
 
 # %% ../nbs/src/core/core.ipynb 5
 import inspect
+import itertools
 import logging
 import reprlib
 import warnings
 import errno
+import hashlib
+import io
+import os
 from pathlib import Path
 from os import cpu_count
-from typing import Any, List, Optional, Union, Dict
-import pkg_resources
+from typing import Any, List, Optional, Tuple, Union, Dict
 import pickle
 import datetime as dt
 import re
+import tempfile
+from contextlib import contextmanager
+from functools import cached_property
 
 from fugue.execution.factory import make_execution_engine
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 from tqdm.autonotebook import tqdm
 from triad import conditional_dispatcher
 from fugue.execution.factory import try_get_context_execution_engine
@@ -36,8 +43,47 @@ if __name__ == "__main__":
 logger = logging.getLogger(__name__)
 
 # %% ../nbs/src/core/core.ipynb 9
+def _get_forecast_batch(model, level):
+    # models can optionally implement
+    # `forecast_batch(y, indptr, h, out, fitted_out=None, level=None)`
+    # which receives the target of all the series in CSR format,
+    # writes the forecasts (and fitted values) directly into the preallocated
+    # `out` (`fitted_out`) arrays and returns the keys of the written columns,
+    # using the same names as the dictionary returned by `forecast`.
+    forecast_batch = getattr(model, "forecast_batch", None)
+    if forecast_batch is None:
+        return None
+    if len(level) > 0 and getattr(model, "prediction_intervals", None) is not None:
+        # conformal scores are computed for each serie
+        return None
+    return forecast_batch
+
+
+def _model_cols(model, keys):
+    return [
+        f"{repr(model)}"
+        if key in ["mean", "fitted"]
+        else f"{repr(model)}-{key.replace('fitted-', '')}"
+        for key in keys
+    ]
+
+
+def _with_cs(model, cs, i, i_model):
+    # copy of the model that uses the conformity scores of the i-th serie
+    # computed by `StatsForecast.calibrate` instead of computing them again
+    if cs is None or cs[i, i_model] is None:
+        return model
+    model = model.new()
+    model._calibrated_cs = cs[i, i_model]
+    return model
+
+# %% ../nbs/src/core/core.ipynb 10
 class GroupedArray:
     def __init__(self, data, indptr):
+        if data.ndim == 2 and data.strides[0] != data.itemsize:
+            # the columns are stored one after the other (fortran order), so the target
+            # of each serie is contiguous and the exogenous form a contiguous block
+            data = np.asfortranarray(data)
         self.data = data
         self.indptr = indptr
         self.n_groups = self.indptr.size - 1
@@ -48,7 +94,7 @@ class GroupedArray:
         elif isinstance(idx, slice):
             idx = slice(idx.start, idx.stop + 1, idx.step)
             new_indptr = self.indptr[idx].copy()
-            new_data = self.data[new_indptr[0] : new_indptr[-1]].copy()
+            new_data = self.data[new_indptr[0] : new_indptr[-1]].copy(order="F")
             new_indptr -= new_indptr[0]
             return GroupedArray(new_data, new_indptr)
         raise ValueError(f"idx must be either int or slice, got {type(idx)}")
@@ -66,14 +112,61 @@ class GroupedArray:
             self.indptr, other.indptr
         )
 
-    def fit(self, models, fallback_model=None):
+    def take(self, idxs):
+        # series `idxs` in a new GroupedArray
+        starts = self.indptr[idxs]
+        sizes = self.indptr[idxs + 1] - starts
+        indptr = np.append(0, np.cumsum(sizes)).astype(self.indptr.dtype)
+        rows = np.arange(indptr[-1]) + np.repeat(starts - indptr[:-1], sizes)
+        return GroupedArray(self.data[rows], indptr)
+
+    def append(self, other, idxs):
+        # new GroupedArray with the series of `other` added after the end of series `idxs`
+        sizes = np.diff(self.indptr)
+        other_sizes = np.diff(other.indptr)
+        new_sizes = sizes.copy()
+        new_sizes[idxs] += other_sizes
+        indptr = np.append(0, np.cumsum(new_sizes)).astype(self.indptr.dtype)
+        data = np.empty(
+            (indptr[-1], *self.data.shape[1:]), dtype=self.data.dtype, order="F"
+        )
+        rows = np.arange(self.indptr[-1]) + np.repeat(
+            indptr[:-1] - self.indptr[:-1], sizes
+        )
+        data[rows] = self.data
+        other_starts = indptr[idxs] + sizes[idxs]
+        other_rows = np.arange(other.indptr[-1]) + np.repeat(
+            other_starts - other.indptr[:-1], other_sizes
+        )
+        data[other_rows] = other.data
+        return GroupedArray(data, indptr)
+
+    def _has_exog(self):
+        return self.data.ndim == 2 and self.data.shape[1] > 1
+
+    def _window(self, y, cutoff, input_size=None):
+        # returns the training data and indptr of each serie
+        # for the window ending at `cutoff` (a negative index)
+        ends = self.indptr[1:] + cutoff
+        starts = self.indptr[:-1]
+        if input_size is not None:
+            starts = np.maximum(starts, ends - input_size)
+        sizes = ends - starts
+        indptr = np.append(0, np.cumsum(sizes)).astype(self.indptr.dtype)
+        idxs = np.arange(indptr[-1]) + np.repeat(starts - indptr[:-1], sizes)
+        return y[idxs], indptr
+
+    def fit(self, models, fallback_model=None, cs=None, init_fm=None):
         fm = np.full((self.n_groups, len(models)), np.nan, dtype=object)
         for i, grp in enumerate(self):
             y = grp[:, 0] if grp.ndim == 2 else grp
             X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
             for i_model, model in enumerate(models):
                 try:
-                    new_model = model.new()
+                    new_model = _with_cs(model.new(), cs, i, i_model)
+                    if init_fm is not None and init_fm[i, i_model] is not None:
+                        # the models that reuse their previous fit start from it
+                        new_model.model_ = init_fm[i, i_model].model_
                     fm[i, i_model] = new_model.fit(y=y, X=X)
                 except Exception as error:
                     if fallback_model is not None:
@@ -83,6 +176,26 @@ class GroupedArray:
                         raise error
         return fm
 
+    def conformity_scores(self, models):
+        # conformity scores of each serie for the models with `prediction_intervals`
+        cs = np.full((self.n_groups, len(models)), None, dtype=object)
+        for i, grp in enumerate(self):
+            y = grp[:, 0] if grp.ndim == 2 else grp
+            X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
+            for i_model, model in enumerate(models):
+                if getattr(model, "prediction_intervals", None) is not None:
+                    cs[i, i_model] = model._conformity_scores(y, X)
+        return cs
+
+    def update(self, fm):
+        # advances the fitted models of each serie over its new observations
+        for i, grp in enumerate(self):
+            y = grp[:, 0] if grp.ndim == 2 else grp
+            X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
+            for i_model in range(fm.shape[1]):
+                fm[i, i_model] = fm[i, i_model].update(y=y, X=X)
+        return fm
+
     def _get_cols(self, models, attr, h, X, level=tuple()):
         n_models = len(models)
         cuts = np.full(n_models + 1, fill_value=0, dtype=np.int32)
@@ -146,9 +259,9 @@ class GroupedArray:
             cols += cols_m
         return fcsts, cols
 
-    def fit_predict(self, models, h, X=None, level=tuple()):
+    def fit_predict(self, models, h, X=None, level=tuple(), cs=None, init_fm=None):
         # fitted models
-        fm = self.fit(models=models)
+        fm = self.fit(models=models, cs=cs, init_fm=init_fm)
         # forecasts
         fcsts, cols = self.predict(fm=fm, h=h, X=X, level=level)
         return fm, fcsts, cols
@@ -162,6 +275,7 @@ class GroupedArray:
         X=None,
         level=tuple(),
         verbose=False,
+        cs=None,
     ):
         fcsts, cuts, has_level_models = self._output_fcst(
             models=models, attr="forecast", h=h, X=X, level=level
@@ -178,25 +292,64 @@ class GroupedArray:
                 fitted_vals[:, 0] = self.data
             else:
                 fitted_vals[:, 0] = self.data[:, 0]
+        cols_by_model = [[] for _ in models]
+        cols_fitted_by_model = [[] for _ in models]
+        if X is None and not self._has_exog():
+            y = self.data if self.data.ndim == 1 else self.data[:, 0]
+            for i_model, model in enumerate(models):
+                forecast_batch = _get_forecast_batch(model, level)
+                if forecast_batch is None:
+                    continue
+                kwargs = {}
+                if has_level_models[i_model]:
+                    kwargs["level"] = level
+                try:
+                    keys, keys_fitted = forecast_batch(
+                        y=y,
+                        indptr=self.indptr,
+                        h=h,
+                        out=fcsts[:, cuts[i_model] : cuts[i_model + 1]],
+                        fitted_out=fitted_vals[
+                            :, (cuts[i_model] + 1) : (cuts[i_model + 1] + 1)
+                        ]
+                        if fitted
+                        else None,
+                        **kwargs,
+                    )
+                except Exception as error:
+                    if fallback_model is None:
+                        raise error
+                    # retry serie by serie using the fallback model
+                    continue
+                cols_by_model[i_model] = _model_cols(model, keys)
+                cols_fitted_by_model[i_model] = _model_cols(model, keys_fitted)
+        seq_models = [
+            (i_model, model)
+            for i_model, model in enumerate(models)
+            if not cols_by_model[i_model]
+        ]
         iterable = tqdm(
-            enumerate(self), disable=(not verbose), total=len(self), desc="Forecast"
+            enumerate(self),
+            disable=(not verbose or not seq_models),
+            total=len(self),
+            desc="Forecast",
         )
         for i, grp in iterable:
+            if not seq_models:
+                break
             y_train = grp[:, 0] if grp.ndim == 2 else grp
             X_train = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
             if X is not None:
                 X_f = X[i]
             else:
                 X_f = None
-            cols = []
-            cols_fitted = []
-            for i_model, model in enumerate(models):
+            for i_model, model in seq_models:
                 has_level = has_level_models[i_model]
                 kwargs = {}
                 if has_level:
                     kwargs["level"] = level
                 try:
-                    res_i = model.forecast(
+                    res_i = _with_cs(model, cs, i, i_model).forecast(
                         h=h, y=y_train, X=X_train, X_future=X_f, fitted=fitted, **kwargs
                     )
                 except Exception as error:
@@ -224,7 +377,7 @@ class GroupedArray:
                 if fcsts_i.ndim == 1:
                     fcsts_i = fcsts_i[:, None]
                 fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-                cols += cols_m
+                cols_by_model[i_model] = cols_m
                 if fitted:
                     cols_m_fitted = [
                         key
@@ -242,7 +395,9 @@ class GroupedArray:
                         self.indptr[i] : self.indptr[i + 1],
                         (cuts[i_model] + 1) : (cuts[i_model + 1] + 1),
                     ] = fitted_i
-                    cols_fitted += cols_m_fitted
+                    cols_fitted_by_model[i_model] = cols_m_fitted
+        cols = [col for cols_m in cols_by_model for col in cols_m]
+        cols_fitted = [col for cols_m in cols_fitted_by_model for col in cols_m]
         result = {"forecasts": fcsts, "cols": cols}
         if fitted:
             result["fitted"] = {"values": fitted_vals}
@@ -267,6 +422,10 @@ class GroupedArray:
             raise Exception("`test_size - h` should be module `step_size`")
         n_windows = int((test_size - h) / step_size) + 1
         n_models = len(models)
+        # the models are fitted every `fit_every` windows and applied with `forward` in between,
+        # `refit=True` (or 1) fits them on every window and `refit=False` only on the first one
+        fit_every = n_windows if refit is False else int(refit)
+        refit_all = refit is not False and fit_every == 1
         cuts, has_level_models = self._get_cols(
             models=models, attr="forecast", h=h, X=None, level=level
         )
@@ -282,7 +441,53 @@ class GroupedArray:
             last_fitted_idxs = np.full_like(fitted_idxs, False, dtype=bool)
         matches = ["mean", "lo", "hi"]
         steps = list(range(-test_size, -h + 1, step_size))
+        cols_by_model = [[] for _ in models]
+        if refit_all and not fitted and not self._has_exog():
+            batch_models = [
+                (i_model, model, _get_forecast_batch(model, level))
+                for i_model, model in enumerate(models)
+            ]
+            batch_models = [x for x in batch_models if x[2] is not None]
+            y = self.data if self.data.ndim == 1 else self.data[:, 0]
+            for i_window, cutoff in enumerate(steps, start=0):
+                y_train, indptr_train = self._window(y, cutoff, input_size)
+                test_idxs = self.indptr[1:, None] + cutoff + np.arange(h)
+                out[:, i_window, :, 0] = y[test_idxs]
+                for i_model, model, forecast_batch in batch_models:
+                    if i_window > 0 and not cols_by_model[i_model]:
+                        # failed in a previous window
+                        continue
+                    kwargs = {}
+                    if has_level_models[i_model]:
+                        kwargs["level"] = level
+                    fcsts_w = np.full(
+                        (self.n_groups * h, cuts[i_model + 1] - cuts[i_model]),
+                        np.nan,
+                        dtype=np.float32,
+                    )
+                    try:
+                        keys, _ = forecast_batch(
+                            y=y_train, indptr=indptr_train, h=h, out=fcsts_w, **kwargs
+                        )
+                    except Exception as error:
+                        if fallback_model is None:
+                            raise error
+                        # retry serie by serie using the fallback model
+                        cols_by_model[i_model] = []
+                        continue
+                    out[
+                        :, i_window, :, (1 + cuts[i_model]) : (1 + cuts[i_model + 1])
+                    ] = fcsts_w.reshape(self.n_groups, h, -1)
+                    cols_by_model[i_model] = _model_cols(model, keys)
+        seq_models = [
+            (i_model, model)
+            for i_model, model in enumerate(models)
+            if not cols_by_model[i_model]
+        ]
         for i_ts, grp in enumerate(self):
+            if not seq_models:
+                break
+            fitted_models = [None] * n_models
             iterable = tqdm(
                 enumerate(steps, start=0),
                 desc=f"Cross Validation Time Series {i_ts + 1}",
@@ -312,13 +517,12 @@ class GroupedArray:
                     last_fitted_idxs[
                         self.indptr[i_ts] : self.indptr[i_ts + 1], i_window
                     ][cutoff - 1] = True
-                cols = ["y"]
-                for i_model, model in enumerate(models):
+                for i_model, model in seq_models:
                     has_level = has_level_models[i_model]
                     kwargs = {}
                     if has_level:
                         kwargs["level"] = level
-                    if refit:
+                    if refit_all:
                         try:
                             res_i = model.forecast(
                                 h=h,
@@ -341,19 +545,22 @@ class GroupedArray:
                             else:
                                 raise error
                     else:
-                        if i_window == 0:
-                            # for the first window we have to fit each model
+                        if i_window % fit_every == 0:
+                            # the first window and every `fit_every` windows we have to fit each model,
+                            # on a copy so that the threads sharing `models` don't overwrite its fit
                             try:
-                                model = model.fit(y=y_train, X=X_train)
+                                fitted_models[i_model] = model.new().fit(
+                                    y=y_train, X=X_train
+                                )
                             except Exception as error:
                                 if fallback_model is not None:
-                                    fallback_model = fallback_model.fit(
+                                    fitted_models[i_model] = fallback_model.new().fit(
                                         y=y_train, X=X_train
                                     )
                                 else:
                                     raise error
                         try:
-                            res_i = model.forward(
+                            res_i = fitted_models[i_model].forward(
                                 h=h,
                                 y=y_train,
                                 X=X_train,
@@ -363,7 +570,7 @@ class GroupedArray:
                             )
                         except Exception as error:
                             if fallback_model is not None:
-                                res_i = fallback_model.forward(
+                                res_i = fallback_model.forecast(
                                     h=h,
                                     y=y_train,
                                     X=X_train,
@@ -392,7 +599,8 @@ class GroupedArray:
                             i_window,
                             i_model + 1,
                         ][(cutoff - in_size_disp) : cutoff] = res_i["fitted"]
-                    cols += cols_m
+                    cols_by_model[i_model] = cols_m
+        cols = ["y"] + [col for cols_m in cols_by_model for col in cols_m]
         result = {"forecasts": out.reshape(-1, 1 + cuts[-1]), "cols": cols}
         if fitted:
             result["fitted"] = {
@@ -403,24 +611,404 @@ class GroupedArray:
             }
         return result
 
-    def split(self, n_chunks):
-        return [
-            self[x[0] : x[-1] + 1]
-            for x in np.array_split(range(self.n_groups), n_chunks)
-            if x.size
-        ]
+    def split(self, n_chunks=None, bounds=None):
+        # `bounds` are the indices of the first serie of each chunk
+        # followed by the number of series, used instead of `n_chunks`
+        if bounds is None:
+            return [
+                self[x[0] : x[-1] + 1]
+                for x in np.array_split(range(self.n_groups), n_chunks)
+                if x.size
+            ]
+        return [self[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def split_fm(self, fm, n_chunks=None, bounds=None):
+        if bounds is None:
+            return [
+                fm[x[0] : x[-1] + 1]
+                for x in np.array_split(range(self.n_groups), n_chunks)
+                if x.size
+            ]
+        return [fm[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+# %% ../nbs/src/core/core.ipynb 26
+class _OutputArray:
+    """Output of all the series of a parallel call, whose rows `bounds[i]` to
+    `bounds[i + 1]` are the ones of the chunk `i`.
+
+    The parent allocates it before running the chunks. When it's memory mapped from
+    `file` the processes write their rows in place, so their outputs are neither
+    sent back nor stacked, and the threads always share it."""
+
+    def __init__(self, shape, dtype, bounds):
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.bounds = bounds
+        self.file = None
+        self.array = None
+
+    def allocate(self, file=None):
+        if file is None or self.dtype.hasobject or os.name == "nt":
+            # the objects can't be memory mapped and windows can't remove the files
+            # that are still mapped, the processes send back these outputs
+            self.array = np.empty(self.shape, dtype=self.dtype)
+        else:
+            self.file = file
+            self.array = np.lib.format.open_memmap(
+                file, mode="w+", dtype=self.dtype, shape=self.shape
+            )
+
+    def __getstate__(self):
+        # the processes map the file instead of receiving a copy of the array
+        return {**self.__dict__, "array": None}
+
+    def write(self, i, res):
+        # returns False in the processes that can't write the array
+        array = self.array
+        if array is None:
+            if self.file is None:
+                return False
+            array = np.load(self.file, mmap_mode="r+")
+        array[self.bounds[i] : self.bounds[i + 1]] = res
+        return True
+
+
+def _output_arrays(out):
+    # the arrays of `out` allocated by the parent
+    if isinstance(out, _OutputArray):
+        yield out
+    elif isinstance(out, dict):
+        for v in out.values():
+            yield from _output_arrays(v)
+    elif isinstance(out, tuple):
+        for v in out:
+            yield from _output_arrays(v)
+
+
+def _write_outputs(out, res, i):
+    # writes the outputs of the chunk `i` into their rows of `out`, the written ones
+    # are replaced by None and the rest (like the names of the columns) is returned
+    if isinstance(out, _OutputArray):
+        return None if out.write(i, res) else res
+    if isinstance(out, dict):
+        return {k: _write_outputs(out.get(k), v, i) for k, v in res.items()}
+    if isinstance(out, tuple):
+        return tuple(_write_outputs(o, v, i) for o, v in zip(out, res))
+    return res
+
+
+def _gather_outputs(out, results):
+    # outputs of all the series from `out` and the outputs returned by each chunk
+    if isinstance(out, _OutputArray):
+        for i, res in enumerate(results):
+            if res is not None:
+                out.write(i, res)
+        return out.array.view(np.ndarray)
+    if isinstance(out, dict):
+        return {
+            k: _gather_outputs(out.get(k), [res[k] for res in results])
+            for k in results[0]
+        }
+    if isinstance(out, tuple):
+        return tuple(
+            _gather_outputs(o, [res[j] for res in results]) for j, o in enumerate(out)
+        )
+    return results[0]
+
+
+def _mapped_file(array):
+    # arguments of `np.memmap` that map `array` again if it's a contiguous view
+    # of a memory mapped file, like the series of an object loaded with `mmap`
+    base = array
+    while base is not None and not isinstance(base, np.memmap):
+        base = getattr(base, "base", None)
+    if base is None or base.filename is None or not Path(base.filename).exists():
+        return None
+    if array.flags.c_contiguous:
+        order = "C"
+    elif array.flags.f_contiguous:
+        order = "F"
+    else:
+        return None
+    start = array.__array_interface__["data"][0] - base.__array_interface__["data"][0]
+    return dict(
+        filename=base.filename,
+        dtype=array.dtype,
+        offset=base.offset + start,
+        shape=array.shape,
+        order=order,
+    )
+
+
+class _GroupedArrayChunk:
+    """Series `bounds[i]` to `bounds[i + 1]` of a GroupedArray, the chunk `i` of a
+    parallel call, whose outputs are written into its rows of `out`.
+
+    The threads share the GroupedArray. The processes memory map the series instead
+    of receiving a pickled copy of them, so all of them share the same pages, from
+    the file that already holds them or from a copy saved once in `path`."""
+
+    def __init__(self, ga, bounds, i, out=None, data_file=None):
+        self.ga = ga
+        self.indptr = ga.indptr[bounds[i] : bounds[i + 1] + 1]
+        self.i = i
+        self.out = out
+        self.data_file = data_file
+
+    @classmethod
+    def split(cls, ga, bounds, out=None, path=None):
+        data_file = None
+        if path is not None:
+            data_file = _mapped_file(ga.data)
+            if data_file is None:
+                np.save(Path(path) / "data.npy", ga.data)
+                data = np.load(Path(path) / "data.npy", mmap_mode="r")
+                data_file = _mapped_file(data)
+        for k, array in enumerate(_output_arrays(out)):
+            array.allocate(None if path is None else Path(path) / f"out_{k}.npy")
+        return [cls(ga, bounds, i, out, data_file) for i in range(len(bounds) - 1)]
+
+    def __getstate__(self):
+        # the processes map `data_file` instead
+        return {**self.__dict__, "ga": None}
+
+    def _run(self, method, *args):
+        if self.ga is not None:
+            data = self.ga.data
+        else:
+            data = np.memmap(mode="c", **self.data_file).view(np.ndarray)
+        indptr = self.indptr
+        ga = GroupedArray(data[indptr[0] : indptr[-1]], indptr - indptr[0])
+        return _write_outputs(self.out, getattr(ga, method)(*args), self.i)
+
+    def fit(self, *args):
+        return self._run("fit", *args)
+
+    def conformity_scores(self, *args):
+        return self._run("conformity_scores", *args)
+
+    def update(self, *args):
+        return self._run("update", *args)
+
+    def predict(self, *args):
+        return self._run("predict", *args)
+
+    def fit_predict(self, *args):
+        return self._run("fit_predict", *args)
+
+    def forecast(self, *args):
+        return self._run("forecast", *args)
+
+    def cross_validation(self, *args):
+        return self._run("cross_validation", *args)
+
+# %% ../nbs/src/core/core.ipynb 27
+_BYTE_UNITS = {
+    "B": 1,
+    "KB": 2**10,
+    "MB": 2**20,
+    "GB": 2**30,
+}
+
+
+class _DiskCache:
+    """Pickled outputs stored in the files of `path` named by their key.
+
+    Reading an entry updates the modification time of its file, so when the files
+    exceed `max_size` bytes the least recently used ones are removed first."""
+
+    def __init__(self, path, max_size=None):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key):
+        return self.path / f"{key}.pkl"
+
+    def get(self, key):
+        file = self._file(key)
+        try:
+            value = file.read_bytes()
+            os.utime(file)
+        except FileNotFoundError:
+            return None
+        return value
+
+    def set(self, key, value):
+        # written to a temporary file first so that readers never see a partial entry
+        tmp_file = self.path / f"{key}.{os.getpid()}.tmp"
+        tmp_file.write_bytes(value)
+        os.replace(tmp_file, self._file(key))
+
+    def evict(self):
+        if self.max_size is None:
+            return
+        entries = []
+        for file in self.path.glob("*.pkl"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, file))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                file.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+def _model_state(model):
+    # unfitted state of a model: its attributes without the fitted (`model_`) and
+    # private ones, with the nested models (like the trend of MSTL) replaced by theirs
+    if model is None:
+        return None
+    state = {
+        name: (
+            _model_state(value)
+            if hasattr(value, "new") and hasattr(value, "fit")
+            else value
+        )
+        for name, value in vars(model).items()
+        if not name.startswith("_") and not name.endswith("_")
+    }
+    return type(model).__module__, type(model).__qualname__, state
+
+
+def _series_keys(ga, X, config, cs=None):
+    # content address of the outputs of each serie: hash of its values and exogenous,
+    # its future exogenous, its conformity scores and the configuration that
+    # produces the outputs
+    config_hash = hashlib.sha256(pickle.dumps(config)).digest()
+    keys = []
+    for i in range(len(ga)):
+        key = hashlib.sha256(config_hash)
+        for arr in (ga[i], None if X is None else X[i]):
+            if arr is None:
+                continue
+            key.update(repr((arr.dtype.str, arr.shape)).encode())
+            key.update(arr.tobytes())
+        if cs is not None:
+            key.update(pickle.dumps(cs[i]))
+        keys.append(key.hexdigest())
+    return keys
+
+
+class _ColumnsPickler(pickle.Pickler):
+    """Pickler that stores the numeric arrays out of band, concatenated by dtype.
+
+    The pickle only keeps the position of each array in its column, so the columns
+    can be written as .npy files and memory mapped when loading."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        super().__init__(self.buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        self.columns = {}
+        self.sizes = {}
+
+    def persistent_id(self, obj):
+        if type(obj) is not np.ndarray or obj.dtype.kind not in "biufcmM":
+            return None
+        key = obj.dtype.str
+        if key not in self.columns:
+            self.columns[key] = []
+            self.sizes[key] = 0
+        order = "F" if obj.flags.f_contiguous and not obj.flags.c_contiguous else "C"
+        offset = self.sizes[key]
+        self.columns[key].append(obj.ravel(order=order))
+        self.sizes[key] += obj.size
+        return list(self.columns).index(key), offset, obj.shape, order
+
+    @property
+    def nbytes(self):
+        columns_size = sum(
+            size * np.dtype(key).itemsize for key, size in self.sizes.items()
+        )
+        return self.buffer.getbuffer().nbytes + columns_size
+
+    def write(self, path, name, compress):
+        (path / f"{name}.pkl").write_bytes(self.buffer.getvalue())
+        if compress:
+            columns = {
+                f"arr_{k}": np.concatenate(arrays)
+                for k, arrays in enumerate(self.columns.values())
+            }
+            np.savez_compressed(path / f"{name}.npz", **columns)
+            return
+        for k, (key, arrays) in enumerate(self.columns.items()):
+            # streamed to the file to not hold a concatenated copy of the arrays
+            header = {
+                "descr": np.lib.format.dtype_to_descr(np.dtype(key)),
+                "fortran_order": False,
+                "shape": (self.sizes[key],),
+            }
+            with open(path / f"{name}_{k}.npy", "wb") as f:
+                np.lib.format.write_array_header_1_0(f, header)
+                for arr in arrays:
+                    arr.tofile(f)
+
+
+class _ColumnsUnpickler(pickle.Unpickler):
+    """Inverse of `_ColumnsPickler`, the arrays are views of the columns written to
+    `path`, which are memory mapped when `mmap` is true."""
+
+    def __init__(self, file, path, name, mmap):
+        super().__init__(file)
+        self.path = path
+        self.name = name
+        self.mmap = mmap
+        self.columns = {}
+        npz_file = path / f"{name}.npz"
+        self.npz = np.load(npz_file) if npz_file.exists() else None
+
+    def _column(self, k):
+        if k not in self.columns:
+            if self.npz is not None:
+                # compressed columns can't be memory mapped
+                self.columns[k] = self.npz[f"arr_{k}"]
+            else:
+                file = self.path / f"{self.name}_{k}.npy"
+                column = np.load(file, mmap_mode="c" if self.mmap else None)
+                self.columns[k] = column.view(np.ndarray)
+        return self.columns[k]
+
+    def persistent_load(self, pid):
+        k, offset, shape, order = pid
+        size = int(np.prod(shape))
+        return self._column(k)[offset : offset + size].reshape(shape, order=order)
+
+
+def _load_columns(path, name, mmap):
+    with open(path / f"{name}.pkl", "rb") as f:
+        unpickler = _ColumnsUnpickler(f, path, name, mmap)
+        obj = unpickler.load()
+    if unpickler.npz is not None:
+        unpickler.npz.close()
+    return obj
+
+# %% ../nbs/src/core/core.ipynb 31
+def _factorize_ids(
+    unique_id: np.ndarray, ds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """Numbers the ids in order of appearance and checks if the rows are sorted by `unique_id` and `ds`."""
+    codes, uniques = pd.factorize(unique_id)
+    code_diffs = np.diff(codes)
+    same_id = code_diffs == 0
+    is_sorted = (
+        (code_diffs >= 0).all()
+        and pd.Index(uniques).is_monotonic_increasing
+        and (ds[1:][same_id] >= ds[:-1][same_id]).all()
+    )
+    return codes, uniques, bool(is_sorted)
 
-    def split_fm(self, fm, n_chunks):
-        return [
-            fm[x[0] : x[-1] + 1]
-            for x in np.array_split(range(self.n_groups), n_chunks)
-            if x.size
-        ]
 
-# %% ../nbs/src/core/core.ipynb 23
 class DataFrameProcessing:
     """
     A utility to process Pandas or Polars dataframes for time series forecasting.
+    Arrow tables and record batches are processed as Polars dataframes.
 
     This class ensures the dataframe is properly structured, with required columns
     ('unique_id', 'ds', 'y'), and the 'ds' column is of datetime type. It also
@@ -430,8 +1018,8 @@ class DataFrameProcessing:
 
     Attributes:
     ----------
-    dataframe : pd.DataFrame or pl.DataFrame
-        A pandas or polars dataframe to be processed.
+    dataframe : pd.DataFrame, pl.DataFrame, pa.Table or pa.RecordBatch
+        A pandas, polars or arrow dataframe to be processed.
     sort_dataframe : bool
         A boolean indicating whether the dataframe should be sorted.
 
@@ -442,8 +1030,10 @@ class DataFrameProcessing:
         sorts the dataframe if required, and separates the data into different
         arrays for future operations.
     _to_np_and_engine():
-        Converts the dataframe to a numpy structured array and identifies the
-        dataframe engine (pandas or polars).
+        Validates the dataframe, identifies its engine (pandas or polars) and
+        returns the `unique_id` and `ds` columns as numpy arrays.
+    _to_value_array():
+        Reads the value columns into a float array stored by columns.
     _validate_dataframe(dataframe: Union[pd.DataFrame, pl.DataFrame]):
         Checks if the required columns ('unique_id', 'ds', 'y') are present in the
         dataframe.
@@ -472,60 +1062,47 @@ class DataFrameProcessing:
         """Sequential execution of the code"""
         # Declaring values that will be utilized
         self.np_df = self._to_np_and_engine()
-        self.dataframe_columns = self.np_df.dtype.names
+        codes, uniques, is_sorted = _factorize_ids(
+            self.np_df["unique_id"], self.np_df["ds"]
+        )
 
-        # Processing value columns
-        value_columns = [
-            column
-            for column in self.dataframe_columns
-            if column not in self.non_value_columns
-        ]
-        self.value_array = self.np_df[value_columns]
-        if self.value_array.ndim == 1 and len(value_columns) > 1:
-            self.value_array = np.stack(
-                [
-                    self.value_array[name].astype(float)
-                    for name in self.value_array.dtype.names
-                ],
-                axis=1,
-            )
-        if self.value_array.ndim == 1 and len(value_columns) == 1:
-            self.value_array = (
-                self.value_array[value_columns].astype(float).reshape(-1, 1)
+        # Sorting will be performed if sort is set to true and values are unsorted
+        if not is_sorted and self.sort_dataframe:
+            self.dataframe = self._sort()
+            self.np_df = self._get_id_and_dates()
+            codes, uniques, _ = _factorize_ids(
+                self.np_df["unique_id"], self.np_df["ds"]
             )
 
-        # Processing unique_id
-        self.unique_id = self.np_df["unique_id"]
-        if self.unique_id.dtype.kind == "O":
-            self.unique_id.astype(str)
+        # Processing value columns
+        self.value_array = self._to_value_array()
 
+        # Processing unique_id
         # If values are already int or float then they won't be converted
-        if self.unique_id.dtype.kind not in ["i", "f"]:
+        if uniques.dtype.kind not in ["i", "f"]:
             # If all values in the numpy array are numerical then proceed with conversion
-            if np.char.isnumeric(self.unique_id.astype(str)).all():
+            if np.char.isnumeric(uniques.astype(str)).all():
                 # If number are whole then they will be converted to `int`, else `float`
                 # This is pure aesthetics addition.
-                self.unique_id = self.unique_id.astype(float)
-                if np.isclose(self.unique_id, np.round(self.unique_id)).all():
-                    self.unique_id = self.unique_id.astype(int)
-        # NOTE: When sorting with Numpy, character values may be prioritized over numerical values if the data
-        # type is set to 'object'. For instance, the value '10' would come before '3' because it contains '1' and '0'
-        # at the beginning. One solution to this problem is to convert the data to 'float' if it is numerical.
-        unique_id_count = pd.Series(self.unique_id).value_counts(sort=False)
-        self.indices, sizes = unique_id_count.index, unique_id_count.values
-        cum_sizes = np.cumsum(sizes)
+                uniques = uniques.astype(float)
+                if np.isclose(uniques, np.round(uniques)).all():
+                    uniques = uniques.astype(int)
+        # NOTE: The ids are numbered in order of appearance, so the series keep the order of the
+        # (sorted) DataFrame. Sorting numerical ids as strings would place '10' before '3'.
+        self.indices = pd.Index(uniques)
+        cum_sizes = np.cumsum(np.bincount(codes, minlength=len(uniques)))
 
         # Processing datestamp
         self.dates = self.np_df[self.datetime_column_name]
         if self.engine_dataframe == pd.DataFrame:
-            self.dates = self.dataframe.index.get_level_values(
-                self.datetime_column_name
-            )
+            self.dates = pd.Index(self.dates)
         self.dates = self.dates[cum_sizes - 1]
         self.indptr = np.append(0, cum_sizes).astype(np.int32)
 
-        # Index that will be used by pandas, not polars
-        self.index = pd.MultiIndex.from_arrays(
+    @cached_property
+    def index(self):
+        """Index that will be used by pandas, not polars. Only built when requested."""
+        return pd.MultiIndex.from_arrays(
             [
                 self.np_df["unique_id"],
                 self.np_df["ds"],
@@ -536,108 +1113,78 @@ class DataFrameProcessing:
     def grouped_array(self):
         return GroupedArray(self.value_array, self.indptr)
 
+    def _to_value_array(self):
+        """
+        Reads the value columns of the (sorted) DataFrame one at a time into a
+        float64 array of shape (n_rows, n_columns) stored by columns, so that each
+        column is contiguous.
+        """
+        value_columns = [
+            column
+            for column in self.dataframe.columns
+            if column not in self.non_value_columns
+        ]
+        value_array = np.empty(
+            (self.dataframe.shape[0], len(value_columns)), dtype=np.float64, order="F"
+        )
+        for i, column in enumerate(value_columns):
+            if self.engine_dataframe == pl.DataFrame:
+                value_array[:, i] = self.dataframe[column].to_numpy()
+            else:
+                value_array[:, i] = self.dataframe[column].to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+        return value_array
+
+    def _get_id_and_dates(self):
+        """Returns the `unique_id` and `ds` columns as numpy arrays."""
+        if (
+            self.engine_dataframe == pd.DataFrame
+            and self.dataframe.index.name == "unique_id"
+        ):
+            unique_id = self.dataframe.index.to_numpy()
+        else:
+            unique_id = self.dataframe["unique_id"].to_numpy()
+        return {"unique_id": unique_id, "ds": self.dataframe["ds"].to_numpy()}
+
+    def _sort(self):
+        """Sorts the DataFrame by `unique_id` and `ds`."""
+        if self.engine_dataframe == pl.DataFrame:
+            return self.dataframe.sort(self.non_value_columns)
+        return self.dataframe.sort_values(self.non_value_columns)
+
     def _to_np_and_engine(self):
         """
-        This function will be utilised to convert DataFrame to dictionary.
+        Validates the DataFrame, identifies its engine (pandas or polars) and
+        returns its `unique_id` and `ds` columns as numpy arrays.
 
         Returns:
-            tuple[pd.DataFrame or pl.DataFrame, dict]: the engine that will be used to construct
-                the output DataFrame and dictionary of DataFrame values
+            dict[str, np.ndarray]: values of the `unique_id` and `ds` columns
 
         Raises:
             ValueError: If DataFrame engine is not supported and/or accounted for.
         """
 
+        ###############
+        # Arrow Table #
+        ###############
+        if isinstance(self.dataframe, pa.RecordBatch):
+            self.dataframe = pa.Table.from_batches([self.dataframe])
+        if isinstance(self.dataframe, pa.Table):
+            # polars uses the arrow buffers without copying them
+            self.dataframe = pl.from_arrow(self.dataframe)
+
         ####################
         # Polars DataFrame #
         ####################
         if isinstance(self.dataframe, pl.DataFrame):
-            # Ensure that all required columns are present in the DataFrame:
             self.engine_dataframe = pl.DataFrame
-            if self.validate:
-                self._validate_dataframe(self.dataframe)
-            elif self.validate == False:
-                self._partial_val_df(self.dataframe)
-
-            # datetime check
-            dt_arr = self.dataframe["ds"].to_numpy()
-            processed_dt_arr = self._check_datetime(dt_arr)
-            if type(dt_arr) != type(processed_dt_arr):
-                self.dataframe = self.dataframe.with_columns(
-                    pl.from_numpy(processed_dt_arr.to_numpy(), schema=["ds"])
-                )
-
-            sample_index_df = self.dataframe[self.non_value_columns]
-            sorted_index_df = sample_index_df.sort(self.non_value_columns)
-            is_monotonic_increasing = sample_index_df.frame_equal(sorted_index_df)
-
-            # Sorting will be performed if sort is set to true and values are unsorted
-            if not is_monotonic_increasing and self.sort_dataframe:
-                self.dataframe = self.dataframe.sort(self.non_value_columns)
-
-            # resources: https://github.com/pola-rs/polars/blob/4fca1ae51864f74e0367d8bc91b4a2db00e54174/py-polars/polars/dataframe/frame.py#L1975
-            # resources: https://numpy.org/doc/stable/user/basics.rec.html
-            # resources: https://numpy.org/doc/stable/reference/generated/numpy.core.records.fromarrays.html
-            # NOTE: Structured array is not available in polars under the version 0.17.12
-            pl_version = pkg_resources.get_distribution("polars").version
-            min_pl_v = pkg_resources.parse_version("0.17.12")
-            if pkg_resources.parse_version(pl_version) >= min_pl_v:
-                return self.dataframe.to_numpy(structured=True)
-            else:
-                arrays = []
-                for column, column_dtype in self.dataframe.schema.items():
-                    ser = self.dataframe[column]
-                    arr = ser.to_numpy()
-                    arrays.append(
-                        arr.astype(str, copy=False)
-                        if str(column_dtype) == "Utf8" and not ser.has_validity()
-                        else arr
-                    )
-                arr_dtypes = list(
-                    zip(self.dataframe.columns, (a.dtype for a in arrays))
-                )
-                return np.rec.fromarrays(arrays, dtype=np.dtype(arr_dtypes))
 
         ####################
         # Pandas DataFrame #
         ####################
         elif isinstance(self.dataframe, pd.DataFrame):
             self.engine_dataframe = pd.DataFrame
-            # Ensure that all required columns are present in the DataFrame:
-            # Full validation
-            if self.validate and self.dataframe.index.name == "unique_id":
-                reset_df = self.dataframe.reset_index()
-                self._validate_dataframe(reset_df)
-                del reset_df
-
-            elif self.validate and self.dataframe.index.name != "unique_id":
-                self._validate_dataframe(self.dataframe)
-                self.dataframe = self.dataframe.set_index("unique_id")
-
-            # Partial validation
-            elif self.validate == False and self.dataframe.index.name == "unique_id":
-                reset_df = self.dataframe.reset_index()
-                self._partial_val_df(reset_df)
-                del reset_df
-
-            elif self.validate == False and self.dataframe.index.name != "unique_id":
-                self._partial_val_df(self.dataframe)
-                self.dataframe = self.dataframe.set_index("unique_id")
-
-            # Datetime check
-            dt_arr = self.dataframe["ds"].values
-            self.dataframe = self.dataframe.copy(deep=False)
-            self.dataframe["ds"] = self._check_datetime(dt_arr)
-
-            self.dataframe = self.dataframe.set_index("ds", append=True)
-
-            # Sorting will be performed if sort is set to true and values are unsorted
-            if not self.dataframe.index.is_monotonic_increasing and self.sort_dataframe:
-                self.dataframe = self.dataframe.sort_values(self.non_value_columns)
-
-            np_df = self.dataframe.to_records(index=True)
-
-            return np_df
 
         ####################
         # Not Supported DF #
@@ -645,6 +1192,25 @@ class DataFrameProcessing:
         else:
             raise ValueError(f"{type(self.dataframe)} is not supported")
 
+        # Ensure that all required columns are present in the DataFrame:
+        if self.validate:
+            self._validate_dataframe(self.dataframe)
+        elif self.validate == False:
+            self._partial_val_df(self.dataframe)
+
+        # Datetime check
+        dt_arr = self.dataframe["ds"].to_numpy()
+        processed_dt_arr = self._check_datetime(dt_arr)
+        if type(dt_arr) != type(processed_dt_arr):
+            if self.engine_dataframe == pl.DataFrame:
+                self.dataframe = self.dataframe.with_columns(
+                    pl.from_numpy(processed_dt_arr.to_numpy(), schema=["ds"])
+                )
+            else:
+                self.dataframe = self.dataframe.copy(deep=False)
+                self.dataframe["ds"] = processed_dt_arr
+        return self._get_id_and_dates()
+
     def _validate_dataframe(self, dataframe: Union[pd.DataFrame, pl.DataFrame]):
         """
         Will ensure that all DataFrame columns match the required columns.
@@ -661,7 +1227,7 @@ class DataFrameProcessing:
             KeyError: DataFrame is missing `unique_id`, `ds`, `y` columns.
         """
         required_columns = ["unique_id", "ds", "y"]
-        matches = all(rc in dataframe.columns for rc in required_columns)
+        matches = all(rc in self._columns(dataframe) for rc in required_columns)
         if not matches:
             raise KeyError(
                 "The DataFrame doesn't contain {} columns".format(
@@ -684,7 +1250,7 @@ class DataFrameProcessing:
             KeyError: DataFrame is missing `unique_id` and/or `ds` columns.
         """
         required_columns = ["unique_id", "ds"]
-        matches = all(rc in dataframe.columns for rc in required_columns)
+        matches = all(rc in self._columns(dataframe) for rc in required_columns)
         if not matches:
             raise KeyError(
                 "The DataFrame doesn't contain {} columns".format(
@@ -692,6 +1258,13 @@ class DataFrameProcessing:
                 )
             )
 
+    def _columns(self, dataframe: Union[pd.DataFrame, pl.DataFrame]) -> list:
+        """Columns of the DataFrame, including the name of a pandas index."""
+        columns = list(dataframe.columns)
+        if isinstance(dataframe, pd.DataFrame) and dataframe.index.name is not None:
+            columns.append(dataframe.index.name)
+        return columns
+
     def _check_datetime(self, arr: np.ndarray) -> Union[pd.DatetimeIndex, np.ndarray]:
         dt_check = pd.api.types.is_datetime64_any_dtype(arr)
         int_float_check = arr.dtype.kind in ["i", "f"]
@@ -708,46 +1281,64 @@ class DataFrameProcessing:
                 raise Exception(msg) from e
         return arr
 
-# %% ../nbs/src/core/core.ipynb 26
+# %% ../nbs/src/core/core.ipynb 36
+def _dates_from_steps(last_dates, freq, steps, calendar_dates):
+    # dates `steps` periods after each one of the `last_dates`, with shape (len(last_dates), len(steps)).
+    # `calendar_dates` computes the dates of a single last date for the offsets with variable width
+    last_dates = np.asarray(last_dates)
+    if issubclass(last_dates.dtype.type, np.integer):
+        return last_dates[:, None] + steps.astype(last_dates.dtype)
+    freq = pd.tseries.frequencies.to_offset(freq)
+    uniques, inverse = np.unique(
+        np.asarray(last_dates, dtype="datetime64[ns]"), return_inverse=True
+    )
+    if isinstance(freq, pd.offsets.Tick):
+        # fixed width offsets are just a number of nanoseconds
+        dates = uniques[:, None] + steps * np.timedelta64(freq.nanos, "ns")
+    else:
+        dates = np.vstack(
+            [calendar_dates(last_date) for last_date in pd.DatetimeIndex(uniques)]
+        )
+    return dates[inverse]
+
+
+def _future_dates(last_dates, freq, h):
+    # dates of the next `h` periods of each serie, flattened
+    def calendar_dates(last_date):
+        return pd.date_range(last_date + freq, periods=h, freq=freq).values
+
+    return _dates_from_steps(
+        last_dates, freq, np.arange(1, h + 1), calendar_dates
+    ).ravel()
+
+
 def _cv_dates(last_dates, freq, h, test_size, step_size=1):
     # assuming step_size = 1
     if (test_size - h) % step_size:
         raise Exception("`test_size - h` should be module `step_size`")
-    n_windows = int((test_size - h) / step_size) + 1
-    if len(np.unique(last_dates)) == 1:
-        if issubclass(last_dates.dtype.type, np.integer):
-            total_dates = np.arange(last_dates[0] - test_size + 1, last_dates[0] + 1)
-            out = np.empty((h * n_windows, 2), dtype=last_dates.dtype)
-            freq = 1
-        else:
-            total_dates = pd.date_range(end=last_dates[0], periods=test_size, freq=freq)
-            out = np.empty((h * n_windows, 2), dtype="datetime64[s]")
-        for i_window, cutoff in enumerate(
-            range(-test_size, -h + 1, step_size), start=0
-        ):
-            end_cutoff = cutoff + h
-            out[h * i_window : h * (i_window + 1), 0] = (
-                total_dates[cutoff:]
-                if end_cutoff == 0
-                else total_dates[cutoff:end_cutoff]
-            )
-            out[h * i_window : h * (i_window + 1), 1] = np.tile(
-                total_dates[cutoff] - freq, h
-            )
-        dates = pd.DataFrame(
-            np.tile(out, (len(last_dates), 1)), columns=["ds", "cutoff"]
-        )
-    else:
-        dates = pd.concat(
-            [
-                _cv_dates(np.array([ld]), freq, h, test_size, step_size)
-                for ld in last_dates
-            ]
-        )
-        dates = dates.reset_index(drop=True)
-    return dates
+    # periods before the last date of the cutoffs and the forecasts of each window
+    cutoff_steps = np.repeat(np.arange(-test_size, -h + 1, step_size), h)
+    ds_steps = cutoff_steps + np.tile(np.arange(1, h + 1), cutoff_steps.size // h)
+
+    def calendar_dates(last_date):
+        total_dates = pd.date_range(end=last_date, periods=test_size, freq=freq)
+        ds = total_dates[ds_steps + test_size - 1]
+        cutoffs = total_dates[cutoff_steps + test_size] - freq
+        return np.hstack([ds.values, cutoffs.values])
+
+    dates = _dates_from_steps(
+        last_dates, freq, np.hstack([ds_steps, cutoff_steps]), calendar_dates
+    )
+    if not issubclass(dates.dtype.type, np.integer):
+        dates = dates.astype("datetime64[s]")
+    return pd.DataFrame(
+        {
+            "ds": dates[:, : ds_steps.size].ravel(),
+            "cutoff": dates[:, ds_steps.size :].ravel(),
+        }
+    )
 
-# %% ../nbs/src/core/core.ipynb 30
+# %% ../nbs/src/core/core.ipynb 41
 def _get_n_jobs(n_groups, n_jobs):
     if n_jobs == -1 or (n_jobs is None):
         actual_n_jobs = cpu_count()
@@ -755,7 +1346,67 @@ def _get_n_jobs(n_groups, n_jobs):
         actual_n_jobs = n_jobs
     return min(n_groups, actual_n_jobs)
 
-# %% ../nbs/src/core/core.ipynb 33
+
+def _cv_conformity_scores(cv_df, models):
+    # conformity scores of the models with `prediction_intervals` from the
+    # last `n_windows` windows of each serie in the output of `cross_validation`
+    if isinstance(cv_df, pd.DataFrame) and "unique_id" not in cv_df.columns:
+        cv_df = cv_df.reset_index()
+    codes, uids = pd.factorize(cv_df["unique_id"].to_numpy())
+    cutoffs = cv_df["cutoff"].to_numpy()
+    order = np.lexsort((cv_df["ds"].to_numpy(), cutoffs, codes))
+    codes, cutoffs = codes[order], cutoffs[order]
+    indptr = np.append(0, np.cumsum(np.bincount(codes, minlength=len(uids))))
+    window_starts = np.flatnonzero(
+        np.append(True, (codes[1:] != codes[:-1]) | (cutoffs[1:] != cutoffs[:-1]))
+    )
+    window_sizes = np.diff(np.append(window_starts, codes.size))
+    y = cv_df["y"].to_numpy()[order]
+    cs = np.full((len(uids), len(models)), None, dtype=object)
+    for i_model, model in enumerate(models):
+        intervals = getattr(model, "prediction_intervals", None)
+        if intervals is None:
+            continue
+        if repr(model) not in cv_df.columns:
+            raise ValueError(f"`cv_df` must have the forecasts of {repr(model)}.")
+        if (window_sizes != intervals.h).any():
+            raise ValueError(
+                f"The windows of `cv_df` must have {intervals.h} steps, the `h` of the prediction intervals of {repr(model)}."
+            )
+        size = intervals.n_windows * intervals.h
+        if (np.diff(indptr) < size).any():
+            raise ValueError(
+                f"`cv_df` must have at least {intervals.n_windows} windows for each serie."
+            )
+        errors = np.abs(y - cv_df[repr(model)].to_numpy()[order]).astype(np.float32)
+        for i in range(len(uids)):
+            cs[i, i_model] = errors[indptr[i + 1] - size : indptr[i + 1]].reshape(
+                intervals.n_windows, intervals.h
+            )
+    return pd.Index(uids), cs
+
+
+def _check_refit(refit):
+    if not isinstance(refit, bool) and (
+        not isinstance(refit, (int, np.integer)) or refit < 1
+    ):
+        raise ValueError(
+            f"`refit` must be a boolean or a positive integer, got {refit}"
+        )
+
+
+def _get_chunk_bounds(indptr, n_jobs, chunks_per_job=4):
+    # contiguous chunks of series with a similar cost, estimated by their size.
+    # having more chunks than jobs lets the workers that finish early
+    # take the remaining chunks instead of waiting for the slowest one
+    n_groups = indptr.size - 1
+    n_chunks = min(n_groups, n_jobs * chunks_per_job)
+    cost = np.cumsum(np.diff(indptr))
+    targets = cost[-1] * np.arange(1, n_chunks) / n_chunks
+    cuts = np.searchsorted(cost, targets) + 1
+    return np.unique(np.hstack([0, cuts, n_groups]))
+
+# %% ../nbs/src/core/core.ipynb 45
 def _parse_ds_type(df):
     dt_col = df["ds"]
     dt_check = pd.api.types.is_datetime64_any_dtype(dt_col)
@@ -773,7 +1424,7 @@ def _parse_ds_type(df):
             raise Exception(msg) from e
     return df
 
-# %% ../nbs/src/core/core.ipynb 34
+# %% ../nbs/src/core/core.ipynb 46
 class _StatsForecast:
     def __init__(
         self,
@@ -784,6 +1435,9 @@ class _StatsForecast:
         sort_df: bool = True,
         fallback_model: Optional[Any] = None,
         verbose: bool = False,
+        backend: str = "processes",
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_max_size: Optional[str] = None,
     ):
         """Train statistical models.
 
@@ -817,6 +1471,19 @@ class _StatsForecast:
             Only works with the `forecast` and `cross_validation` methods.
         verbose : bool (default=True)
             Prints TQDM progress bar when `n_jobs=1`.
+        backend : str (default='processes')
+            Executor used when `n_jobs > 1`, either 'processes' or 'threads'.
+            Threads share the series and the compiled models without copying them,
+            but they only run in parallel when the GIL is released
+            (set the `NIXTLA_NUMBA_RELEASE_GIL` environment variable).
+        cache_dir : str or pathlib.Path, optional (default=None)
+            Directory of an on-disk cache of the fitted models and forecasts of each serie,
+            keyed by a hash of its values, its exogenous and the configuration of the models.
+            `fit` and `forecast` only compute the series that aren't in the cache and compute
+            identical series once.
+        cache_max_size : str, optional (default=None)
+            Maximum size of the cache, the least recently used entries are removed when it's exceeded.
+            Available byte naming: ['B', 'KB', 'MB', 'GB']
         """
 
         # TODO @fede: needed for residuals, think about it later
@@ -826,6 +1493,20 @@ class _StatsForecast:
         self.n_jobs = n_jobs
         self.fallback_model = fallback_model
         self.verbose = verbose
+        if backend not in ("processes", "threads"):
+            raise ValueError(
+                f"`backend` must be 'processes' or 'threads', got '{backend}'."
+            )
+        self.backend = backend
+        self._pool = None
+        self._cache: Optional[_DiskCache] = None
+        if cache_dir is not None:
+            max_size = (
+                None
+                if cache_max_size is None
+                else self._get_cap_size(cache_max_size, _BYTE_UNITS)
+            )
+            self._cache = _DiskCache(cache_dir, max_size)
         self.n_jobs == 1
         self._prepare_fit(df=df, sort_df=sort_df)
 
@@ -844,13 +1525,19 @@ class _StatsForecast:
             self.ga = df_process.grouped_array()
             self.uids = df_process.indices
             self.last_dates = df_process.dates
-            self.ds = df_process.index
             self.og_dates = df_process.np_df["ds"]
             self.og_unique_id = df_process.np_df["unique_id"]
             self.engine = df_process.engine_dataframe
             self.n_jobs = _get_n_jobs(len(self.ga), self.n_jobs)
             self.sort_df = sort_df
 
+    def _fitted_index(self, n_repeats: int = 1):
+        # the (unique_id, ds) index of the fitted values is only built when requested
+        return pd.MultiIndex.from_arrays(
+            [np.tile(self.og_unique_id, n_repeats), np.tile(self.og_dates, n_repeats)],
+            names=["unique_id", "ds"],
+        )
+
     def _set_prediction_intervals(self, prediction_intervals):
         for model in self.models:
             interval = getattr(model, "prediction_intervals", None)
@@ -866,7 +1553,8 @@ class _StatsForecast:
         """Fit statistical models.
 
         Fit `models` to a large set of time series from DataFrame `df`
-        and store fitted models for later inspection.
+        and store fitted models for later inspection. The models with `warm_start=True`
+        or `reselect_every > 1` start from their previous fit of each serie.
 
         Parameters
         ----------
@@ -885,29 +1573,233 @@ class _StatsForecast:
             Returns with stored `StatsForecast` fitted `models`.
         """
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        fitted = getattr(self, "fitted_", None)
+        prev_fit = (self.uids, fitted) if fitted is not None else None
         self._prepare_fit(df, sort_df)
-        if self.n_jobs == 1:
-            self.fitted_ = self.ga.fit(
-                models=self.models, fallback_model=self.fallback_model
+        cs = self._get_cs(self.uids)
+        init_fm = self._get_init_fm(prev_fit)
+        if self._cache is not None and init_fm is None:
+            fm = self._run_cached(
+                config=("fit", self._models_state()),
+                run=lambda ga, X, cs: self._fit_ga(ga, cs),
+                cs=cs,
             )
+            self.fitted_ = np.vstack([pickle.loads(fm_i) for fm_i in fm])
         else:
-            self.fitted_ = self._fit_parallel()
+            self.fitted_ = self._fit_ga(self.ga, cs, init_fm)
         return self
 
-    def _make_future_df(self, h: int):
-        if issubclass(self.last_dates.dtype.type, np.integer):
-            last_date_f = lambda x: np.arange(
-                x + 1, x + 1 + h, dtype=self.last_dates.dtype
+    def _fit_ga(self, ga, cs=None, init_fm=None):
+        if self.n_jobs == 1:
+            return ga.fit(
+                models=self.models,
+                fallback_model=self.fallback_model,
+                cs=cs,
+                init_fm=init_fm,
+            )
+        return self._fit_parallel(cs, init_fm, ga)
+
+    def update(
+        self,
+        df: Union[pd.DataFrame, pl.DataFrame],
+        sort_df: bool = True,
+    ):
+        """Update the fitted models with new observations.
+
+        Advances the state of the stored fitted `models` over the new observations
+        of each serie keeping their parameters fixed, so that `predict` starts
+        after the last new date without fitting the models again.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame or polars.DataFrame
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous with the
+            observations that follow the ones used to fit. It can contain only some of the series.
+        sort_df : bool (default=True)
+            If True, sort `df` by [`unique_id`,`ds`].
+
+        Returns
+        -------
+        self : StatsForecast
+            Returns with the updated fitted `models`.
+        """
+        if not hasattr(self, "fitted_"):
+            raise Exception("You have to use the `fit` method first")
+        models = (
+            self.models
+            if self.fallback_model is None
+            else [*self.models, self.fallback_model]
+        )
+        no_update = [repr(model) for model in models if not hasattr(model, "update")]
+        if no_update:
+            raise NotImplementedError(
+                f'The following models can\'t be updated with new observations: {", ".join(no_update)}'
+            )
+        df_process = DataFrameProcessing(df, sort_df)
+        ga = df_process.grouped_array()
+        if ga.data.shape[1] != self.ga.data.shape[1]:
+            raise ValueError(
+                f"Expected df to have {self.ga.data.shape[1]} value columns, but got {ga.data.shape[1]}"
             )
+        series = self.uids.get_indexer(df_process.indices)
+        if (series == -1).any():
+            missing = df_process.indices[series == -1].tolist()
+            raise ValueError(f"The following series were not fitted: {missing}")
+        last_dates = np.array(self.last_dates)
+        first_dates = df_process.np_df["ds"][df_process.indptr[:-1]]
+        if (first_dates <= last_dates[series]).any():
+            raise ValueError(
+                "`df` must only contain dates after the ones used to fit the models."
+            )
+        fm = self.fitted_[series]
+        if self.n_jobs == 1:
+            self.fitted_[series] = ga.update(fm)
         else:
-            last_date_f = lambda x: pd.date_range(
-                x + self.freq, periods=h, freq=self.freq
+            self.fitted_[series] = self._update_parallel(ga, fm)
+        self.ga = self.ga.append(ga, series)
+        last_dates[series] = df_process.dates
+        self.last_dates = (
+            pd.Index(last_dates) if self.engine == pd.DataFrame else last_dates
+        )
+        return self
+
+    def calibrate(
+        self,
+        df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
+        cv_df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+    ):
+        """Compute the conformity scores of the models once.
+
+        The models with `prediction_intervals` build their conformal intervals from
+        the errors of `n_windows` forecasts of each serie. This method computes these
+        scores once, from the output of `cross_validation` or from `df`, so that `fit`,
+        `fit_predict` and `forecast` apply them instead of computing them on every call.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame or polars.DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+            If None and `cv_df` is None, the `StatsForecast` class should have been instantiated
+            using `df`.
+        cv_df : pandas.DataFrame or polars.DataFrame, optional (default=None)
+            Output of `cross_validation` with the horizon `h` of the prediction intervals and
+            at least their `n_windows` windows. The scores are the absolute errors of the last ones.
+        sort_df : bool (default=True)
+            If True, sort `df` by [`unique_id`,`ds`].
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+
+        Returns
+        -------
+        self : StatsForecast
+            Returns with the conformity scores of each serie and model stored in `conformity_scores_`.
+        """
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        if all(getattr(m, "prediction_intervals", None) is None for m in self.models):
+            raise ValueError(
+                "You must set `prediction_intervals` to compute the conformity scores."
+            )
+        if cv_df is not None:
+            self._cs_uids, self.conformity_scores_ = _cv_conformity_scores(
+                cv_df, self.models
             )
-        if len(np.unique(self.last_dates)) == 1:
-            dates = np.tile(last_date_f(self.last_dates[0]), len(self.ga))
+            return self
+        self._prepare_fit(df, sort_df)
+        if self.n_jobs == 1:
+            self.conformity_scores_ = self.ga.conformity_scores(self.models)
         else:
-            dates = np.hstack([last_date_f(last_date) for last_date in self.last_dates])
-        u_id_ser: Union[pd.Series, pl.Series] = np.repeat(self.uids, h)
+            self.conformity_scores_ = self._conformity_scores_parallel()
+        self._cs_uids = self.uids
+        return self
+
+    def _get_cs(self, uids=None, ga=None):
+        # conformity scores computed by `calibrate` for the current series,
+        # matched by their ids or by position if `uids` is None
+        if not hasattr(self, "conformity_scores_"):
+            return None
+        if uids is None:
+            ga = self.ga if ga is None else ga
+            if len(self.conformity_scores_) != len(ga):
+                raise ValueError(
+                    f"The conformity scores were computed for {len(self.conformity_scores_)} series, "
+                    f"but got {len(ga)}."
+                )
+            return self.conformity_scores_
+        series = self._cs_uids.get_indexer(uids)
+        if (series == -1).any():
+            missing = uids[series == -1].tolist()
+            raise ValueError(
+                f"The conformity scores of the following series were not computed: {reprlib.repr(missing)}"
+            )
+        return self.conformity_scores_[series]
+
+    def _models_state(self):
+        # identifies the models in the keys of the cache, `cross_validation`
+        # can fit the templates in `self.models` so they aren't used directly
+        return (
+            [_model_state(model) for model in self.models],
+            _model_state(self.fallback_model),
+        )
+
+    def _split_fm(self, fm, bounds, ga=None):
+        # splits an array with a row for each serie (or None) in chunks
+        if fm is None:
+            return itertools.repeat(None)
+        ga = self.ga if ga is None else ga
+        return ga.split_fm(fm, bounds=bounds)
+
+    def _run_cached(self, config, run, X=None, cs=None):
+        # `run(ga, X, cs)` computes the outputs of each serie of `ga`, it only receives
+        # the series that aren't in the cache, once for each group of identical series.
+        # returns the pickled outputs of every serie
+        keys = _series_keys(self.ga, X, config, cs)
+        first_idxs: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            first_idxs.setdefault(key, i)
+        outputs = {key: self._cache.get(key) for key in first_idxs}
+        missing = [key for key, out in outputs.items() if out is None]
+        if missing:
+            idxs = np.array([first_idxs[key] for key in missing])
+            new_outputs = run(
+                self.ga.take(idxs),
+                None if X is None else X.take(idxs),
+                None if cs is None else cs[idxs],
+            )
+            for key, out in zip(missing, new_outputs):
+                outputs[key] = pickle.dumps(out)
+                self._cache.set(key, outputs[key])
+            self._cache.evict()
+        return [outputs[key] for key in keys]
+
+    def _get_init_fm(self, prev_fit):
+        # previously fitted models of the current series that the models with
+        # `warm_start=True` or `reselect_every > 1` use as their starting point
+        reuse = [
+            getattr(model, "warm_start", False)
+            or getattr(model, "reselect_every", 1) > 1
+            for model in self.models
+        ]
+        if prev_fit is None or not any(reuse):
+            return None
+        uids, fitted = prev_fit
+        if fitted.shape[1] != len(self.models):
+            return None
+        series = uids.get_indexer(self.uids)
+        init_fm = np.full((len(self.uids), len(self.models)), None, dtype=object)
+        for i_model, model in enumerate(self.models):
+            if not reuse[i_model]:
+                continue
+            for i, prev_i in enumerate(series):
+                # series that weren't fitted or used the fallback model start from scratch
+                if prev_i != -1 and type(fitted[prev_i, i_model]) is type(model):
+                    init_fm[i, i_model] = fitted[prev_i, i_model]
+        return init_fm
+
+    def _make_future_df(self, h: int, series: slice = slice(None)):
+        dates = _future_dates(self.last_dates[series], self.freq, h)
+        u_id_ser: Union[pd.Series, pl.Series] = np.repeat(self.uids[series], h)
         unique_id: np.ndarray = u_id_ser.to_numpy()
 
         # In older versions to_numpy converts string values into object,
@@ -1037,15 +1929,19 @@ class _StatsForecast:
                 "You must specify `level` when using `prediction_intervals`"
             )
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        fitted = getattr(self, "fitted_", None)
+        prev_fit = (self.uids, fitted) if fitted is not None else None
         self._prepare_fit(df, sort_df)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        cs = self._get_cs(self.uids)
+        init_fm = self._get_init_fm(prev_fit)
         if self.n_jobs == 1:
             self.fitted_, fcsts, cols = self.ga.fit_predict(
-                models=self.models, h=h, X=X, level=level
+                models=self.models, h=h, X=X, level=level, cs=cs, init_fm=init_fm
             )
         else:
             self.fitted_, fcsts, cols = self._fit_predict_parallel(
-                h=h, X=X, level=level
+                h=h, X=X, level=level, cs=cs, init_fm=init_fm
             )
         fcsts_df = self._make_future_df(h=h)
         fcsts_df[cols] = fcsts
@@ -1095,8 +1991,26 @@ class _StatsForecast:
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         self._prepare_fit(df, sort_df)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        cs = self._get_cs(self.uids)
+        if self._cache is not None:
+            res_fcsts = self._forecast_cached(
+                h=h, fitted=fitted, X=X, level=level, cs=cs
+            )
+        else:
+            res_fcsts = self._forecast_ga(
+                self.ga, h=h, fitted=fitted, X=X, level=level, cs=cs
+            )
+        if fitted:
+            self.fcst_fitted_values_ = res_fcsts["fitted"]
+        fcsts = res_fcsts["forecasts"]
+        cols = res_fcsts["cols"]
+        fcsts_df = self._make_future_df(h=h)
+        fcsts_df[cols] = fcsts
+        return fcsts_df
+
+    def _forecast_ga(self, ga, h, fitted, X, level, cs=None):
         if self.n_jobs == 1:
-            res_fcsts = self.ga.forecast(
+            return ga.forecast(
                 models=self.models,
                 h=h,
                 fallback_model=self.fallback_model,
@@ -1104,16 +2018,212 @@ class _StatsForecast:
                 X=X,
                 level=level,
                 verbose=self.verbose,
+                cs=cs,
             )
-        else:
-            res_fcsts = self._forecast_parallel(h=h, fitted=fitted, X=X, level=level)
+        return self._forecast_parallel(
+            h=h, fitted=fitted, X=X, level=level, cs=cs, ga=ga
+        )
+
+    def _forecast_cached(self, h, fitted, X, level, cs=None):
+        def run(ga, X, cs):
+            res = self._forecast_ga(ga, h=h, fitted=fitted, X=X, level=level, cs=cs)
+            fcsts = np.split(res["forecasts"], len(ga))
+            if not fitted:
+                return [(fcsts_i, res["cols"]) for fcsts_i in fcsts]
+            fitted_vals = np.split(res["fitted"]["values"], ga.indptr[1:-1])
+            return [
+                (fcsts_i, res["cols"], fitted_i, res["fitted"]["cols"])
+                for fcsts_i, fitted_i in zip(fcsts, fitted_vals)
+            ]
+
+        outputs = self._run_cached(
+            config=("forecast", self._models_state(), h, fitted, level),
+            run=run,
+            X=X,
+            cs=cs,
+        )
+        outputs = [pickle.loads(out) for out in outputs]
+        result = {
+            "forecasts": np.vstack([out[0] for out in outputs]),
+            "cols": outputs[0][1],
+        }
         if fitted:
-            self.fcst_fitted_values_ = res_fcsts["fitted"]
-        fcsts = res_fcsts["forecasts"]
-        cols = res_fcsts["cols"]
-        fcsts_df = self._make_future_df(h=h)
-        fcsts_df[cols] = fcsts
-        return fcsts_df
+            result["fitted"] = {
+                "values": np.vstack([out[2] for out in outputs]),
+                "cols": outputs[0][3],
+            }
+        return result
+
+    def forecast_arrays(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        X: Optional[np.ndarray] = None,
+        X_future: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+    ):
+        """Memory Efficient predictions from arrays.
+
+        Analogous to `forecast` but works on the series values directly,
+        skipping the construction of DataFrames for the inputs and outputs.
+
+        Parameters
+        ----------
+        y : numpy.ndarray
+            Values of all the series stacked one after the other, can be memory mapped.
+        indptr : numpy.ndarray
+            Boundaries of the series, the i-th serie is `y[indptr[i] : indptr[i + 1]]`.
+        h : int
+            Forecast horizon.
+        X : numpy.ndarray, optional (default=None)
+            Exogenous variables with one row for each value of `y`.
+        X_future : numpy.ndarray, optional (default=None)
+            Future exogenous variables with `h` rows for each serie.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+
+        Returns
+        -------
+        fcsts : numpy.ndarray
+            Array of shape (`len(indptr) - 1` * `h`, n_cols) with the forecasts of each serie.
+        cols : List[str]
+            Names of the columns of `fcsts`.
+        """
+        y = np.asarray(y, dtype=np.float64)
+        if y.ndim != 1:
+            raise ValueError(
+                f"Expected y to be 1 dimensional, but got {y.ndim} dimensions"
+            )
+        indptr = np.asarray(indptr)
+        if (
+            indptr.ndim != 1
+            or indptr.size == 0
+            or indptr[0] != 0
+            or indptr[-1] != y.size
+            or np.any(np.diff(indptr) < 0)
+        ):
+            raise ValueError(
+                "indptr must start at 0, be non-decreasing and end at the size of y"
+            )
+        if (X is None) != (X_future is None):
+            raise ValueError("X and X_future must be provided together")
+        X_future_ga = None
+        if X is None:
+            data = y
+        else:
+            X = np.asarray(X, dtype=np.float64).reshape(y.size, -1)
+            data = np.empty((y.size, 1 + X.shape[1]), order="F")
+            data[:, 0] = y
+            data[:, 1:] = X
+            n_series = len(indptr) - 1
+            X_future = np.asarray(X_future, dtype=np.float64)
+            expected_shape = (h * n_series, X.shape[1])
+            if X_future.shape != expected_shape:
+                raise ValueError(
+                    f"Expected X_future to have shape {expected_shape}, but got {X_future.shape}"
+                )
+            X_future_ga = GroupedArray(
+                X_future, np.arange(0, h * (n_series + 1), h, dtype=np.int32)
+            )
+        levels = tuple() if level is None else level
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        # the arrays aren't stored, so the series of a previous fit are kept
+        ga = GroupedArray(data, indptr)
+        self.n_jobs = _get_n_jobs(len(ga), self.n_jobs)
+        cs = self._get_cs(ga=ga)
+        if self.n_jobs == 1:
+            res_fcsts = ga.forecast(
+                models=self.models,
+                h=h,
+                fallback_model=self.fallback_model,
+                X=X_future_ga,
+                level=levels,
+                verbose=self.verbose,
+                cs=cs,
+            )
+        else:
+            res_fcsts = self._forecast_parallel(
+                h=h, fitted=False, X=X_future_ga, level=levels, cs=cs, ga=ga
+            )
+        return res_fcsts["forecasts"], res_fcsts["cols"]
+
+    def forecast_iter(
+        self,
+        h: int,
+        df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
+        X_df: Optional[Union[pd.DataFrame, pl.DataFrame]] = None,
+        level: Optional[List[int]] = None,
+        chunk_size: int = 1_000,
+        sort_df: bool = True,
+        prediction_intervals: Optional[ConformalIntervals] = None,
+    ):
+        """Memory Efficient predictions by chunks of series.
+
+        Generator version of `StatsForecast.forecast` that yields the forecasts
+        of `chunk_size` series at a time, as soon as each chunk is done,
+        so they can be stored and released before computing the rest.
+
+        Parameters
+        ----------
+        h : int
+            Forecast horizon.
+        df : pandas.DataFrame | polars.DataFrame, optional (default=None)
+            DataFrame with columns [`unique_id`, `ds`, `y`] and exogenous.
+            If None, the `StatsForecast` class should have been instantiated
+            using `df`.
+        X_df : pandas.DataFrame | polars.DataFrame, optional (default=None)
+            DataFrame with [`unique_id`, `ds`] columns and `df`'s future exogenous.
+        level : List[float], optional (default=None)
+            Confidence levels between 0 and 100 for prediction intervals.
+        chunk_size : int (default=1_000)
+            Number of series in each chunk.
+        sort_df : bool (default=True)
+            If True, sort `df` by [`unique_id`,`ds`].
+        prediction_intervals : ConformalIntervals, optional (default=None)
+            Configuration to calibrate prediction intervals (Conformal Prediction).
+
+        Returns
+        -------
+        fcsts_iter : Iterator of pandas.DataFrame | polars.DataFrame
+            DataFrames with `models` columns for point predictions and probabilistic
+            predictions of the series in each chunk, in the same order as `forecast`.
+        """
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        self._set_prediction_intervals(prediction_intervals=prediction_intervals)
+        self._prepare_fit(df, sort_df)
+        X, level = self._parse_X_level(h=h, X=X_df, level=level)
+        bounds = np.append(np.arange(0, len(self.ga), chunk_size), len(self.ga))
+        if X is None:
+            Xs = itertools.repeat(None)
+        else:
+            Xs = X.split(bounds=bounds)
+        css = self._split_fm(self._get_cs(self.uids), bounds)
+        if self.n_jobs == 1:
+            results = (
+                self.ga[start:end].forecast(
+                    models=self.models,
+                    h=h,
+                    fallback_model=self.fallback_model,
+                    X=X_,
+                    level=level,
+                    verbose=self.verbose,
+                    cs=cs_,
+                )
+                for start, end, X_, cs_ in zip(bounds[:-1], bounds[1:], Xs, css)
+            )
+        else:
+            results = self._forecast_iter_parallel(
+                h=h, Xs=Xs, level=level, bounds=bounds, css=css
+            )
+        for start, end, res in zip(bounds[:-1], bounds[1:], results):
+            fcsts_df = self._make_future_df(h=h, series=slice(start, end))
+            fcsts_df[res["cols"]] = res["forecasts"]
+            yield fcsts_df
 
     def forecast_fitted_values(self):
         """Access insample predictions.
@@ -1138,7 +2248,9 @@ class _StatsForecast:
         cols = self.fcst_fitted_values_["cols"]
         if self.engine == pd.DataFrame:
             df = self.engine(
-                self.fcst_fitted_values_["values"], columns=cols, index=self.ds
+                self.fcst_fitted_values_["values"],
+                columns=cols,
+                index=self._fitted_index(),
             ).reset_index(level=1)
         elif self.engine == pl.DataFrame:
             df = self.engine({"unique_id": self.og_unique_id, "ds": self.og_dates})
@@ -1155,7 +2267,7 @@ class _StatsForecast:
         input_size: Optional[int] = None,
         level: Optional[List[int]] = None,
         fitted: bool = False,
-        refit: bool = True,
+        refit: Union[bool, int] = True,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
     ):
@@ -1188,8 +2300,10 @@ class _StatsForecast:
             Confidence levels between 0 and 100 for prediction intervals.
         fitted : bool (default=False)
             Wether or not returns insample predictions.
-        refit : bool (default=True)
+        refit : bool or int (default=True)
             Wether or not refit the model for each window.
+            If int, train the models every `refit` windows and apply them
+            to the windows in between with their `forward` method.
         sort_df : bool (default=True)
             If True, sort `df` by `unique_id` and `ds`.
         prediction_intervals : ConformalIntervals, optional (default=None)
@@ -1215,6 +2329,7 @@ class _StatsForecast:
             raise ValueError(
                 "You must specify `level` when using `prediction_intervals`"
             )
+        _check_refit(refit)
         self._set_prediction_intervals(prediction_intervals=prediction_intervals)
         self._prepare_fit(df, sort_df)
         series_sizes = np.diff(self.ga.indptr)
@@ -1290,9 +2405,7 @@ class _StatsForecast:
         """
         if not hasattr(self, "cv_fitted_values_"):
             raise Exception("Please run `cross_validation` mehtod using `fitted=True`")
-        index = pd.MultiIndex.from_tuples(
-            np.tile(self.ds, self.n_cv_), names=["unique_id", "ds"]
-        )
+        index = self._fitted_index(self.n_cv_)
         df = pd.DataFrame(index=index)
         df["cutoff"] = self.cv_fitted_values_["last_idxs"].flatten(order="F")
         df[self.cv_fitted_values_["cols"]] = np.reshape(
@@ -1306,45 +2419,268 @@ class _StatsForecast:
             df = pl.from_pandas(df, include_index=True)
         return df
 
+    def _parquet_batches(self, path, batch_size):
+        # yields DataFrames with the complete series of about `batch_size` rows,
+        # the dataset must be partitioned or sorted by `unique_id`
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format="parquet", partitioning="hive")
+        pending = []
+        n_pending = 0
+        for batch in dataset.to_batches(batch_size=batch_size):
+            pending.append(batch.to_pandas())
+            n_pending += batch.num_rows
+            if n_pending < batch_size:
+                continue
+            df = pd.concat(pending, ignore_index=True)
+            # the last serie can continue in the next batch
+            is_last = (df["unique_id"] == df["unique_id"].iloc[-1]).to_numpy()
+            pending = [df[is_last]]
+            n_pending = is_last.sum()
+            if not is_last.all():
+                yield df[~is_last]
+        if n_pending:
+            yield pd.concat(pending, ignore_index=True)
+
+    def _run_parquet(self, method, path, output_path, batch_size, kwargs):
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+        files = []
+        for i, df in enumerate(self._parquet_batches(path, batch_size)):
+            res = getattr(self, method)(df=df, **kwargs)
+            files.append(output_path / f"part-{i}.parquet")
+            res.reset_index().to_parquet(files[-1], index=False)
+        return files
+
+    def forecast_parquet(
+        self,
+        path: Union[Path, str],
+        output_path: Union[Path, str],
+        batch_size: int = 1_000_000,
+        **kwargs: Any,
+    ):
+        """Out of core predictions of a Parquet dataset.
+
+        Reads the dataset in batches of complete series, computes their forecasts
+        with `StatsForecast.forecast` and writes them to `output_path`, so the panel
+        doesn't need to fit in memory.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Parquet file or directory with the dataset, with columns [`unique_id`, `ds`, `y`]
+            and exogenous. It must be partitioned or sorted by `unique_id`.
+        output_path : str or pathlib.Path
+            Directory where the forecasts of each batch are written as `part-{i}.parquet`.
+        batch_size : int (default=1_000_000)
+            Approximate number of rows of each batch.
+        **kwargs
+            Arguments of `StatsForecast.forecast`, e.g. `h` and `level`.
+
+        Returns
+        -------
+        files : List[pathlib.Path]
+            Files written to `output_path`.
+        """
+        return self._run_parquet("forecast", path, output_path, batch_size, kwargs)
+
+    def cross_validation_parquet(
+        self,
+        path: Union[Path, str],
+        output_path: Union[Path, str],
+        batch_size: int = 1_000_000,
+        **kwargs: Any,
+    ):
+        """Out of core cross validation of a Parquet dataset.
+
+        Reads the dataset in batches of complete series, computes their cross validation
+        with `StatsForecast.cross_validation` and writes it to `output_path`, so the panel
+        doesn't need to fit in memory.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Parquet file or directory with the dataset, with columns [`unique_id`, `ds`, `y`]
+            and exogenous. It must be partitioned or sorted by `unique_id`.
+        output_path : str or pathlib.Path
+            Directory where the results of each batch are written as `part-{i}.parquet`.
+        batch_size : int (default=1_000_000)
+            Approximate number of rows of each batch.
+        **kwargs
+            Arguments of `StatsForecast.cross_validation`, e.g. `h` and `n_windows`.
+
+        Returns
+        -------
+        files : List[pathlib.Path]
+            Files written to `output_path`.
+        """
+        return self._run_parquet(
+            "cross_validation", path, output_path, batch_size, kwargs
+        )
+
     def _get_pool(self):
-        from multiprocessing import Pool
+        if self.backend == "threads":
+            from multiprocessing.pool import ThreadPool as Pool
+        else:
+            from multiprocessing import Pool
 
         pool_kwargs = dict()
         return Pool, pool_kwargs
 
-    def _fit_parallel(self):
-        gas = self.ga.split(self.n_jobs)
+    def start(self, max_tasks_per_child: Optional[int] = None):
+        """Start a pool of workers that is reused across calls.
+
+        By default every parallel call to `fit`, `predict`, `fit_predict`, `forecast`
+        and `cross_validation` creates its own pool, which pays the startup
+        of the workers (and the compilation of the models) each time.
+        After calling this method the same workers serve all the calls
+        until `StatsForecast.close` is called. The class can also be used as a
+        context manager, which starts the pool on enter and closes it on exit.
+
+        Parameters
+        ----------
+        max_tasks_per_child : int, optional (default=None)
+            Number of chunks a worker process handles before being replaced
+            by a new one, useful to bound the memory of long lived workers.
+            If None, workers live as long as the pool.
+            Only used with the 'processes' backend.
+
+        Returns
+        -------
+        self : StatsForecast
+            `StatsForecast` with a running pool.
+        """
+        if self._pool is not None:
+            raise ValueError(
+                "The pool is already running, call `close` before starting a new one."
+            )
+        Pool, pool_kwargs = self._get_pool()
+        if self.backend == "processes":
+            pool_kwargs["maxtasksperchild"] = max_tasks_per_child
+        n_jobs = cpu_count() if self.n_jobs in (-1, None) else self.n_jobs
+        self._pool = Pool(n_jobs, **pool_kwargs)
+        return self
+
+    def close(self):
+        """Stop the pool started by `StatsForecast.start`."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        # the pool can't be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        # objects saved before these attributes existed
+        state.setdefault("backend", "processes")
+        state.setdefault("_pool", None)
+        state.setdefault("_cache", None)
+        self.__dict__.update(state)
+
+    @contextmanager
+    def _executor(self):
+        if self._pool is not None:
+            yield self._pool
+            return
         Pool, pool_kwargs = self._get_pool()
         with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga in gas:
-                future = executor.apply_async(
-                    ga.fit, (self.models, self.fallback_model)
-                )
-                futures.append(future)
-            fm = np.vstack([f.get() for f in futures])
+            yield executor
+
+    @contextmanager
+    def _split_ga(self, bounds, ga=None, out=None):
+        # the threads share the series and the outputs, the processes memory map
+        # them from a temporary directory instead of getting a copy
+        ga = self.ga if ga is None else ga
+        if self.backend == "threads":
+            yield _GroupedArrayChunk.split(ga, bounds, out)
+            return
+        with tempfile.TemporaryDirectory() as path:
+            yield _GroupedArrayChunk.split(ga, bounds, out, path)
+
+    def _apply_chunks(self, executor, bounds, tasks, ga=None, out=None):
+        # the most expensive chunks are submitted first so that the cheaper ones
+        # fill the gaps at the end, their outputs are written into the rows of `out`
+        ga = self.ga if ga is None else ga
+        cost = np.diff(ga.indptr[bounds])
+        futures = {}
+        for i in np.argsort(-cost, kind="stable"):
+            func, args = tasks[i]
+            futures[i] = executor.apply_async(func, args)
+        return _gather_outputs(out, [futures[i].get() for i in range(len(tasks))])
+
+    def _fcsts_output(self, ga, bounds, models, attr, h, X, level, n_windows=None):
+        # preallocated forecasts of all the series, with h rows for each serie
+        # and window, and the actual values in the first column of cross validation
+        cuts, _ = ga._get_cols(models=models, attr=attr, h=h, X=X, level=level)
+        n_rows = h if n_windows is None else n_windows * h
+        n_cols = cuts[-1] if n_windows is None else 1 + cuts[-1]
+        return _OutputArray((ga.n_groups * n_rows, n_cols), np.float32, n_rows * bounds)
+
+    def _fit_parallel(self, cs=None, init_fm=None, ga=None):
+        ga = self.ga if ga is None else ga
+        bounds = _get_chunk_bounds(ga.indptr, self.n_jobs)
+        css = self._split_fm(cs, bounds)
+        init_fms = self._split_fm(init_fm, bounds)
+        out = _OutputArray((ga.n_groups, len(self.models)), object, bounds)
+        with self._split_ga(bounds, ga, out) as gas, self._executor() as executor:
+            tasks = [
+                (ga_.fit, (self.models, self.fallback_model, cs_, init_fm_))
+                for ga_, cs_, init_fm_ in zip(gas, css, init_fms)
+            ]
+            fm = self._apply_chunks(executor, bounds, tasks, ga, out)
+        return fm
+
+    def _conformity_scores_parallel(self):
+        bounds = _get_chunk_bounds(self.ga.indptr, self.n_jobs)
+        out = _OutputArray((self.ga.n_groups, len(self.models)), object, bounds)
+        with self._split_ga(bounds, out=out) as gas, self._executor() as executor:
+            tasks = [(ga.conformity_scores, (self.models,)) for ga in gas]
+            cs = self._apply_chunks(executor, bounds, tasks, out=out)
+        return cs
+
+    def _update_parallel(self, ga, fm):
+        bounds = _get_chunk_bounds(ga.indptr, self.n_jobs)
+        fms = ga.split_fm(fm, bounds=bounds)
+        out = _OutputArray(fm.shape, object, bounds)
+        with self._split_ga(bounds, ga, out) as gas, self._executor() as executor:
+            tasks = [(ga_.update, (fm_,)) for ga_, fm_ in zip(gas, fms)]
+            fm = self._apply_chunks(executor, bounds, tasks, ga, out)
         return fm
 
-    def _get_gas_Xs(self, X):
-        gas = self.ga.split(self.n_jobs)
+    def _get_Xs(self, X, bounds):
         if X is not None:
-            Xs = X.split(self.n_jobs)
+            Xs = X.split(bounds=bounds)
         else:
             from itertools import repeat
 
             Xs = repeat(None)
-        return gas, Xs
+        return Xs
 
     def _predict_parallel(self, h, X, level):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        fms = self.ga.split_fm(self.fitted_, self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _get_chunk_bounds(self.ga.indptr, self.n_jobs)
+        Xs = self._get_Xs(X=X, bounds=bounds)
+        fms = self.ga.split_fm(self.fitted_, bounds=bounds)
+        out = (
+            self._fcsts_output(
+                self.ga, bounds, self.fitted_[0], "predict", h, X, level
+            ),
+            None,
+        )
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga, fm, X_ in zip(gas, fms, Xs):
-                future = executor.apply_async(
+        with self._split_ga(bounds, out=out) as gas, self._executor() as executor:
+            tasks = [
+                (
                     ga.predict,
                     (
                         fm,
@@ -1353,49 +2689,50 @@ class _StatsForecast:
                         level,
                     ),
                 )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts, cols = list(zip(*out))
-            fcsts = np.vstack(fcsts)
-            cols = cols[0]
+                for ga, fm, X_ in zip(gas, fms, Xs)
+            ]
+            fcsts, cols = self._apply_chunks(executor, bounds, tasks, out=out)
         return fcsts, cols
 
-    def _fit_predict_parallel(self, h, X, level):
+    def _fit_predict_parallel(self, h, X, level, cs=None, init_fm=None):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _get_chunk_bounds(self.ga.indptr, self.n_jobs)
+        Xs = self._get_Xs(X=X, bounds=bounds)
+        css = self._split_fm(cs, bounds)
+        init_fms = self._split_fm(init_fm, bounds)
+        out = (
+            _OutputArray((self.ga.n_groups, len(self.models)), object, bounds),
+            self._fcsts_output(self.ga, bounds, self.models, "predict", h, X, level),
+            None,
+        )
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga, X_ in zip(gas, Xs):
-                future = executor.apply_async(
-                    ga.fit_predict,
-                    (
-                        self.models,
-                        h,
-                        X_,
-                        level,
-                    ),
-                )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fm, fcsts, cols = list(zip(*out))
-            fm = np.vstack(fm)
-            fcsts = np.vstack(fcsts)
-            cols = cols[0]
+        with self._split_ga(bounds, out=out) as gas, self._executor() as executor:
+            tasks = [
+                (ga.fit_predict, (self.models, h, X_, level, cs_, init_fm_))
+                for ga, X_, cs_, init_fm_ in zip(gas, Xs, css, init_fms)
+            ]
+            fm, fcsts, cols = self._apply_chunks(executor, bounds, tasks, out=out)
         return fm, fcsts, cols
 
-    def _forecast_parallel(self, h, fitted, X, level):
+    def _forecast_parallel(self, h, fitted, X, level, cs=None, ga=None):
         # create elements for each core
-        gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
+        ga = self.ga if ga is None else ga
+        bounds = _get_chunk_bounds(ga.indptr, self.n_jobs)
+        Xs = self._get_Xs(X=X, bounds=bounds)
+        css = self._split_fm(cs, bounds, ga)
+        fcsts_out = self._fcsts_output(ga, bounds, self.models, "forecast", h, X, level)
+        out = {"forecasts": fcsts_out}
+        if fitted:
+            # a row for each observation, with the actual values in the first column
+            fitted_shape = (ga.data.shape[0], 1 + fcsts_out.shape[1])
+            out["fitted"] = {
+                "values": _OutputArray(fitted_shape, np.float32, ga.indptr[bounds])
+            }
         # compute parallel forecasts
-        result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga, X_ in zip(gas, Xs):
-                future = executor.apply_async(
-                    ga.forecast,
+        with self._split_ga(bounds, ga, out) as gas, self._executor() as executor:
+            tasks = [
+                (
+                    ga_.forecast,
                     (
                         self.models,
                         h,
@@ -1403,34 +2740,71 @@ class _StatsForecast:
                         fitted,
                         X_,
                         level,
+                        False,
+                        cs_,
                     ),
                 )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts = [d["forecasts"] for d in out]
-            fcsts = np.vstack(fcsts)
-            cols = out[0]["cols"]
-            result["forecasts"] = fcsts
-            result["cols"] = cols
-            if fitted:
-                result["fitted"] = {}
-                fitted_vals = [d["fitted"]["values"] for d in out]
-                result["fitted"]["values"] = np.vstack(fitted_vals)
-                result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+                for ga_, X_, cs_ in zip(gas, Xs, css)
+            ]
+            result = self._apply_chunks(executor, bounds, tasks, ga, out)
         return result
 
+    def _forecast_iter_parallel(self, h, Xs, level, bounds, css):
+        # at most n_jobs chunks are in flight, the next one is submitted when the
+        # output of the oldest is returned so the outputs don't pile up in memory
+        with self._split_ga(bounds) as gas, self._executor() as executor:
+            tasks = zip(gas, Xs, css)
+
+            def submit(n_tasks):
+                return [
+                    executor.apply_async(
+                        ga.forecast,
+                        (
+                            self.models,
+                            h,
+                            self.fallback_model,
+                            False,
+                            X_,
+                            level,
+                            False,
+                            cs_,
+                        ),
+                    )
+                    for ga, X_, cs_ in itertools.islice(tasks, n_tasks)
+                ]
+
+            futures = submit(self.n_jobs)
+            while futures:
+                out = futures.pop(0).get()
+                futures.extend(submit(1))
+                yield out
+
     def _cross_validation_parallel(
         self, h, test_size, step_size, input_size, fitted, level, refit
     ):
         # create elements for each core
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        bounds = _get_chunk_bounds(self.ga.indptr, self.n_jobs)
+        n_windows = int((test_size - h) / step_size) + 1
+        out = {
+            "forecasts": self._fcsts_output(
+                self.ga, bounds, self.models, "forecast", h, None, level, n_windows
+            )
+        }
+        if fitted:
+            # the fitted values of each window have a row for each observation
+            n_obs = self.ga.data.shape[0]
+            obs_bounds = self.ga.indptr[bounds]
+            out["fitted"] = {
+                "values": _OutputArray(
+                    (n_obs, n_windows, len(self.models) + 1), np.float32, obs_bounds
+                ),
+                "idxs": _OutputArray((n_obs, n_windows), bool, obs_bounds),
+                "last_idxs": _OutputArray((n_obs, n_windows), bool, obs_bounds),
+            }
         # compute parallel forecasts
-        result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga in gas:
-                future = executor.apply_async(
+        with self._split_ga(bounds, out=out) as gas, self._executor() as executor:
+            tasks = [
+                (
                     ga.cross_validation,
                     (
                         self.models,
@@ -1444,23 +2818,9 @@ class _StatsForecast:
                         refit,
                     ),
                 )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts = [d["forecasts"] for d in out]
-            fcsts = np.vstack(fcsts)
-            cols = out[0]["cols"]
-            result["forecasts"] = fcsts
-            result["cols"] = cols
-            if fitted:
-                result["fitted"] = {}
-                result["fitted"]["values"] = np.concatenate(
-                    [d["fitted"]["values"] for d in out]
-                )
-                for key in ["last_idxs", "idxs"]:
-                    result["fitted"][key] = np.concatenate(
-                        [d["fitted"][key] for d in out]
-                    )
-                result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+                for ga in gas
+            ]
+            result = self._apply_chunks(executor, bounds, tasks, out=out)
         return result
 
     @staticmethod
@@ -1555,6 +2915,8 @@ class _StatsForecast:
         path: Optional[Union[Path, str]] = None,
         max_size: Optional[str] = None,
         trim: bool = False,
+        format: str = "pickle",
+        compress: bool = False,
     ):
         """Function that will save StatsForecast class with certain settings to make it
         reproducible.
@@ -1562,22 +2924,26 @@ class _StatsForecast:
         Parameters
         ----------
         path : str or pathlib.Path, optional (default=None)
-            Path of the file to be saved. If `None` will create one in the current
+            Path of the file, or directory for the 'columnar' format, to be saved.
+            If `None` will create one in the current
             directory using the current UTC timestamp.
         max_size : str, optional (default = None)
             StatsForecast object should not exceed this size.
             Available byte naming: ['B', 'KB', 'MB', 'GB']
         trim : bool (default = False)
             Delete any attributes not needed for inference.
+        format : str (default='pickle')
+            'pickle' saves the pickled object to a single file. 'columnar' saves to a
+            directory the numeric arrays of the object and of the fitted models of each
+            model concatenated by dtype, which `load` memory maps.
+        compress : bool (default=False)
+            Compress the arrays of the 'columnar' format. Compressed arrays can't be
+            memory mapped, so `load` reads them. `max_size` is checked against the
+            uncompressed size.
         """
         # Will be used to find the size of the fitted models
         # Never expecting anything higher than GB (even that's a lot')
-        bytes_hmap = {
-            "B": 1,
-            "KB": 2**10,
-            "MB": 2**20,
-            "GB": 2**30,
-        }
+        bytes_hmap = _BYTE_UNITS
 
         # Removing unnecessary attributes
         # @jmoralez decide future implementation
@@ -1587,7 +2953,14 @@ class _StatsForecast:
                 # remove unnecessary attributes here
                 self.__dict__.pop(attr, None)
 
-        sf_size = len(pickle.dumps(self))
+        if format == "pickle":
+            data = pickle.dumps(self)
+            sf_size = len(data)
+        elif format == "columnar":
+            parts = self._columnar_parts()
+            sf_size = sum(part.nbytes for part in parts.values())
+        else:
+            raise ValueError(f"format must be 'pickle' or 'columnar', got '{format}'.")
 
         if max_size is not None:
             cap_size = self._get_cap_size(max_size, bytes_hmap)
@@ -1611,12 +2984,40 @@ class _StatsForecast:
 
         if path is None:
             datetime_record = dt.datetime.utcnow().strftime("%Y-%m-%d_%H-%M-%S")
-            path = f"StatsForecast_{datetime_record}.pkl"
+            path = f"StatsForecast_{datetime_record}"
+            if format == "pickle":
+                path += ".pkl"
 
-        with open(path, "wb") as m_file:
-            pickle.dump(self, m_file)
+        if format == "pickle":
+            with open(path, "wb") as m_file:
+                m_file.write(data)
+        else:
+            path = Path(path)
+            path.mkdir(parents=True, exist_ok=True)
+            # columns of a previous save to the same directory, other files are kept
+            for file in path.glob("*.np[yz]"):
+                if re.fullmatch(r"(sf|model_\d+)(_\d+\.npy|\.npz)", file.name):
+                    file.unlink()
+            for name, part in parts.items():
+                part.write(path, name, compress)
         print("StatsForecast object saved")
 
+    def _columnar_parts(self):
+        # the object and the fitted models of each model are pickled separately,
+        # so the arrays of each model type are stored in their own columns
+        state = self.__getstate__()
+        fitted = state.pop("fitted_", None)
+        fitted_shape = None if fitted is None else fitted.shape
+        parts = {"sf": (type(self), state, fitted_shape)}
+        if fitted is not None:
+            for i in range(fitted.shape[1]):
+                parts[f"model_{i}"] = list(fitted[:, i])
+        picklers = {}
+        for name, obj in parts.items():
+            picklers[name] = _ColumnsPickler()
+            picklers[name].dump(obj)
+        return picklers
+
     def _get_cap_size(self, max_size, bytes_hmap):
         max_size = max_size.upper().replace(" ", "")
         match = re.match(r"(\d+\.\d+|\d+)(\w+)", max_size)
@@ -1637,7 +3038,7 @@ class _StatsForecast:
         return cap_size
 
     @staticmethod
-    def load(path: Union[Path, str]):
+    def load(path: Union[Path, str], mmap: bool = True):
         """
         Automatically loads the model into ready StatsForecast.
 
@@ -1645,6 +3046,10 @@ class _StatsForecast:
         ----------
         path : str or pathlib.Path
             Path to saved StatsForecast file.
+        mmap : bool (default=True)
+            Memory map the arrays of an object saved with `format='columnar'` instead of
+            reading them, so loading is almost instant and the processes that load the
+            same object share its pages.
 
         Returns
         -------
@@ -1653,13 +3058,27 @@ class _StatsForecast:
         """
         if not Path(path).exists():
             raise ValueError("Specified path does not exist, check again and retry.")
+        if Path(path).is_dir():
+            return _StatsForecast._load_columnar(Path(path), mmap)
         with open(path, "rb") as f:
             return pickle.load(f)
 
+    @staticmethod
+    def _load_columnar(path, mmap):
+        cls, state, fitted_shape = _load_columns(path, "sf", mmap)
+        sf = cls.__new__(cls)
+        sf.__setstate__(state)
+        if fitted_shape is not None:
+            sf.fitted_ = np.empty(fitted_shape, dtype=object)
+            for i in range(fitted_shape[1]):
+                for j, model in enumerate(_load_columns(path, f"model_{i}", mmap)):
+                    sf.fitted_[j, i] = model
+        return sf
+
     def __repr__(self):
         return f"StatsForecast(models=[{','.join(map(repr, self.models))}])"
 
-# %% ../nbs/src/core/core.ipynb 35
+# %% ../nbs/src/core/core.ipynb 47
 class ParallelBackend:
     def forecast(self, df, models, freq, fallback_model=None, **kwargs: Any) -> Any:
         model = _StatsForecast(
@@ -1680,7 +3099,7 @@ class ParallelBackend:
 def make_backend(obj: Any, *args: Any, **kwargs: Any) -> ParallelBackend:
     return ParallelBackend()
 
-# %% ../nbs/src/core/core.ipynb 36
+# %% ../nbs/src/core/core.ipynb 48
 class StatsForecast(_StatsForecast):
     """Train statistical models.
 
@@ -1714,6 +3133,19 @@ class StatsForecast(_StatsForecast):
         Only works with the `forecast` and `cross_validation` methods.
     verbose : bool (default=True)
         Prints TQDM progress bar when `n_jobs=1`.
+    backend : str (default='processes')
+        Executor used when `n_jobs > 1`, either 'processes' or 'threads'.
+        Threads share the series and the compiled models without copying them,
+        but they only run in parallel when the GIL is released
+        (set the `NIXTLA_NUMBA_RELEASE_GIL` environment variable).
+    cache_dir : str or pathlib.Path, optional (default=None)
+        Directory of an on-disk cache of the fitted models and forecasts of each serie,
+        keyed by a hash of its values, its exogenous and the configuration of the models.
+        `fit` and `forecast` only compute the series that aren't in the cache and compute
+        identical series once.
+    cache_max_size : str, optional (default=None)
+        Maximum size of the cache, the least recently used entries are removed when it's exceeded.
+        Available byte naming: ['B', 'KB', 'MB', 'GB']
     """
 
     def forecast(
@@ -1765,7 +3197,7 @@ class StatsForecast(_StatsForecast):
         input_size: Optional[int] = None,
         level: Optional[List[int]] = None,
         fitted: bool = False,
-        refit: bool = True,
+        refit: Union[bool, int] = True,
         sort_df: bool = True,
         prediction_intervals: Optional[ConformalIntervals] = None,
     ):
@@ -1784,6 +3216,7 @@ class StatsForecast(_StatsForecast):
                 prediction_intervals=prediction_intervals,
             )
         assert df is not None
+        _check_refit(refit)
         engine = make_execution_engine(infer_by=[df])
         backend = make_backend(engine)
         return backend.cross_validation(
@@ -1805,5 +3238,6 @@ class StatsForecast(_StatsForecast):
     def _is_native(self, df) -> bool:
         engine = try_get_context_execution_engine()
         return engine is None and (
-            df is None or isinstance(df, pd.DataFrame) or isinstance(df, pl.DataFrame)
+            df is None
+            or isinstance(df, (pd.DataFrame, pl.DataFrame, pa.Table, pa.RecordBatch))
         )
@@ -161,6 +161,8 @@ class FugueBackend(ParallelBackend):
         `freq`: str, frequency of the data, [panda's available frequencies](https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#offset-aliases).<br>
         `models`: List[typing.Any], list of instantiated objects `StatsForecast.models`.<br>
         `fallback_model`: Any, Model to be used if a model fails.<br>
+        `**kwargs`: Additional `core.StatsForecast.cross_validation` parameters. Example `refit=k`
+        trains the models every `k` windows and applies them with `forward` in between.<br>
 
         **Returns:**<br>
         `fcsts_df`: pandas.DataFrame, with `models` columns for point predictions and probabilistic
@@ -6,7 +6,7 @@ __all__ = ['NONE', 'ADD', 'MULT', 'DAMPED', 'TOL', 'HUGEN', 'NA', 'smalno', 'ets
 # %% ../nbs/src/ets.ipynb 1
 import math
 from collections import namedtuple
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from numba import njit
@@ -902,6 +902,7 @@ def etsmodel(
     control=None,
     seed=None,
     trace: bool = False,
+    init_par: Optional[np.ndarray] = None,
 ):
     if seasontype == "N":
         m = 1
@@ -915,6 +916,30 @@ def etsmodel(
         alpha, beta, gamma, phi, trendtype, seasontype, damped, lower, upper, m, bounds
     )
     par_noopt = dict(alpha=alpha, beta=beta, gamma=gamma, phi=phi)
+    if init_par is not None:
+        # start the optimization from the parameters of a previous
+        # fit of the same model instead of the initial heuristics
+        warm_par = par_.copy()
+        for i, pr in enumerate(["alpha", "beta", "gamma", "phi"]):
+            if (
+                np.isnan(par_noopt[pr])
+                and not np.isnan(par_[pr])
+                and not np.isnan(init_par[i])
+            ):
+                warm_par[pr] = init_par[i]
+        if check_param(
+            warm_par["alpha"],
+            warm_par["beta"],
+            warm_par["gamma"],
+            warm_par["phi"],
+            lower,
+            upper,
+            bounds,
+            m,
+        ):
+            par_ = warm_par
+        else:
+            init_par = None
 
     if not np.isnan(par_["alpha"]):
         alpha = par_["alpha"]
@@ -929,6 +954,8 @@ def etsmodel(
     # initialize state
     init_state = initstate(y, m, trendtype, seasontype)
     nstate = len(init_state)
+    if init_par is not None:
+        init_state = init_par[4 : 4 + nstate]
     par_ = {key: val for key, val in par_.items() if not np.isnan(val)}
     par = np.full(len(par_) + nstate, fill_value=np.nan)
     par[: len(par_)] = list(par_.values())
@@ -1082,6 +1109,7 @@ def ets_f(
     allow_multiplicative_trend=False,
     use_initial_values=False,
     maxit=2_000,
+    init_model=None,
 ):
     # converting params to floats
     # to improve numba compilation
@@ -1270,6 +1298,16 @@ def ets_f(
                         continue
                     if stype != "N" and m == 1:
                         continue
+                    components = f"{etype}{ttype}{stype}{'D' if dtype else 'N'}"
+                    if (
+                        init_model is not None
+                        and init_model["components"] == components
+                        and (stype == "N" or init_model["m"] == m)
+                    ):
+                        # warm start from the previous fit of the same model
+                        init_par = init_model["par"]
+                    else:
+                        init_par = None
                     fit = etsmodel(
                         y,
                         m,
@@ -1287,6 +1325,7 @@ def ets_f(
                         nmse=nmse,
                         bounds=bounds,
                         maxit=maxit,
+                        init_par=init_par,
                     )
                     fit_ic = fit[ic]
                     if not np.isnan(fit_ic):
@@ -1642,3 +1681,36 @@ def forecast_ets(obj, h, level=None):
 # %% ../nbs/src/ets.ipynb 45
 def forward_ets(fitted_model, y):
     return ets_f(y=y, m=fitted_model["m"], model=fitted_model)
+
+# %% ../nbs/src/ets.ipynb 49
+def update_ets(fitted_model, y):
+    """Advance the states of a fitted model over the new observations `y` keeping its parameters."""
+    errortype, trendtype, seasontype, dampedtype = fitted_model["components"]
+    alpha, beta, gamma, phi = fitted_model["par"][:4]
+    _, e, states, _ = pegelsresid_C(
+        y=y,
+        m=fitted_model["m"],
+        init_state=fitted_model["states"][-1],
+        errortype=errortype,
+        trendtype=trendtype,
+        seasontype=seasontype,
+        damped=dampedtype != "N",
+        alpha=alpha,
+        beta=beta,
+        gamma=gamma,
+        phi=phi,
+        nmse=1,
+    )
+    if errortype == "A":
+        fits = y - e
+    else:
+        # protect e == -1
+        aux_e = np.copy(e)
+        aux_e[aux_e == -1.0] = -1 + 1e-3
+        fits = y / (1 + aux_e)
+    return {
+        **fitted_model,
+        "residuals": np.append(fitted_model["residuals"], e),
+        "fitted": np.append(fitted_model["fitted"], fits),
+        "states": np.vstack([fitted_model["states"], states[1:]]),
+    }
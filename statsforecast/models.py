@@ -23,11 +23,13 @@ from statsforecast.arima import (
     forecast_arima,
     fitted_arima,
     forward_arima,
+    refit_arima,
+    update_arima,
 )
-from .ces import auto_ces, forecast_ces, forward_ces
-from .ets import ets_f, forecast_ets, forward_ets
+from .ces import auto_ces, forecast_ces, forward_ces, update_ces
+from .ets import ets_f, forecast_ets, forward_ets, update_ets
 from .mstl import mstl
-from .theta import auto_theta, forecast_theta, forward_theta
+from .theta import auto_theta, forecast_theta, forward_theta, update_theta
 from .garch import garch_model, garch_forecast
 from statsforecast.utils import (
     _calculate_sigma,
@@ -56,6 +58,34 @@ def _add_fitted_pi(res, se, level):
     return res
 
 # %% ../nbs/src/core/models.ipynb 9
+def _write_batch_output(
+    out, fitted_out, indptr, mean, sigmah, fitted, fitted_se, level
+):
+    # writes the outputs of the batch kernels using the same
+    # columns order as the dictionaries returned by `forecast`
+    out[:, 0] = mean
+    keys = ["mean"]
+    if level is not None:
+        level = sorted(level)
+        quantiles = _quantiles(level=np.asarray(level))
+        for i, q in enumerate(quantiles):
+            out[:, 1 + i] = mean - q * sigmah
+            out[:, 1 + len(level) + i] = mean + q * sigmah
+        keys += [f"lo-{lv}" for lv in level] + [f"hi-{lv}" for lv in level]
+    keys_fitted = []
+    if fitted_out is not None:
+        fitted_out[:, 0] = fitted
+        keys_fitted = ["fitted"]
+        if level is not None:
+            fitted_se = np.repeat(fitted_se, np.diff(indptr))
+            for i, q in enumerate(quantiles):
+                fitted_out[:, len(level) - i] = fitted - q * fitted_se
+                fitted_out[:, 1 + len(level) + i] = fitted + q * fitted_se
+            keys_fitted += [f"fitted-lo-{lv}" for lv in reversed(level)]
+            keys_fitted += [f"fitted-hi-{lv}" for lv in level]
+    return keys, keys_fitted
+
+# %% ../nbs/src/core/models.ipynb 10
 def _add_conformal_distribution_intervals(
     fcst: Dict,
     cs: np.ndarray,
@@ -84,7 +114,7 @@ def _add_conformal_distribution_intervals(
         fcst[col] = quantiles[i]
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 10
+# %% ../nbs/src/core/models.ipynb 11
 def _get_conformal_method(method: str):
     available_methods = {
         "conformal_distribution": _add_conformal_distribution_intervals,
@@ -97,8 +127,11 @@ def _get_conformal_method(method: str):
         )
     return available_methods[method]
 
-# %% ../nbs/src/core/models.ipynb 11
+# %% ../nbs/src/core/models.ipynb 12
 class _TS:
+    # conformity scores set by `StatsForecast.calibrate`
+    _calibrated_cs: Optional[np.ndarray] = None
+
     def new(self):
         b = type(self).__new__(type(self))
         b.__dict__.update(self.__dict__)
@@ -109,6 +142,9 @@ class _TS:
         y: np.ndarray,
         X: Optional[np.ndarray] = None,
     ) -> np.ndarray:
+        if self._calibrated_cs is not None:
+            # computed once for the serie by `StatsForecast.calibrate`
+            return self._calibrated_cs
         n_windows = self.prediction_intervals.n_windows  # type: ignore[attr-defined]
         step_size = self.prediction_intervals.h  # type: ignore[attr-defined]
         h = self.prediction_intervals.h  # type: ignore[attr-defined]
@@ -145,7 +181,21 @@ class _TS:
     def _add_predict_conformal_intervals(self, fcst, level):
         return self._add_conformal_intervals(fcst=fcst, y=None, X=None, level=level)
 
-# %% ../nbs/src/core/models.ipynb 16
+    def _reused_structure(self):
+        # previous fit whose structure `fit` keeps instead of selecting it again
+        if (
+            hasattr(self, "model_")
+            and self.model_.get("reused_fits", 0) + 1 < self.reselect_every
+        ):
+            return self.model_
+        return None
+
+    def _count_reused_fits(self, prev_model):
+        self.model_["reused_fits"] = (
+            0 if prev_model is None else prev_model.get("reused_fits", 0) + 1
+        )
+
+# %% ../nbs/src/core/models.ipynb 17
 class AutoARIMA(_TS):
     """AutoARIMA model.
 
@@ -228,6 +278,31 @@ class AutoARIMA(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    reselect_every : int (default=1)
+        Number of fits between the selections of the model. The fits in between keep
+        the orders, differences and constant of the last selected model and only
+        estimate its coefficients.
+    n_jobs : int (default=1)
+        Number of candidate models fitted concurrently in the search of each serie,
+        -1 uses all the cores. The selected model doesn't depend on it. A pool is
+        started by each serie, so it's meant for a few long series, it's ignored
+        when the series are fitted in parallel by `StatsForecast`.
+    screen_tol : Optional[float] (default=None)
+        If not None, the non stepwise search first fits all the models by conditional
+        sums of squares and only fits by maximum likelihood the ones whose approximated
+        information criterion is less than `screen_tol` above the best fitted one.
+    optim_method : str (default='BFGS')
+        Method of `scipy.optimize.minimize` used to estimate the coefficients of each
+        model. 'BFGS-numba' runs a compiled BFGS instead, so that a fit doesn't leave numba.
+    steady_tol : float (default=0.0)
+        Change of the state covariance of the Kalman filter under which its gain is kept
+        for the rest of the series, which turns most of the likelihood evaluation into a
+        simple recursion. 0 always updates the covariance.
+    SSinit : str (default='Gardner1980')
+        Method used to compute the initial covariance of the state. 'doubling' solves its
+        Lyapunov equation with the doubling algorithm, which is much faster and uses much
+        less memory for long seasonal periods. It is also more accurate, so its fits will not
+        match the 'Gardner1980' ones exactly.
     """
 
     def __init__(
@@ -265,6 +340,12 @@ class AutoARIMA(_TS):
         season_length: int = 1,
         alias: str = "AutoARIMA",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        reselect_every: int = 1,
+        n_jobs: int = 1,
+        screen_tol: Optional[float] = None,
+        optim_method: str = "BFGS",
+        steady_tol: float = 0.0,
+        SSinit: str = "Gardner1980",
     ):
         self.d = d
         self.D = D
@@ -299,6 +380,12 @@ class AutoARIMA(_TS):
         self.season_length = season_length
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.reselect_every = reselect_every
+        self.n_jobs = n_jobs
+        self.screen_tol = screen_tol
+        self.optim_method = optim_method
+        self.steady_tol = steady_tol
+        self.SSinit = SSinit
 
     def __repr__(self):
         return self.alias
@@ -325,43 +412,64 @@ class AutoARIMA(_TS):
         self :
             AutoARIMA fitted model.
         """
+        prev_model = self._reused_structure()
         with np.errstate(invalid="ignore"):
-            self.model_ = auto_arima_f(
-                x=y,
-                d=self.d,
-                D=self.D,
-                max_p=self.max_p,
-                max_q=self.max_q,
-                max_P=self.max_P,
-                max_Q=self.max_Q,
-                max_order=self.max_order,
-                max_d=self.max_d,
-                max_D=self.max_D,
-                start_p=self.start_p,
-                start_q=self.start_q,
-                start_P=self.start_P,
-                start_Q=self.start_Q,
-                stationary=self.stationary,
-                seasonal=self.seasonal,
-                ic=self.ic,
-                stepwise=self.stepwise,
-                nmodels=self.nmodels,
-                trace=self.trace,
-                approximation=self.approximation,
-                method=self.method,
-                truncate=self.truncate,
-                xreg=X,
-                test=self.test,
-                test_kwargs=self.test_kwargs,
-                seasonal_test=self.seasonal_test,
-                seasonal_test_kwargs=self.seasonal_test_kwargs,
-                allowdrift=self.allowdrift,
-                allowmean=self.allowmean,
-                blambda=self.blambda,
-                biasadj=self.biasadj,
-                period=self.season_length,
-            )
-
+            if prev_model is not None:
+                self.model_ = refit_arima(
+                    prev_model,
+                    y,
+                    xreg=X,
+                    method=self.method,
+                    optim_method=self.optim_method,
+                    steady_tol=self.steady_tol,
+                    SSinit=self.SSinit,
+                )
+                if np.isinf(self.model_.get("ic", 0)):
+                    # the kept structure doesn't fit the new series anymore (a root
+                    # too close to the unit circle), it's selected again
+                    prev_model = None
+            if prev_model is None:
+                self.model_ = auto_arima_f(
+                    x=y,
+                    d=self.d,
+                    D=self.D,
+                    max_p=self.max_p,
+                    max_q=self.max_q,
+                    max_P=self.max_P,
+                    max_Q=self.max_Q,
+                    max_order=self.max_order,
+                    max_d=self.max_d,
+                    max_D=self.max_D,
+                    start_p=self.start_p,
+                    start_q=self.start_q,
+                    start_P=self.start_P,
+                    start_Q=self.start_Q,
+                    stationary=self.stationary,
+                    seasonal=self.seasonal,
+                    ic=self.ic,
+                    stepwise=self.stepwise,
+                    nmodels=self.nmodels,
+                    trace=self.trace,
+                    approximation=self.approximation,
+                    method=self.method,
+                    truncate=self.truncate,
+                    xreg=X,
+                    test=self.test,
+                    test_kwargs=self.test_kwargs,
+                    seasonal_test=self.seasonal_test,
+                    seasonal_test_kwargs=self.seasonal_test_kwargs,
+                    allowdrift=self.allowdrift,
+                    allowmean=self.allowmean,
+                    blambda=self.blambda,
+                    biasadj=self.biasadj,
+                    period=self.season_length,
+                    n_jobs=self.n_jobs,
+                    screen_tol=self.screen_tol,
+                    optim_method=self.optim_method,
+                    steady_tol=self.steady_tol,
+                    SSinit=self.SSinit,
+                )
+        self._count_reused_fits(prev_model)
         self._store_cs(y=y, X=X)
         return self
 
@@ -493,6 +601,11 @@ class AutoARIMA(_TS):
                 blambda=self.blambda,
                 biasadj=self.biasadj,
                 period=self.season_length,
+                n_jobs=self.n_jobs,
+                screen_tol=self.screen_tol,
+                optim_method=self.optim_method,
+                steady_tol=self.steady_tol,
+                SSinit=self.SSinit,
             )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
@@ -569,7 +682,36 @@ class AutoARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 31
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted AutoARIMA model with new observations.
+
+        Advances the state of the fitted model over the new observations `y`
+        keeping its parameters fixed, so the next call to `predict` starts from
+        the last new observation.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x) for the new observations.
+
+        Returns
+        -------
+        self :
+            AutoARIMA updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        with np.errstate(invalid="ignore"):
+            self.model_ = update_arima(self.model_, y=y, xreg=X)
+        return self
+
+# %% ../nbs/src/core/models.ipynb 36
 class AutoETS(_TS):
     """Automatic Exponential Smoothing model.
 
@@ -607,6 +749,12 @@ class AutoETS(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    warm_start : bool (default=False)
+        If True, `fit` starts the optimization of the parameters from the ones
+        of the previous fit instead of the initial heuristics.
+    reselect_every : int (default=1)
+        Number of fits between the selections of the model. The fits in between keep
+        the components of the last selected model and only estimate its parameters.
     """
 
     def __init__(
@@ -616,12 +764,16 @@ class AutoETS(_TS):
         damped: Optional[bool] = None,
         alias: str = "AutoETS",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        warm_start: bool = False,
+        reselect_every: int = 1,
     ):
         self.season_length = season_length
         self.model = model
         self.damped = damped
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.warm_start = warm_start
+        self.reselect_every = reselect_every
 
     def __repr__(self):
         return self.alias
@@ -648,10 +800,22 @@ class AutoETS(_TS):
         self :
             Exponential Smoothing fitted model.
         """
+        prev_model = self._reused_structure()
+        if prev_model is not None:
+            model = prev_model["components"][:3]
+            damped = prev_model["components"][3] != "N"
+        else:
+            model, damped = self.model, self.damped
+        init_model = getattr(self, "model_", None) if self.warm_start else None
         self.model_ = ets_f(
-            y, m=self.season_length, model=self.model, damped=self.damped
+            y,
+            m=self.season_length,
+            model=model,
+            damped=damped,
+            init_model=init_model,
         )
         self.model_["actual_residuals"] = y - self.model_["fitted"]
+        self._count_reused_fits(prev_model)
         self._store_cs(y=y, X=X)
         return self
 
@@ -821,7 +985,38 @@ class AutoETS(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 45
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted Exponential Smoothing model with new observations.
+
+        Advances the state of the fitted model over the new observations `y`
+        keeping its parameters fixed, so the next call to `predict` starts from
+        the last new observation.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x) for the new observations.
+
+        Returns
+        -------
+        self :
+            Exponential Smoothing updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        self.model_ = update_ets(self.model_, y=y)
+        self.model_["actual_residuals"] = np.append(
+            self.model_["actual_residuals"], y - self.model_["fitted"][-y.size :]
+        )
+        return self
+
+# %% ../nbs/src/core/models.ipynb 53
 class ETS(AutoETS):
     @classmethod
     def _warn(cls):
@@ -845,11 +1040,13 @@ class ETS(AutoETS):
         self.damped = damped
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.warm_start = False
+        self.reselect_every = 1
 
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 50
+# %% ../nbs/src/core/models.ipynb 58
 class AutoCES(_TS):
     """Complex Exponential Smoothing model.
 
@@ -880,6 +1077,12 @@ class AutoCES(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    warm_start : bool (default=False)
+        If True, `fit` starts the optimization of the parameters from the ones
+        of the previous fit instead of the initial heuristics.
+    reselect_every : int (default=1)
+        Number of fits between the selections of the model. The fits in between keep
+        the seasonality of the last selected model and only estimate its parameters.
     """
 
     def __init__(
@@ -888,11 +1091,15 @@ class AutoCES(_TS):
         model: str = "Z",
         alias: str = "CES",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        warm_start: bool = False,
+        reselect_every: int = 1,
     ):
         self.season_length = season_length
         self.model = model
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.warm_start = warm_start
+        self.reselect_every = reselect_every
 
     def __repr__(self):
         return self.alias
@@ -919,8 +1126,14 @@ class AutoCES(_TS):
         self :
             Complex Exponential Smoothing fitted model.
         """
-        self.model_ = auto_ces(y, m=self.season_length, model=self.model)
+        prev_model = self._reused_structure()
+        model = self.model if prev_model is None else prev_model["seasontype"]
+        init_model = getattr(self, "model_", None) if self.warm_start else None
+        self.model_ = auto_ces(
+            y, m=self.season_length, model=model, init_model=init_model
+        )
         self.model_["actual_residuals"] = y - self.model_["fitted"]
+        self._count_reused_fits(prev_model)
         self._store_cs(y=y, X=X)
         return self
 
@@ -1090,7 +1303,38 @@ class AutoCES(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 67
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted Complex Exponential Smoothing model with new observations.
+
+        Advances the state of the fitted model over the new observations `y`
+        keeping its parameters fixed, so the next call to `predict` starts from
+        the last new observation.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x) for the new observations.
+
+        Returns
+        -------
+        self :
+            Complex Exponential Smoothing updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        self.model_ = update_ces(self.model_, y=y)
+        self.model_["actual_residuals"] = np.append(
+            self.model_["actual_residuals"], y - self.model_["fitted"][-y.size :]
+        )
+        return self
+
+# %% ../nbs/src/core/models.ipynb 77
 class AutoTheta(_TS):
     """AutoTheta model.
 
@@ -1115,6 +1359,9 @@ class AutoTheta(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    warm_start : bool (default=False)
+        If True, `fit` starts the optimization of the parameters from the ones
+        of the previous fit instead of the initial heuristics.
     """
 
     def __init__(
@@ -1124,12 +1371,14 @@ class AutoTheta(_TS):
         model: Optional[str] = None,
         alias: str = "AutoTheta",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        warm_start: bool = False,
     ):
         self.season_length = season_length
         self.decomposition_type = decomposition_type
         self.model = model
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.warm_start = warm_start
 
     def __repr__(self):
         return self.alias
@@ -1156,11 +1405,13 @@ class AutoTheta(_TS):
         self :
             AutoTheta fitted model.
         """
+        init_model = getattr(self, "model_", None) if self.warm_start else None
         self.model_ = auto_theta(
             y=y,
             m=self.season_length,
             model=self.model,
             decomposition_type=self.decomposition_type,
+            init_model=init_model,
         )
         self.model_["fitted"] = y - self.model_["residuals"]
         self._store_cs(y, X)
@@ -1309,7 +1560,38 @@ class AutoTheta(_TS):
             res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 82
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted AutoTheta model with new observations.
+
+        Advances the state of the fitted model over the new observations `y`
+        keeping its parameters fixed, so the next call to `predict` starts from
+        the last new observation.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x) for the new observations.
+
+        Returns
+        -------
+        self :
+            AutoTheta updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        self.model_ = update_theta(self.model_, y=y)
+        self.model_["fitted"] = np.append(
+            self.model_["fitted"], y - self.model_["residuals"][-y.size :]
+        )
+        return self
+
+# %% ../nbs/src/core/models.ipynb 93
 class ARIMA(_TS):
     """ARIMA model.
 
@@ -1356,6 +1638,18 @@ class ARIMA(_TS):
         Information to compute conformal prediction intervals.
         By default, the model will compute the native prediction
         intervals.
+    optim_method : str (default='BFGS')
+        Method of `scipy.optimize.minimize` used to estimate the coefficients.
+        'BFGS-numba' runs a compiled BFGS instead, so that the fit doesn't leave numba.
+    steady_tol : float (default=0.0)
+        Change of the state covariance of the Kalman filter under which its gain is kept
+        for the rest of the series, which turns most of the likelihood evaluation into a
+        simple recursion. 0 always updates the covariance.
+    SSinit : str (default='Gardner1980')
+        Method used to compute the initial covariance of the state. 'doubling' solves its
+        Lyapunov equation with the doubling algorithm, which is much faster and uses much
+        less memory for long seasonal periods. It is also more accurate, so its fits will not
+        match the 'Gardner1980' ones exactly.
     """
 
     def __init__(
@@ -1372,6 +1666,9 @@ class ARIMA(_TS):
         fixed: Optional[dict] = None,
         alias: str = "ARIMA",
         prediction_intervals: Optional[ConformalIntervals] = None,
+        optim_method: str = "BFGS",
+        steady_tol: float = 0.0,
+        SSinit: str = "Gardner1980",
     ):
         self.order = order
         self.season_length = season_length
@@ -1385,6 +1682,9 @@ class ARIMA(_TS):
         self.fixed = fixed
         self.alias = alias
         self.prediction_intervals = prediction_intervals
+        self.optim_method = optim_method
+        self.steady_tol = steady_tol
+        self.SSinit = SSinit
 
     def __repr__(self):
         return self.alias
@@ -1423,6 +1723,9 @@ class ARIMA(_TS):
                 biasadj=self.biasadj,
                 method=self.method,
                 fixed=self.fixed,
+                optim_method=self.optim_method,
+                steady_tol=self.steady_tol,
+                SSinit=self.SSinit,
             )
         self._store_cs(y=y, X=X)
         return self
@@ -1533,6 +1836,9 @@ class ARIMA(_TS):
                 biasadj=self.biasadj,
                 method=self.method,
                 fixed=self.fixed,
+                optim_method=self.optim_method,
+                steady_tol=self.steady_tol,
+                SSinit=self.SSinit,
             )
         fcst = forecast_arima(mod, h, xreg=X_future, level=level)
         res = {"mean": fcst["mean"]}
@@ -1609,7 +1915,36 @@ class ARIMA(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 96
+    def update(
+        self,
+        y: np.ndarray,
+        X: Optional[np.ndarray] = None,
+    ):
+        """Update the fitted ARIMA model with new observations.
+
+        Advances the state of the fitted model over the new observations `y`
+        keeping its parameters fixed, so the next call to `predict` starts from
+        the last new observation.
+
+        Parameters
+        ----------
+        y : numpy.array
+            New observations of shape (t, ).
+        X : array-like
+            Optional exogenous of shape (t, n_x) for the new observations.
+
+        Returns
+        -------
+        self :
+            ARIMA updated model.
+        """
+        if not hasattr(self, "model_"):
+            raise Exception("You have to use the `fit` method first")
+        with np.errstate(invalid="ignore"):
+            self.model_ = update_arima(self.model_, y=y, xreg=X)
+        return self
+
+# %% ../nbs/src/core/models.ipynb 108
 class AutoRegressive(ARIMA):
     """Simple Autoregressive model.
 
@@ -1684,7 +2019,7 @@ class AutoRegressive(ARIMA):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 110
+# %% ../nbs/src/core/models.ipynb 122
 @njit(nogil=NOGIL, cache=CACHE)
 def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray]:
     """Perform simple exponential smoothing on a series.
@@ -1770,7 +2105,7 @@ def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
         sums[i] = array[start : start + chunk_size].sum()
     return sums
 
-# %% ../nbs/src/core/models.ipynb 111
+# %% ../nbs/src/core/models.ipynb 123
 @njit(nogil=NOGIL, cache=CACHE)
 def _ses(
     y: np.ndarray,  # time series
@@ -1785,7 +2120,7 @@ def _ses(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 112
+# %% ../nbs/src/core/models.ipynb 124
 class SimpleExponentialSmoothing(_TS):
     """SimpleExponentialSmoothing model.
 
@@ -1947,7 +2282,7 @@ class SimpleExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to " "compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 123
+# %% ../nbs/src/core/models.ipynb 135
 def _ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1960,7 +2295,7 @@ def _ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 124
+# %% ../nbs/src/core/models.ipynb 136
 class SimpleExponentialSmoothingOptimized(_TS):
     """SimpleExponentialSmoothing model.
 
@@ -2117,7 +2452,7 @@ class SimpleExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 135
+# %% ../nbs/src/core/models.ipynb 147
 @njit(nogil=NOGIL, cache=CACHE)
 def _seasonal_exponential_smoothing(
     y: np.ndarray,  # time series
@@ -2142,7 +2477,7 @@ def _seasonal_exponential_smoothing(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 136
+# %% ../nbs/src/core/models.ipynb 148
 class SeasonalExponentialSmoothing(_TS):
     """SeasonalExponentialSmoothing model.
 
@@ -2321,7 +2656,7 @@ class SeasonalExponentialSmoothing(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 150
+# %% ../nbs/src/core/models.ipynb 162
 def _seasonal_ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -2344,7 +2679,7 @@ def _seasonal_ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 151
+# %% ../nbs/src/core/models.ipynb 163
 class SeasonalExponentialSmoothingOptimized(_TS):
     def __init__(
         self,
@@ -2519,7 +2854,7 @@ class SeasonalExponentialSmoothingOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 163
+# %% ../nbs/src/core/models.ipynb 175
 class Holt(AutoETS):
     """Holt's method.
 
@@ -2563,7 +2898,7 @@ class Holt(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 176
+# %% ../nbs/src/core/models.ipynb 188
 class HoltWinters(AutoETS):
     """Holt-Winters' method.
 
@@ -2605,7 +2940,7 @@ class HoltWinters(AutoETS):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 190
+# %% ../nbs/src/core/models.ipynb 202
 @njit(nogil=NOGIL, cache=CACHE)
 def _historic_average(
     y: np.ndarray,  # time series
@@ -2621,7 +2956,37 @@ def _historic_average(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 191
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _historic_average_batch(
+    y: np.ndarray,  # time series of all the series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, np.float32)
+    sigmah = np.empty(n_series * h)
+    se = np.empty(n_series)
+    fitted_vals = np.empty(y.size if fitted else 0, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        avg = np.float32(y[start:end].mean())
+        ssr = 0.0
+        for t in range(start, end):
+            res = y[t] - avg
+            if not np.isnan(res):
+                ssr += res * res
+        sigma = np.sqrt(ssr / (n - 1)) if n > 1 else np.nan
+        se[i] = sigma * np.sqrt(1 + (1 / n))
+        mean[i * h : (i + 1) * h] = avg
+        sigmah[i * h : (i + 1) * h] = se[i]
+        if fitted:
+            fitted_vals[start:end] = avg
+    return mean, sigmah, fitted_vals, se
+
+# %% ../nbs/src/core/models.ipynb 203
 class HistoricAverage(_TS):
     def __init__(
         self,
@@ -2799,7 +3164,56 @@ class HistoricAverage(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 203
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        out: np.ndarray,
+        fitted_out: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+    ):
+        """Predictions of all the series at once, written to `out` and `fitted_out`."""
+        mean, sigmah, fitted_vals, se = _historic_average_batch(
+            y=y,
+            indptr=indptr,
+            h=h,
+            fitted=fitted_out is not None,
+        )
+        return _write_batch_output(
+            out, fitted_out, indptr, mean, sigmah, fitted_vals, se, level
+        )
+
+# %% ../nbs/src/core/models.ipynb 217
+@njit(nogil=NOGIL, cache=CACHE)
+def _naive_batch(
+    y: np.ndarray,  # time series of all the series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, np.float32)
+    sigmah = np.empty(n_series * h)
+    sigma = np.empty(n_series)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        ssr = 0.0
+        for t in range(start + 1, end):
+            res = y[t] - np.float32(y[t - 1])
+            if not np.isnan(res):
+                ssr += res * res
+        if fitted:
+            fitted_vals[start + 1 : end] = y[start : end - 1]
+        sigma[i] = np.sqrt(ssr / (n - 1)) if n > 1 else np.nan
+        for j in range(h):
+            mean[i * h + j] = y[end - 1]
+            sigmah[i * h + j] = sigma[i] * np.sqrt(j + 1)
+    return mean, sigmah, fitted_vals, sigma
+
+# %% ../nbs/src/core/models.ipynb 218
 class Naive(_TS):
     def __init__(
         self,
@@ -2971,6 +3385,26 @@ class Naive(_TS):
                 res = _add_fitted_pi(res=res, se=sigma, level=level)
         return res
 
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        out: np.ndarray,
+        fitted_out: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+    ):
+        """Predictions of all the series at once, written to `out` and `fitted_out`."""
+        mean, sigmah, fitted_vals, sigma = _naive_batch(
+            y=y,
+            indptr=indptr,
+            h=h,
+            fitted=fitted_out is not None,
+        )
+        return _write_batch_output(
+            out, fitted_out, indptr, mean, sigmah, fitted_vals, sigma, level
+        )
+
     def forward(
         self,
         y: np.ndarray,
@@ -3007,7 +3441,7 @@ class Naive(_TS):
         )
         return res
 
-# %% ../nbs/src/core/models.ipynb 218
+# %% ../nbs/src/core/models.ipynb 235
 @njit(nogil=NOGIL, cache=CACHE)
 def _random_walk_with_drift(
     y: np.ndarray,  # time series
@@ -3027,7 +3461,41 @@ def _random_walk_with_drift(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/src/core/models.ipynb 219
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _random_walk_with_drift_batch(
+    y: np.ndarray,  # time series of all the series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+):
+    n_series = indptr.size - 1
+    mean = np.empty(n_series * h, np.float32)
+    sigmah = np.empty(n_series * h)
+    sigma = np.empty(n_series)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        slope = (y[end - 1] - y[start]) / (n - 1) if n > 1 else np.nan
+        ssr = 0.0
+        for t in range(start + 1, end):
+            fitted_t = np.float32(slope + y[t - 1])
+            res = y[t] - fitted_t
+            if not np.isnan(res):
+                ssr += res * res
+            if fitted:
+                fitted_vals[t] = fitted_t
+        sigma[i] = np.sqrt(ssr / (n - 1)) if n > 1 else np.nan
+        for j in range(h):
+            steps = j + 1
+            mean[i * h + j] = slope * steps + y[end - 1]
+            sigmah[i * h + j] = (
+                sigma[i] * np.sqrt(steps * (1 + steps / (n - 1))) if n > 1 else np.nan
+            )
+    return mean, sigmah, fitted_vals, sigma
+
+# %% ../nbs/src/core/models.ipynb 236
 class RandomWalkWithDrift(_TS):
     def __init__(
         self,
@@ -3204,7 +3672,64 @@ class RandomWalkWithDrift(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 233
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        out: np.ndarray,
+        fitted_out: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+    ):
+        """Predictions of all the series at once, written to `out` and `fitted_out`."""
+        mean, sigmah, fitted_vals, sigma = _random_walk_with_drift_batch(
+            y=y,
+            indptr=indptr,
+            h=h,
+            fitted=fitted_out is not None,
+        )
+        return _write_batch_output(
+            out, fitted_out, indptr, mean, sigmah, fitted_vals, sigma, level
+        )
+
+# %% ../nbs/src/core/models.ipynb 252
+@njit(nogil=NOGIL, cache=CACHE)
+def _seasonal_naive_batch(
+    y: np.ndarray,  # time series of all the series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+    season_length: int,  # season length
+):
+    n_series = indptr.size - 1
+    mean = np.full(n_series * h, np.nan, np.float32)
+    sigmah = np.full(n_series * h, np.nan)
+    sigma = np.full(n_series, np.nan)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, np.float32)
+    k = np.floor((h - 1) / season_length)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        n = end - start
+        if n < season_length:
+            continue
+        # each season starts at the first observation of its last complete cycle
+        first = start + season_length + n % season_length
+        ssr = 0.0
+        for t in range(first, end):
+            fitted_t = np.float32(y[t - season_length])
+            res = y[t] - fitted_t
+            if not np.isnan(res):
+                ssr += res * res
+            if fitted:
+                fitted_vals[t] = fitted_t
+        if n > season_length:
+            sigma[i] = np.sqrt(ssr / (n - season_length))
+        for j in range(h):
+            mean[i * h + j] = y[end - season_length + j % season_length]
+            sigmah[i * h + j] = sigma[i] * np.sqrt(k + 1)
+    return mean, sigmah, fitted_vals, sigma
+
+# %% ../nbs/src/core/models.ipynb 253
 class SeasonalNaive(_TS):
     def __init__(
         self,
@@ -3393,7 +3918,28 @@ class SeasonalNaive(_TS):
 
         return res
 
-# %% ../nbs/src/core/models.ipynb 247
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        out: np.ndarray,
+        fitted_out: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+    ):
+        """Predictions of all the series at once, written to `out` and `fitted_out`."""
+        mean, sigmah, fitted_vals, sigma = _seasonal_naive_batch(
+            y=y,
+            indptr=indptr,
+            h=h,
+            fitted=fitted_out is not None,
+            season_length=self.season_length,
+        )
+        return _write_batch_output(
+            out, fitted_out, indptr, mean, sigmah, fitted_vals, sigma, level
+        )
+
+# %% ../nbs/src/core/models.ipynb 269
 @njit(nogil=NOGIL, cache=CACHE)
 def _window_average(
     y: np.ndarray,  # time series
@@ -3409,7 +3955,24 @@ def _window_average(
     mean = _repeat_val(val=wavg, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 248
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _window_average_batch(
+    y: np.ndarray,  # time series of all the series
+    indptr: np.ndarray,  # series boundaries
+    h: int,  # forecasting horizon
+    window_size: int,  # window size
+):
+    n_series = indptr.size - 1
+    mean = np.full(n_series * h, np.nan, np.float32)
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start < window_size:
+            continue
+        mean[i * h : (i + 1) * h] = y[end - window_size : end].mean()
+    return mean
+
+# %% ../nbs/src/core/models.ipynb 270
 class WindowAverage(_TS):
     def __init__(
         self,
@@ -3567,7 +4130,26 @@ class WindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to " "compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 259
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        out: np.ndarray,
+        fitted_out: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+    ):
+        """Predictions of all the series at once, written to `out` and `fitted_out`."""
+        if fitted_out is not None:
+            raise NotImplementedError("return fitted")
+        if level is not None:
+            raise Exception("You must pass `prediction_intervals` to compute them.")
+        out[:, 0] = _window_average_batch(
+            y=y, indptr=indptr, h=h, window_size=self.window_size
+        )
+        return ["mean"], []
+
+# %% ../nbs/src/core/models.ipynb 283
 @njit(nogil=NOGIL, cache=CACHE)
 def _seasonal_window_average(
     y: np.ndarray,
@@ -3588,7 +4170,30 @@ def _seasonal_window_average(
     out = _repeat_val_seas(season_vals=season_avgs, h=h, season_length=season_length)
     return {"mean": out}
 
-# %% ../nbs/src/core/models.ipynb 260
+
+@njit(nogil=NOGIL, cache=CACHE)
+def _seasonal_window_average_batch(
+    y: np.ndarray,
+    indptr: np.ndarray,
+    h: int,
+    season_length: int,
+    window_size: int,
+):
+    n_series = indptr.size - 1
+    mean = np.full(n_series * h, np.nan, np.float32)
+    min_samples = season_length * window_size
+    for i in range(n_series):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start < min_samples:
+            continue
+        season_avgs = np.zeros(season_length, np.float32)
+        for j, value in enumerate(y[end - min_samples : end]):
+            season_avgs[j % season_length] += value / window_size
+        for j in range(h):
+            mean[i * h + j] = season_avgs[j % season_length]
+    return mean
+
+# %% ../nbs/src/core/models.ipynb 284
 class SeasonalWindowAverage(_TS):
     def __init__(
         self,
@@ -3762,7 +4367,30 @@ class SeasonalWindowAverage(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 272
+    def forecast_batch(
+        self,
+        y: np.ndarray,
+        indptr: np.ndarray,
+        h: int,
+        out: np.ndarray,
+        fitted_out: Optional[np.ndarray] = None,
+        level: Optional[List[int]] = None,
+    ):
+        """Predictions of all the series at once, written to `out` and `fitted_out`."""
+        if fitted_out is not None:
+            raise NotImplementedError("return fitted")
+        if level is not None:
+            raise Exception("You must pass `prediction_intervals` to compute them.")
+        out[:, 0] = _seasonal_window_average_batch(
+            y=y,
+            indptr=indptr,
+            h=h,
+            season_length=self.season_length,
+            window_size=self.window_size,
+        )
+        return ["mean"], []
+
+# %% ../nbs/src/core/models.ipynb 298
 def _adida(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -3783,7 +4411,7 @@ def _adida(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 273
+# %% ../nbs/src/core/models.ipynb 299
 class ADIDA(_TS):
     def __init__(
         self,
@@ -3945,7 +4573,7 @@ class ADIDA(_TS):
             )
         return res
 
-# %% ../nbs/src/core/models.ipynb 285
+# %% ../nbs/src/core/models.ipynb 311
 @njit(nogil=NOGIL, cache=CACHE)
 def _croston_classic(
     y: np.ndarray,  # time series
@@ -3967,7 +4595,7 @@ def _croston_classic(
     mean = _repeat_val(val=mean, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 286
+# %% ../nbs/src/core/models.ipynb 312
 class CrostonClassic(_TS):
     def __init__(
         self,
@@ -4124,7 +4752,7 @@ class CrostonClassic(_TS):
             )
         return res
 
-# %% ../nbs/src/core/models.ipynb 297
+# %% ../nbs/src/core/models.ipynb 323
 def _croston_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4145,7 +4773,7 @@ def _croston_optimized(
     mean = _repeat_val(val=mean, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 298
+# %% ../nbs/src/core/models.ipynb 324
 class CrostonOptimized(_TS):
     def __init__(
         self,
@@ -4298,7 +4926,7 @@ class CrostonOptimized(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 309
+# %% ../nbs/src/core/models.ipynb 335
 @njit(nogil=NOGIL, cache=CACHE)
 def _croston_sba(
     y: np.ndarray,  # time series
@@ -4311,7 +4939,7 @@ def _croston_sba(
     mean["mean"] *= 0.95
     return mean
 
-# %% ../nbs/src/core/models.ipynb 310
+# %% ../nbs/src/core/models.ipynb 336
 class CrostonSBA(_TS):
     def __init__(
         self,
@@ -4470,7 +5098,7 @@ class CrostonSBA(_TS):
             )
         return res
 
-# %% ../nbs/src/core/models.ipynb 321
+# %% ../nbs/src/core/models.ipynb 347
 def _imapa(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -4494,7 +5122,7 @@ def _imapa(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 322
+# %% ../nbs/src/core/models.ipynb 348
 class IMAPA(_TS):
     def __init__(
         self,
@@ -4650,7 +5278,7 @@ class IMAPA(_TS):
             )
         return res
 
-# %% ../nbs/src/core/models.ipynb 333
+# %% ../nbs/src/core/models.ipynb 359
 @njit(nogil=NOGIL, cache=CACHE)
 def _tsb(
     y: np.ndarray,  # time series
@@ -4671,7 +5299,7 @@ def _tsb(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/src/core/models.ipynb 334
+# %% ../nbs/src/core/models.ipynb 360
 class TSB(_TS):
     def __init__(
         self,
@@ -4838,7 +5466,7 @@ class TSB(_TS):
             raise Exception("You must pass `prediction_intervals` to compute them.")
         return res
 
-# %% ../nbs/src/core/models.ipynb 346
+# %% ../nbs/src/core/models.ipynb 372
 def _predict_mstl_seas(mstl_ob, h, season_length):
     seasoncolumns = mstl_ob.filter(regex="seasonal*").columns
     nseasons = len(seasoncolumns)
@@ -4855,7 +5483,7 @@ def _predict_mstl_seas(mstl_ob, h, season_length):
     lastseas = seascomp.sum(axis=1)
     return lastseas
 
-# %% ../nbs/src/core/models.ipynb 347
+# %% ../nbs/src/core/models.ipynb 373
 class MSTL(_TS):
     """MSTL model.
 
@@ -5130,7 +5758,7 @@ class MSTL(_TS):
         }
         return res
 
-# %% ../nbs/src/core/models.ipynb 363
+# %% ../nbs/src/core/models.ipynb 389
 class Theta(AutoTheta):
     """Standard Theta Method.
 
@@ -5166,7 +5794,7 @@ class Theta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 376
+# %% ../nbs/src/core/models.ipynb 402
 class OptimizedTheta(AutoTheta):
     """Optimized Theta Method.
 
@@ -5202,7 +5830,7 @@ class OptimizedTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 389
+# %% ../nbs/src/core/models.ipynb 415
 class DynamicTheta(AutoTheta):
     """Dynamic Standard Theta Method.
 
@@ -5238,7 +5866,7 @@ class DynamicTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 402
+# %% ../nbs/src/core/models.ipynb 428
 class DynamicOptimizedTheta(AutoTheta):
     """Dynamic Optimized Theta Method.
 
@@ -5274,7 +5902,7 @@ class DynamicOptimizedTheta(AutoTheta):
             prediction_intervals=prediction_intervals,
         )
 
-# %% ../nbs/src/core/models.ipynb 416
+# %% ../nbs/src/core/models.ipynb 442
 class GARCH(_TS):
     """Generalized Autoregressive Conditional Heteroskedasticity (GARCH) model.
 
@@ -5468,7 +6096,7 @@ class GARCH(_TS):
                 res = _add_fitted_pi(res=res, se=se, level=level)
         return res
 
-# %% ../nbs/src/core/models.ipynb 429
+# %% ../nbs/src/core/models.ipynb 455
 class ARCH(GARCH):
     """Autoregressive Conditional Heteroskedasticity (ARCH) model.
 
@@ -5514,7 +6142,7 @@ class ARCH(GARCH):
     def __repr__(self):
         return self.alias
 
-# %% ../nbs/src/core/models.ipynb 440
+# %% ../nbs/src/core/models.ipynb 466
 class ConstantModel(_TS):
     def __init__(self, constant: float, alias: str = "ConstantModel"):
         """Constant Model.
@@ -5699,7 +6327,7 @@ class ConstantModel(_TS):
         )
         return res
 
-# %% ../nbs/src/core/models.ipynb 453
+# %% ../nbs/src/core/models.ipynb 479
 class ZeroModel(ConstantModel):
     def __init__(self, alias: str = "ZeroModel"):
         """Returns Zero forecasts.
@@ -5713,7 +6341,7 @@ class ZeroModel(ConstantModel):
         """
         super().__init__(constant=0, alias=alias)
 
-# %% ../nbs/src/core/models.ipynb 466
+# %% ../nbs/src/core/models.ipynb 492
 class NaNModel(ConstantModel):
     def __init__(self, alias: str = "NaNModel"):
         """NaN Model.
@@ -5,7 +5,7 @@ __all__ = ['theta_target_fn', 'is_constant']
 
 # %% ../nbs/src/theta.ipynb 1
 import math
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 from numba import njit
@@ -473,6 +473,7 @@ def thetamodel(
     alpha: float,
     theta: float,
     nmse: int,
+    init_par: Optional[Dict] = None,
 ):
     # initial parameters
     par = initparamtheta(
@@ -486,6 +487,10 @@ def thetamodel(
         key.replace("optimize_", ""): val for key, val in par.items() if "optim" in key
     }
     par = {key: val for key, val in par.items() if "optim" not in key}
+    if init_par is not None:
+        # start the optimization from the parameters of a previous
+        # fit of the same model instead of the initial heuristics
+        par.update({key: init_par[key] for key, val in optimize_params.items() if val})
     # parameter optimization
     fred = optimize_theta_target_fn(
         init_par=par,
@@ -597,6 +602,7 @@ def auto_theta(
     theta=None,
     nmse=3,
     decomposition_type="multiplicative",
+    init_model=None,
 ):
     # converting params to floats
     # to improve numba compilation
@@ -660,6 +666,11 @@ def auto_theta(
 
     best_ic = np.inf
     for mtype in modeltype:
+        if init_model is not None and init_model["modeltype"] == mtype:
+            # warm start from the previous fit of the same model
+            init_par = init_model["par"]
+        else:
+            init_par = None
         fit = thetamodel(
             y=y,
             m=m,
@@ -668,6 +679,7 @@ def auto_theta(
             initial_smoothed=initial_smoothed,
             alpha=alpha,
             theta=theta,
+            init_par=init_par,
         )
         fit_ic = fit["mse"]
         if not np.isnan(fit_ic):
@@ -702,3 +714,56 @@ def forward_theta(fitted_model, y):
         alpha=alpha,
         theta=theta,
     )
+
+# %% ../nbs/src/theta.ipynb 43
+def update_theta(fitted_model, y):
+    """Advance the states of a fitted model over the new observations `y` keeping its parameters."""
+    n = fitted_model["n"]
+    m = fitted_model["m"]
+    decompose = fitted_model.get("decompose", False)
+    if decompose:
+        seas = _repeat_val_seas(
+            fitted_model["seas_forecast"]["mean"], h=len(y), season_length=m
+        )
+        if fitted_model["decomposition_type"] == "multiplicative":
+            y = y / seas
+        else:
+            y = y - seas
+    states = np.vstack(
+        [
+            fitted_model["states"],
+            np.zeros((len(y), fitted_model["states"].shape[1]), dtype=np.float32),
+        ]
+    )
+    modeltype = switch_theta(fitted_model["modeltype"])
+    alpha = fitted_model["par"]["alpha"]
+    theta = fitted_model["par"]["theta"]
+    for i in range(len(y)):
+        thetaupdate(
+            states=states,
+            i=n + i,
+            modeltype=modeltype,
+            alpha=alpha,
+            theta=theta,
+            y=y[i],
+            usemu=0,
+        )
+    e = y - states[n:, 4]
+    updated = {
+        **fitted_model,
+        "states": states,
+        "n": n + len(y),
+        "mean_y": (n * fitted_model["mean_y"] + y.sum()) / (n + len(y)),
+    }
+    if decompose:
+        if fitted_model["decomposition_type"] == "multiplicative":
+            e = e * seas
+        else:
+            e = e + seas
+        seas_forecast = fitted_model["seas_forecast"]
+        updated["seas_forecast"] = {
+            **seas_forecast,
+            "mean": np.roll(seas_forecast["mean"], -(len(y) % m)),
+        }
+    updated["residuals"] = np.append(fitted_model["residuals"], e)
+    return updated